@@ -17,10 +17,11 @@ class TelemetryService {
     skip: number = 0,
     limit: number = 100,
     serviceName?: string,
-    level?: string
+    level?: string,
+    cursor?: string
   ) {
     return await apiClient.get(this.endpoints.logs, {
-      params: { skip, limit, service_name: serviceName, level },
+      params: { skip, limit, service_name: serviceName, level, cursor },
     });
   }
 
@@ -28,7 +29,8 @@ class TelemetryService {
     skip: number = 0,
     limit: number = 100,
     serviceName?: string,
-    metricName?: string
+    metricName?: string,
+    cursor?: string
   ) {
     return await apiClient.get(this.endpoints.metrics, {
       params: {
@@ -36,6 +38,7 @@ class TelemetryService {
         limit,
         service_name: serviceName,
         metric_name: metricName,
+        cursor,
       },
     });
   }
@@ -45,7 +48,8 @@ class TelemetryService {
     limit: number = 100,
     serviceName?: string,
     traceId?: string,
-    status?: string
+    status?: string,
+    cursor?: string
   ) {
     return await apiClient.get(this.endpoints.traces, {
       params: {
@@ -54,6 +58,7 @@ class TelemetryService {
         service_name: serviceName,
         trace_id: traceId,
         status,
+        cursor,
       },
     });
   }
@@ -63,7 +68,8 @@ class TelemetryService {
     limit: number = 100,
     serviceName?: string,
     eventType?: string,
-    severity?: string
+    severity?: string,
+    cursor?: string
   ) {
     return await apiClient.get(this.endpoints.events, {
       params: {
@@ -72,6 +78,7 @@ class TelemetryService {
         service_name: serviceName,
         event_type: eventType,
         severity,
+        cursor,
       },
     });
   }
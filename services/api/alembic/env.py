@@ -31,6 +31,11 @@ from models.logs_model import LogModel  # noqa
 from models.events_model import EventModel  # noqa
 from models.metrics_model import MetricsModel  # noqa
 from models.traces_model import TracesModel  # noqa
+from models.latency_sketch_model import LatencySketchModel  # noqa
+from models.telemetry_service_model import TelemetryServiceModel  # noqa
+from models.service_snapshot_model import ServiceMetricSnapshotModel  # noqa
+from models.event_rollup_model import EventHourlyCountModel  # noqa
+from models.rca_model import RCAJobModel, RootCauseHypothesisModel, AIDecisionModel, ResolvedIncidentModel  # noqa
 
 # add your model's MetaData object here
 # for 'autogenerate' support
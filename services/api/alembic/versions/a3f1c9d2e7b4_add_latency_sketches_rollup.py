@@ -0,0 +1,40 @@
+"""add latency sketches rollup
+
+Revision ID: a3f1c9d2e7b4
+Revises: 64ccb0e1ade2
+Create Date: 2026-10-18 09:12:41.203518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3f1c9d2e7b4'
+down_revision = '64ccb0e1ade2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('latency_sketches',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('service_name', sa.String(), nullable=False),
+    sa.Column('operation', sa.String(), nullable=False),
+    sa.Column('minute', sa.DateTime(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('sketch', sa.Text(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('service_name', 'operation', 'minute', name='uq_latency_sketches_service_operation_minute')
+    )
+    op.create_index(op.f('ix_latency_sketches_id'), 'latency_sketches', ['id'], unique=False)
+    op.create_index('ix_latency_sketches_service_minute', 'latency_sketches', ['service_name', 'minute'], unique=False)
+    op.create_index('ix_latency_sketches_minute', 'latency_sketches', ['minute'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_latency_sketches_minute', table_name='latency_sketches')
+    op.drop_index('ix_latency_sketches_service_minute', table_name='latency_sketches')
+    op.drop_index(op.f('ix_latency_sketches_id'), table_name='latency_sketches')
+    op.drop_table('latency_sketches')
@@ -0,0 +1,62 @@
+"""add telemetry services registry
+
+Revision ID: b7e2d4a1c8f3
+Revises: a3f1c9d2e7b4
+Create Date: 2026-10-18 10:04:17.551862
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2d4a1c8f3'
+down_revision = 'a3f1c9d2e7b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('telemetry_services',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('service_name', sa.String(), nullable=False),
+    sa.Column('first_seen', sa.DateTime(), nullable=False),
+    sa.Column('last_seen', sa.DateTime(), nullable=False),
+    sa.Column('has_logs', sa.Boolean(), nullable=False),
+    sa.Column('has_metrics', sa.Boolean(), nullable=False),
+    sa.Column('has_traces', sa.Boolean(), nullable=False),
+    sa.Column('has_events', sa.Boolean(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_telemetry_services_id'), 'telemetry_services', ['id'], unique=False)
+    op.create_index(op.f('ix_telemetry_services_service_name'), 'telemetry_services', ['service_name'], unique=True)
+    op.create_index(op.f('ix_telemetry_services_last_seen'), 'telemetry_services', ['last_seen'], unique=False)
+
+    # Backfill the registry from existing telemetry
+    op.execute("""
+        INSERT INTO telemetry_services
+            (service_name, first_seen, last_seen, has_logs, has_metrics, has_traces, has_events, updated_at)
+        SELECT service_name, MIN(first_seen), MAX(last_seen),
+               BOOL_OR(signal = 'logs'), BOOL_OR(signal = 'metrics'),
+               BOOL_OR(signal = 'traces'), BOOL_OR(signal = 'events'), NOW()
+        FROM (
+            SELECT service_name, MIN(timestamp) AS first_seen, MAX(timestamp) AS last_seen, 'logs' AS signal
+            FROM logs GROUP BY service_name
+            UNION ALL
+            SELECT service_name, MIN(timestamp), MAX(timestamp), 'metrics' FROM metrics GROUP BY service_name
+            UNION ALL
+            SELECT service_name, MIN(timestamp), MAX(timestamp), 'traces' FROM traces GROUP BY service_name
+            UNION ALL
+            SELECT service_name, MIN(timestamp), MAX(timestamp), 'events' FROM events GROUP BY service_name
+        ) AS seen
+        WHERE service_name IS NOT NULL
+        GROUP BY service_name
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_telemetry_services_last_seen'), table_name='telemetry_services')
+    op.drop_index(op.f('ix_telemetry_services_service_name'), table_name='telemetry_services')
+    op.drop_index(op.f('ix_telemetry_services_id'), table_name='telemetry_services')
+    op.drop_table('telemetry_services')
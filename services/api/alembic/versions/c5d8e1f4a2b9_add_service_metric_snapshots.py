@@ -0,0 +1,44 @@
+"""add service metric snapshots
+
+Revision ID: c5d8e1f4a2b9
+Revises: b7e2d4a1c8f3
+Create Date: 2026-10-18 11:21:53.917304
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5d8e1f4a2b9'
+down_revision = 'b7e2d4a1c8f3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('service_metric_snapshots',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('service_name', sa.String(), nullable=False),
+    sa.Column('service_id', sa.Integer(), nullable=False),
+    sa.Column('window_hours', sa.Integer(), nullable=False),
+    sa.Column('computed_at', sa.DateTime(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('severity_score', sa.Integer(), nullable=False),
+    sa.Column('error_rate', sa.Float(), nullable=False),
+    sa.Column('error_count', sa.Integer(), nullable=False),
+    sa.Column('total_logs', sa.Integer(), nullable=False),
+    sa.Column('avg_latency', sa.Float(), nullable=False),
+    sa.Column('span_count', sa.Integer(), nullable=False),
+    sa.Column('event_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_service_metric_snapshots_id'), 'service_metric_snapshots', ['id'], unique=False)
+    op.create_index('ix_service_metric_snapshots_window_computed', 'service_metric_snapshots', ['window_hours', 'computed_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_service_metric_snapshots_window_computed', table_name='service_metric_snapshots')
+    op.drop_index(op.f('ix_service_metric_snapshots_id'), table_name='service_metric_snapshots')
+    op.drop_table('service_metric_snapshots')
@@ -0,0 +1,44 @@
+"""add event hourly counts rollup
+
+Revision ID: d2a6f3b8c1e5
+Revises: c5d8e1f4a2b9
+Create Date: 2026-10-18 12:37:08.664190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2a6f3b8c1e5'
+down_revision = 'c5d8e1f4a2b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('event_hourly_counts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('service_name', sa.String(), nullable=False),
+    sa.Column('hour', sa.DateTime(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('service_name', 'hour', name='uq_event_hourly_counts_service_hour')
+    )
+    op.create_index(op.f('ix_event_hourly_counts_id'), 'event_hourly_counts', ['id'], unique=False)
+    op.create_index('ix_event_hourly_counts_hour', 'event_hourly_counts', ['hour'], unique=False)
+
+    # Backfill the rollup from existing events
+    op.execute("""
+        INSERT INTO event_hourly_counts (service_name, hour, count, updated_at)
+        SELECT service_name, date_trunc('hour', timestamp), COUNT(*), NOW()
+        FROM events
+        GROUP BY service_name, date_trunc('hour', timestamp)
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_event_hourly_counts_hour', table_name='event_hourly_counts')
+    op.drop_index(op.f('ix_event_hourly_counts_id'), table_name='event_hourly_counts')
+    op.drop_table('event_hourly_counts')
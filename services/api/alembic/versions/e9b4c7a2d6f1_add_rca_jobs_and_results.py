@@ -0,0 +1,76 @@
+"""add rca jobs and results
+
+Revision ID: e9b4c7a2d6f1
+Revises: d2a6f3b8c1e5
+Create Date: 2026-10-18 14:02:41.305877
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e9b4c7a2d6f1'
+down_revision = 'd2a6f3b8c1e5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('rca_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('dedup_key', sa.String(), nullable=False),
+    sa.Column('service_name', sa.String(), nullable=True),
+    sa.Column('hours', sa.Integer(), nullable=False),
+    sa.Column('max_lag_minutes', sa.Integer(), nullable=True),
+    sa.Column('window_end', sa.DateTime(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('dedup_key')
+    )
+    op.create_index(op.f('ix_rca_jobs_id'), 'rca_jobs', ['id'], unique=False)
+    op.create_index('ix_rca_jobs_status_created', 'rca_jobs', ['status', 'created_at'], unique=False)
+    op.create_table('root_cause_hypotheses',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('service_name', sa.String(), nullable=True),
+    sa.Column('root_cause', sa.String(), nullable=True),
+    sa.Column('confidence', sa.Float(), nullable=False),
+    sa.Column('reasoning', sa.Text(), nullable=True),
+    sa.Column('correlation_score', sa.Float(), nullable=False),
+    sa.Column('model_version', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['job_id'], ['rca_jobs.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_root_cause_hypotheses_id'), 'root_cause_hypotheses', ['id'], unique=False)
+    op.create_index(op.f('ix_root_cause_hypotheses_job_id'), 'root_cause_hypotheses', ['job_id'], unique=False)
+    op.create_table('ai_decisions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('decision_type', sa.String(), nullable=False),
+    sa.Column('input_snapshot', sa.JSON(), nullable=False),
+    sa.Column('decision_output', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['job_id'], ['rca_jobs.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_ai_decisions_id'), 'ai_decisions', ['id'], unique=False)
+    op.create_index(op.f('ix_ai_decisions_job_id'), 'ai_decisions', ['job_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_ai_decisions_job_id'), table_name='ai_decisions')
+    op.drop_index(op.f('ix_ai_decisions_id'), table_name='ai_decisions')
+    op.drop_table('ai_decisions')
+    op.drop_index(op.f('ix_root_cause_hypotheses_job_id'), table_name='root_cause_hypotheses')
+    op.drop_index(op.f('ix_root_cause_hypotheses_id'), table_name='root_cause_hypotheses')
+    op.drop_table('root_cause_hypotheses')
+    op.drop_index('ix_rca_jobs_status_created', table_name='rca_jobs')
+    op.drop_index(op.f('ix_rca_jobs_id'), table_name='rca_jobs')
+    op.drop_table('rca_jobs')
@@ -0,0 +1,38 @@
+"""add resolved incidents
+
+Revision ID: f3c8a1d5b7e2
+Revises: e9b4c7a2d6f1
+Create Date: 2026-10-18 16:47:12.518204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3c8a1d5b7e2'
+down_revision = 'e9b4c7a2d6f1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('resolved_incidents',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('service_name', sa.String(), nullable=True),
+    sa.Column('root_cause', sa.String(), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('fingerprint', sa.JSON(), nullable=False),
+    sa.Column('window_end', sa.DateTime(), nullable=False),
+    sa.Column('resolved_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['job_id'], ['rca_jobs.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('job_id')
+    )
+    op.create_index(op.f('ix_resolved_incidents_id'), 'resolved_incidents', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_resolved_incidents_id'), table_name='resolved_incidents')
+    op.drop_table('resolved_incidents')
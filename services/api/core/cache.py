@@ -0,0 +1,155 @@
+"""
+In-process caching primitives
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed TTL"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SWRCache:
+    """
+    Thread-safe LRU cache with stale-while-revalidate and single-flight loads.
+
+    Entries are fresh for ttl seconds and then served stale for up to
+    stale_ttl more while one background refresh runs. Concurrent misses for
+    the same key wait on a single computation instead of each running it.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 5.0, stale_ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "coalesced": 0, "refresh_errors": 0}
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: Hashable, compute: Callable[[], Any], future: Future) -> None:
+        """Run compute for key and publish the outcome to everyone waiting on future"""
+        try:
+            value = compute()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            return
+        with self._lock:
+            self._store(key, value)
+            self._inflight.pop(key, None)
+        future.set_result(value)
+
+    def _refresh(self, key: Hashable, compute: Callable[[], Any], future: Future) -> None:
+        self._load(key, compute, future)
+        if future.exception() is not None:
+            with self._lock:
+                self._stats["refresh_errors"] += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, computing it at most once at a time.
+
+        Fresh entries are returned directly. Stale entries are returned while a
+        background thread recomputes them. On a miss the first caller computes
+        and concurrent callers for the same key wait for its result.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = time.monotonic() - entry[0]
+                if age <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return entry[1]
+                if age <= self.ttl + self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    self._stats["stale_hits"] += 1
+                    if key not in self._inflight:
+                        future: Future = Future()
+                        self._inflight[key] = future
+                        threading.Thread(
+                            target=self._refresh,
+                            args=(key, compute, future),
+                            name="swr-refresh",
+                            daemon=True,
+                        ).start()
+                    return entry[1]
+                del self._entries[key]
+
+            future = self._inflight.get(key)
+            if future is not None:
+                self._stats["coalesced"] += 1
+                leader = False
+            else:
+                future = Future()
+                self._inflight[key] = future
+                self._stats["misses"] += 1
+                leader = True
+
+        if leader:
+            self._load(key, compute, future)
+        return future.result()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters plus current size"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+            stats["inflight"] = len(self._inflight)
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"] + stats["coalesced"]
+        stats["hit_rate"] = (
+            (stats["hits"] + stats["stale_hits"] + stats["coalesced"]) / lookups if lookups else 0.0
+        )
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,101 @@
+"""
+Concurrent fan-out of independent sub-queries with a shared deadline
+"""
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from core.config import settings, get_logger
+
+logger = get_logger(__name__)
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.QUERY_FANOUT_WORKERS, thread_name_prefix="query-fanout"
+)
+
+# Default for timeout arguments; None means no deadline
+DEFAULT_TIMEOUT: Any = object()
+
+
+def fanout_timeout(hours: float = 1) -> float:
+    """
+    Deadline in seconds for sub-queries over a window of hours.
+
+    QUERY_FANOUT_TIMEOUT_SECONDS, scaled up linearly for windows longer
+    than QUERY_FANOUT_TIMEOUT_HOURS (e.g. a week-long window gets 7x).
+    """
+    return settings.QUERY_FANOUT_TIMEOUT_SECONDS * max(
+        1.0, hours / settings.QUERY_FANOUT_TIMEOUT_HOURS
+    )
+
+
+def run_concurrently(
+    calls: Dict[str, Callable[[], Any]], timeout: Optional[float] = DEFAULT_TIMEOUT
+) -> Dict[str, Any]:
+    """
+    Run independent calls on the shared worker pool and wait for all of them.
+
+    Raises TimeoutError if any call is still running after timeout seconds
+    (default QUERY_FANOUT_TIMEOUT_SECONDS; None waits indefinitely). Calls
+    that have not started are cancelled, but Python threads cannot be
+    interrupted, so calls already running keep going in the background
+    and hold their worker until they return. The first exception raised by
+    a call is re-raised here.
+
+    Returns: {name: result}
+    """
+    if timeout is DEFAULT_TIMEOUT:
+        timeout = fanout_timeout()
+
+    futures = {name: _executor.submit(call) for name, call in calls.items()}
+    _, pending = wait(futures.values(), timeout=timeout)
+    if pending:
+        for future in pending:
+            future.cancel()
+        slow = [name for name, future in futures.items() if future in pending]
+        logger.warning(f"Deadline of {timeout}s exceeded waiting for: {', '.join(slow)}")
+        raise TimeoutError(f"Deadline of {timeout}s exceeded")
+
+    return {name: future.result() for name, future in futures.items()}
+
+
+def fan_out(
+    db: Session,
+    calls: Dict[str, Callable[[Session], Any]],
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+) -> Dict[str, Any]:
+    """
+    Run independent database calls concurrently, each on its own session.
+
+    Every call gets a fresh session bound to the same engine as db, so each
+    runs on its own pooled connection. Pass a timeout scaled to the query
+    window with fanout_timeout, or None for background work with no
+    deadline. Running queries are not stopped when the deadline passes;
+    on Postgres the deadline is also set as the statement_timeout so they
+    are cancelled server-side, while other databases run them to
+    completion.
+
+    Returns: {name: result}
+    """
+    if timeout is DEFAULT_TIMEOUT:
+        timeout = fanout_timeout()
+    bind = db.get_bind()
+
+    def with_session(func: Callable[[Session], Any]) -> Callable[[], Any]:
+        def call() -> Any:
+            session = Session(bind=bind, autoflush=False)
+            try:
+                if timeout is not None and bind.dialect.name == "postgresql":
+                    session.execute(
+                        text("SELECT set_config('statement_timeout', :timeout, true)"),
+                        {"timeout": str(int(timeout * 1000))},
+                    )
+                return func(session)
+            finally:
+                session.close()
+
+        return call
+
+    return run_concurrently(
+        {name: with_session(func) for name, func in calls.items()}, timeout=timeout
+    )
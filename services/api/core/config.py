@@ -21,6 +21,97 @@ class Settings(BaseSettings):
     # API Settings
     API_PREFIX: str = "/api/v1"
         
+    # Telemetry Query Settings
+    TELEMETRY_COUNT_CACHE_TTL: int = 60  # seconds an exact list total is reused
+    TELEMETRY_COUNT_CACHE_SIZE: int = 1024
+    TELEMETRY_STREAM_CHUNK_SIZE: int = 10000  # rows fetched per round trip when streaming
+    SKETCH_RELATIVE_ACCURACY: float = 0.01
+    # Answer latency statistics from latency_sketches; enable once the rollup is backfilled
+    LATENCY_ROLLUP_ENABLED: bool = False
+    
+    # Health Snapshot Settings
+    HEALTH_SNAPSHOT_ENABLED: bool = True
+    HEALTH_SNAPSHOT_INTERVAL_SECONDS: int = 30
+    HEALTH_SNAPSHOT_MAX_AGE_SECONDS: int = 120  # older snapshots fall back to live queries and are pruned
+    HEALTH_SNAPSHOT_WINDOWS: list = [1, 6, 24]  # hours
+    
+    # Time Series Settings
+    TIMESCALEDB_ENABLED: bool = False  # bucket with time_bucket instead of date_trunc/date_bin
+    EVENT_ROLLUP_ENABLED: bool = True  # serve incident volume from event_hourly_counts
+    EVENT_ROLLUP_REFRESH_SECONDS: int = 60
+    EVENT_ROLLUP_REFRESH_HOURS: int = 2  # trailing hours recomputed on each refresh
+    
+    # Correlation Settings
+    CORRELATION_WINDOW_MINUTES: int = 5  # max distance between an error and a correlated signal
+    CORRELATION_SLOW_TRACE_MS: float = 2000
+    CORRELATION_SAMPLE_SIZE: int = 5  # matched events listed per correlation
+    CORRELATION_SAMPLE_TEMPLATES: int = 50  # distinct message templates per signal kept for AI analysis
+    CORRELATION_MAX_LAG_MINUTES: int = 10
+    CORRELATION_MIN_COEFFICIENT: float = 0.3
+    CORRELATION_TOP_PAIRS: int = 20
+    CORRELATION_MAX_BUCKETS: int = 240  # longer windows are bucketed more coarsely than per-minute
+    
+    # Query Fan-out Settings
+    QUERY_FANOUT_WORKERS: int = 8  # keep below the connection pool size
+    QUERY_FANOUT_TIMEOUT_SECONDS: float = 10  # per-request deadline for dashboard sub-queries
+    QUERY_FANOUT_TIMEOUT_HOURS: float = 24  # windows longer than this get a proportionally longer deadline
+    
+    # Dashboard Cache Settings
+    DASHBOARD_CACHE_TTL_SECONDS: float = 5
+    DASHBOARD_CACHE_STALE_SECONDS: float = 30  # served while a background refresh runs
+    DASHBOARD_CACHE_SIZE: int = 256
+    DASHBOARD_STREAM_INTERVAL_SECONDS: float = 5  # how often each streamed view is recomputed
+    DASHBOARD_STREAM_HEARTBEAT_SECONDS: float = 15
+    DASHBOARD_STREAM_QUEUE_SIZE: int = 16  # pending events before a slow subscriber is resynced
+    
+    # LLM Client Settings
+    LLM_BACKEND: str = "groq"  # groq or replay
+    LLM_BASE_URL: Optional[str] = None  # override the provider endpoint, e.g. a local stub server
+    LLM_TIMEOUT_SECONDS: float = 15  # per-call deadline including queueing
+    LLM_MAX_CONCURRENCY: int = 4
+    LLM_MAX_RETRIES: int = 1
+    LLM_SUMMARY_TOKEN_BUDGET: int = 600  # telemetry summary size in prompts
+    LLM_RECORD_PATH: Optional[str] = None  # append every prompt/response to this JSONL file
+    LLM_REPLAY_PATH: Optional[str] = None  # recordings served by the replay backend
+    LLM_REPLAY_LATENCY_MS: float = 0
+    LLM_REPLAY_JITTER_MS: float = 0
+    LLM_REPLAY_ERROR_RATE: float = 0
+    LLM_BREAKER_FAILURE_THRESHOLD: int = 5  # consecutive failures before failing fast
+    LLM_BREAKER_RESET_SECONDS: float = 30
+    
+    # Local Root Cause Classifier Settings
+    LOCAL_RCA_CONFIDENCE_THRESHOLD: float = 0.6  # at or above this the LLM is not called; above 1 always calls it
+    
+    # LLM Cache Settings
+    LLM_CACHE_TTL_SECONDS: int = 3600
+    LLM_CACHE_SIZE: int = 512
+    LLM_CACHE_PATH: Optional[str] = None  # SQLite file for a cache tier that survives restarts
+    
+    # RCA Job Settings
+    RCA_JOBS_ENABLED: bool = True
+    RCA_JOB_WORKERS: int = 2
+    RCA_JOB_POLL_SECONDS: float = 2  # idle workers re-check the queue this often
+    RCA_JOB_DEDUP_SECONDS: int = 60  # submissions whose window ends in the same slot share a job
+    RCA_JOB_MAX_ATTEMPTS: int = 3
+    RCA_JOB_STALE_SECONDS: float = 300  # running jobs not heard from for this long are requeued
+    RCA_JOB_HEARTBEAT_SECONDS: float = 60  # running jobs refresh started_at this often; keep below STALE
+    
+    # Similar Incident Settings
+    SIMILAR_INCIDENTS_ENABLED: bool = True
+    SIMILAR_INCIDENTS_TOP_K: int = 5
+    SIMILAR_INCIDENTS_MIN_SIMILARITY: float = 0.3  # cosine similarity below which matches are dropped
+    INCIDENT_EMBEDDING_DIM: int = 512  # hashed feature dimensions; changing it rebuilds the index
+    INCIDENT_INDEX_PATH: Optional[str] = None  # .npz file the index is saved to and reloaded from
+    INCIDENT_INDEX_NPROBE: int = 4  # inverted lists scanned per query once the index is clustered
+    
+    # Ingest Settings
+    INGEST_BATCH_ROWS: int = 5000  # rows per COPY / executemany round trip
+    INGEST_READ_BYTES: int = 1048576  # spooled request body bytes parsed at a time
+    INGEST_SPOOL_MEMORY_BYTES: int = 8388608  # request body kept in memory before spilling to a temp file
+    INGEST_MAX_BODY_BYTES: int = 268435456  # larger request bodies are rejected while spooling
+    INGEST_MAX_LINE_BYTES: int = 1048576
+    INGEST_MAX_ERRORS: int = 20  # rejected lines described in the response
+        
     # Server Settings
     HOST: str = "127.0.0.1"
     PORT: int = 8000
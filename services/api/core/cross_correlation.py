@@ -0,0 +1,93 @@
+"""
+Vectorized lagged cross-correlation over aligned time series
+"""
+from typing import List, Sequence, Tuple
+import numpy as np
+
+
+def standardize(series: np.ndarray) -> np.ndarray:
+    """Z-score each row of a (signals, buckets) matrix; constant rows become zeros"""
+    std = series.std(axis=1, keepdims=True)
+    centered = series - series.mean(axis=1, keepdims=True)
+    return np.divide(centered, std, out=np.zeros_like(centered), where=std > 0)
+
+
+def _clamp_lag(max_lag: int, buckets: int) -> int:
+    return max(0, min(max_lag, buckets // 2))
+
+
+def max_lagged_correlation(series: np.ndarray, max_lag: int) -> np.ndarray:
+    """
+    Best Pearson correlation for every ordered pair of rows over lags 0..max_lag.
+
+    best[i, j] is the highest correlation of row i at t with row j at t + lag,
+    so best[i, j] covers i leading j and best[j, i] covers j leading i. Each lag
+    is one matrix product over the overlapping segments of all rows. Rows that
+    never vary are NaN throughout.
+    """
+    series = np.asarray(series, dtype=np.float32)
+    signals, buckets = series.shape
+    varying = np.flatnonzero(series.std(axis=1) > 0)
+    rows = series[varying]
+
+    best = np.full((len(varying), len(varying)), -np.inf, dtype=np.float32)
+    for lag in range(_clamp_lag(max_lag, buckets) + 1):
+        overlap = buckets - lag
+        coefficients = standardize(rows[:, :overlap]) @ standardize(rows[:, lag:]).T
+        coefficients /= overlap
+        np.maximum(best, coefficients, out=best)
+
+    full = np.full((signals, signals), np.nan, dtype=np.float32)
+    full[np.ix_(varying, varying)] = best
+    return full
+
+
+def rank_pairs(
+    best: np.ndarray,
+    min_coefficient: float = 0.0,
+    limit: int = 20,
+) -> List[Tuple[int, int, float]]:
+    """
+    Collapse ordered-pair results to one entry per unordered pair, oriented so
+    the leading row comes first, and keep the strongest.
+
+    Returns [(source_row, target_row, coefficient)] best first.
+    """
+    scores = np.nan_to_num(best, nan=-np.inf)
+    reverse = scores.T > scores
+    strongest = np.where(reverse, scores.T, scores)
+    strongest[np.tril_indices(len(strongest))] = -np.inf
+
+    flat = strongest.ravel()
+    candidates = np.flatnonzero(flat >= min_coefficient)
+    if len(candidates) > limit:
+        candidates = candidates[np.argpartition(-flat[candidates], limit)[:limit]]
+    candidates = candidates[np.argsort(-flat[candidates], kind="stable")]
+
+    pairs = []
+    for position in candidates:
+        i, j = divmod(int(position), len(strongest))
+        if reverse[i, j]:
+            i, j = j, i
+        pairs.append((i, j, float(flat[position])))
+    return pairs
+
+
+def best_lags(
+    series: np.ndarray, pairs: Sequence[Tuple[int, int]], max_lag: int
+) -> List[int]:
+    """Lag at which each (leading, trailing) row pair correlates most strongly"""
+    if not pairs:
+        return []
+    series = np.asarray(series, dtype=np.float64)
+    buckets = series.shape[1]
+    sources = np.array([i for i, _ in pairs])
+    targets = np.array([j for _, j in pairs])
+
+    per_lag = []
+    for lag in range(_clamp_lag(max_lag, buckets) + 1):
+        overlap = buckets - lag
+        leading = standardize(series[sources, :overlap])
+        trailing = standardize(series[targets, lag:])
+        per_lag.append((leading * trailing).sum(axis=1) / overlap)
+    return [int(lag) for lag in np.argmax(np.vstack(per_lag), axis=0)]
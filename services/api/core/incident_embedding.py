@@ -0,0 +1,118 @@
+"""
+Telemetry fingerprints of an incident and their hashed vector embeddings
+"""
+import hashlib
+import math
+import re
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from core.telemetry_summary import message_template
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_WORD = re.compile(r"[a-z][a-z0-9_]{2,}")
+
+# Relative weight of each token family, so a flood of log words cannot drown out a deployment
+_FAMILY_WEIGHTS = {
+    "log": 1.0,
+    "event": 1.0,
+    "trace": 0.7,
+    "signal": 0.7,
+    "service": 0.5,
+}
+
+_SEVERITY_WEIGHTS = {"critical": 2.0, "high": 1.5}
+
+
+def _add(tokens: Dict[str, Dict[str, float]], family: str, token: str, weight: float) -> None:
+    bucket = tokens.setdefault(family, {})
+    bucket[f"{family}:{token}"] = bucket.get(f"{family}:{token}", 0.0) + weight
+
+
+def incident_fingerprint(
+    error_logs: List[Dict[str, Any]],
+    events: List[Dict[str, Any]],
+    traces: List[Dict[str, Any]],
+    signal_correlations: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, float]:
+    """
+    Weighted tokens describing what an incident looked like.
+
+    Tokens are words of error message templates, event types, slow
+    operations, correlated signal pairs and affected services, with
+    service-qualified variants so incidents on the same service rank
+    higher. Counts are dampened with log1p and every family is scaled to
+    its _FAMILY_WEIGHTS norm. Items may already be template-grouped with a
+    "count".
+
+    Returns {token: weight}, JSON-serializable.
+    """
+    tokens: Dict[str, Dict[str, float]] = {}
+
+    for log in error_logs:
+        weight = 1 + math.log1p(log.get("count", 1) - 1)
+        service = log.get("service_name")
+        if service:
+            _add(tokens, "service", service, weight)
+        for word in set(_WORD.findall(message_template(log.get("message")).lower())):
+            _add(tokens, "log", word, weight)
+            if service:
+                _add(tokens, "log", f"{word}@{service}", 0.5 * weight)
+
+    for event in events:
+        weight = _SEVERITY_WEIGHTS.get(str(event.get("severity", "")).lower(), 1.0)
+        weight *= 1 + math.log1p(event.get("count", 1) - 1)
+        event_type = str(event.get("type", "")).lower()
+        _add(tokens, "event", event_type, weight)
+        if event.get("service_name"):
+            _add(tokens, "event", f"{event_type}@{event['service_name']}", weight)
+
+    for trace in traces:
+        weight = 1 + math.log1p(trace.get("count", 1) - 1)
+        operation = str(trace.get("operation", "")).lower()
+        _add(tokens, "trace", operation, weight)
+        if trace.get("service_name"):
+            _add(tokens, "trace", f"{operation}@{trace['service_name']}", weight)
+
+    for correlation in signal_correlations or []:
+        coefficient = float(correlation.get("coefficient", 0.0))
+        if coefficient <= 0:
+            continue
+        _add(
+            tokens,
+            "signal",
+            f"{correlation.get('source_signal')}~{correlation.get('target_signal')}",
+            coefficient,
+        )
+
+    fingerprint: Dict[str, float] = {}
+    for family, bucket in tokens.items():
+        norm = math.sqrt(sum(weight * weight for weight in bucket.values()))
+        if not norm:
+            continue
+        scale = _FAMILY_WEIGHTS[family] / norm
+        for token, weight in bucket.items():
+            fingerprint[token] = round(weight * scale, 4)
+    return fingerprint
+
+
+def _slot(token: str, dim: int):
+    digest = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+    return digest % dim, 1.0 if digest >> 63 else -1.0
+
+
+def embed(fingerprint: Dict[str, float], dim: int) -> "np.ndarray":
+    """
+    Unit-length signed feature-hashing embedding of a fingerprint.
+
+    Hashing is stable across processes, so stored fingerprints always
+    re-embed to the same vector. An empty fingerprint embeds to zeros.
+    """
+    import numpy as np
+
+    vector = np.zeros(dim, dtype=np.float32)
+    for token, weight in fingerprint.items():
+        index, sign = _slot(token, dim)
+        vector[index] += sign * weight
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else vector
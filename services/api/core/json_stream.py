@@ -0,0 +1,76 @@
+"""
+Tolerant extraction of a JSON object from streamed or chatty LLM output
+"""
+import json
+from typing import Any, Dict, Iterable, Optional
+
+
+class JSONObjectStream:
+    """
+    Incrementally locates the first complete top-level JSON object in a stream.
+
+    Text before the opening brace (prose, markdown fences) is skipped, braces
+    inside strings are ignored, and the object is returned as soon as it
+    closes so the caller can stop reading the rest of the response.
+    """
+
+    def __init__(self):
+        self._buffer: list = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._started = False
+        self.complete: Optional[str] = None
+
+    def feed(self, chunk: str) -> Optional[str]:
+        """Consume a chunk; returns the object text once it is complete"""
+        if self.complete is not None:
+            return self.complete
+
+        begin = 0
+        for position, char in enumerate(chunk):
+            if not self._started:
+                if char == "{":
+                    self._started = True
+                    begin = position
+                else:
+                    continue
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._buffer.append(chunk[begin:position + 1])
+                    self.complete = "".join(self._buffer)
+                    return self.complete
+
+        if self._started:
+            self._buffer.append(chunk[begin:])
+        return None
+
+
+def parse_json_object(chunks: Iterable[str]) -> Dict[str, Any]:
+    """
+    Parse the first JSON object from text or an iterable of text chunks.
+
+    Raises json.JSONDecodeError if no complete, valid object is found.
+    """
+    if isinstance(chunks, str):
+        chunks = [chunks]
+    stream = JSONObjectStream()
+    for chunk in chunks:
+        if stream.feed(chunk) is not None:
+            break
+    if stream.complete is None:
+        raise json.JSONDecodeError("No complete JSON object in response", "", 0)
+    return json.loads(stream.complete)
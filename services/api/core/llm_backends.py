@@ -0,0 +1,255 @@
+"""
+Pluggable LLM backends: Groq via LangChain, recorded-response replay, and recording
+"""
+import abc
+import asyncio
+import hashlib
+import json
+import os
+import random
+import threading
+from typing import AsyncIterator, Dict, List, Optional
+from core.config import settings, get_logger
+from core.llm_cache import normalize_prompt
+
+logger = get_logger(__name__)
+
+# Served by the replay backend and stub server when no recording matches
+DEFAULT_REPLAY_RESPONSE = json.dumps(
+    {
+        "root_cause": "code_bug",
+        "confidence": 0.5,
+        "reasoning": "Replayed default response",
+        "correlation_score": 0.5,
+    }
+)
+
+
+class LLMBackendError(RuntimeError):
+    """Raised by a backend when the provider call fails"""
+
+
+class LLMBackend(abc.ABC):
+    """
+    Interface every LLM provider implements.
+
+    ainvoke returns the full completion text; astream yields it in chunks
+    and defaults to a single chunk for providers without streaming.
+    """
+
+    name = "base"
+
+    @abc.abstractmethod
+    async def ainvoke(self, prompt: str) -> str:
+        ...
+
+    async def astream(self, prompt: str) -> AsyncIterator[str]:
+        yield await self.ainvoke(prompt)
+
+
+class GroqBackend(LLMBackend):
+    """Groq chat completions through LangChain; base_url may point at a stub server"""
+
+    name = "groq"
+
+    def __init__(
+        self,
+        model: str,
+        api_key: str,
+        base_url: Optional[str] = None,
+        max_retries: int = 1,
+        temperature: float = 0.3,
+    ):
+        # Imported here so LangChain only loads when this backend is selected
+        try:
+            from langchain_groq import ChatGroq
+            from langchain_core.messages import HumanMessage
+        except ImportError:
+            raise LLMBackendError("langchain-groq is not installed")
+        self._message = HumanMessage
+        self.llm = ChatGroq(
+            model=model,
+            temperature=temperature,
+            groq_api_key=api_key,
+            base_url=base_url,
+            max_retries=max_retries,
+        )
+
+    async def ainvoke(self, prompt: str) -> str:
+        message = await self.llm.ainvoke([self._message(content=prompt)])
+        return message.content
+
+    async def astream(self, prompt: str) -> AsyncIterator[str]:
+        async for chunk in self.llm.astream([self._message(content=prompt)]):
+            yield chunk.content
+
+
+def prompt_key(prompt: str) -> str:
+    """Content address of a prompt in a recording file"""
+    return hashlib.sha256(normalize_prompt(prompt).encode("utf-8")).hexdigest()
+
+
+class ReplayBook:
+    """
+    Recorded responses loaded from a JSONL file of {"prompt_sha256", "response"}.
+
+    A prompt replays its own recording when one exists; otherwise the
+    recordings are served in rotation, or DEFAULT_REPLAY_RESPONSE if the
+    file is empty or missing.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.by_prompt: Dict[str, str] = {}
+        self.responses: List[str] = []
+        self._next = 0
+        self._lock = threading.Lock()
+        if path:
+            try:
+                with open(path) as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        record = json.loads(line)
+                        self.responses.append(record["response"])
+                        if record.get("prompt_sha256"):
+                            self.by_prompt[record["prompt_sha256"]] = record["response"]
+            except (OSError, ValueError, KeyError) as e:
+                logger.error(f"Failed to load LLM recordings from {path}: {str(e)}")
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+    def response_for(self, prompt: str) -> str:
+        recorded = self.by_prompt.get(prompt_key(prompt))
+        if recorded is not None:
+            return recorded
+        if not self.responses:
+            return DEFAULT_REPLAY_RESPONSE
+        with self._lock:
+            response = self.responses[self._next % len(self.responses)]
+            self._next += 1
+        return response
+
+
+class FaultProfile:
+    """Latency, jitter and error rate injected into replayed responses"""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self) -> tuple:
+        """Returns: (delay_seconds, should_fail)"""
+        with self._lock:
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+            fail = self._random.random() < self.error_rate
+        return max(0.0, self.latency_ms + jitter) / 1000, fail
+
+
+class ReplayBackend(LLMBackend):
+    """In-process backend replaying recorded responses, for offline runs and load tests"""
+
+    name = "replay"
+
+    def __init__(self, book: ReplayBook, faults: Optional[FaultProfile] = None, chunk_size: int = 16):
+        self.book = book
+        self.faults = faults or FaultProfile()
+        self.chunk_size = chunk_size
+
+    async def _delay(self) -> None:
+        delay, fail = self.faults.sample()
+        await asyncio.sleep(delay)
+        if fail:
+            raise LLMBackendError("Injected replay failure")
+
+    async def ainvoke(self, prompt: str) -> str:
+        await self._delay()
+        return self.book.response_for(prompt)
+
+    async def astream(self, prompt: str) -> AsyncIterator[str]:
+        await self._delay()
+        response = self.book.response_for(prompt)
+        for start in range(0, len(response), self.chunk_size):
+            yield response[start:start + self.chunk_size]
+
+
+class RecordingBackend(LLMBackend):
+    """Wraps a backend and appends every prompt/response pair to a JSONL file for replay"""
+
+    def __init__(self, inner: LLMBackend, path: str):
+        self.inner = inner
+        self.path = path
+        self.name = f"{inner.name}+recording"
+        self._lock = threading.Lock()
+
+    def _record(self, prompt: str, response: str) -> None:
+        line = json.dumps({"prompt_sha256": prompt_key(prompt), "response": response})
+        with self._lock:
+            with open(self.path, "a") as f:
+                f.write(line + "\n")
+
+    async def ainvoke(self, prompt: str) -> str:
+        response = await self.inner.ainvoke(prompt)
+        self._record(prompt, response)
+        return response
+
+    async def astream(self, prompt: str) -> AsyncIterator[str]:
+        chunks = []
+        try:
+            async for chunk in self.inner.astream(prompt):
+                chunks.append(chunk)
+                yield chunk
+        finally:
+            # Streams stopped early (e.g. once a JSON object closed) are recorded as read
+            if chunks:
+                self._record(prompt, "".join(chunks))
+
+
+def create_backend(model: str) -> Optional[LLMBackend]:
+    """
+    Build the backend selected by LLM_BACKEND, wrapped for recording when
+    LLM_RECORD_PATH is set.
+
+    Returns None when the backend is not configured (e.g. no Groq API key).
+    """
+    backend: Optional[LLMBackend] = None
+    if settings.LLM_BACKEND == "replay":
+        backend = ReplayBackend(
+            ReplayBook(settings.LLM_REPLAY_PATH),
+            FaultProfile(
+                latency_ms=settings.LLM_REPLAY_LATENCY_MS,
+                jitter_ms=settings.LLM_REPLAY_JITTER_MS,
+                error_rate=settings.LLM_REPLAY_ERROR_RATE,
+            ),
+        )
+    elif settings.LLM_BACKEND == "groq":
+        api_key = settings.GROQ_API_KEY or os.getenv("GROQ_API_KEY")
+        if not api_key:
+            logger.warning("GROQ_API_KEY not set, AI features will be limited")
+            return None
+        try:
+            backend = GroqBackend(
+                model=model,
+                api_key=api_key,
+                base_url=settings.LLM_BASE_URL,
+                max_retries=settings.LLM_MAX_RETRIES,
+            )
+        except Exception as e:
+            logger.error(f"Failed to initialize ChatGroq: {str(e)}")
+            return None
+    else:
+        logger.error(f"Unknown LLM_BACKEND {settings.LLM_BACKEND!r}, AI features will be limited")
+        return None
+
+    if settings.LLM_RECORD_PATH:
+        backend = RecordingBackend(backend, settings.LLM_RECORD_PATH)
+    return backend
@@ -0,0 +1,107 @@
+"""
+Content-addressed cache for LLM results with an optional on-disk tier
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+from core.cache import TTLCache
+from core.config import get_logger
+
+logger = get_logger(__name__)
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Strip surrounding and trailing whitespace so cosmetic differences share a key"""
+    return "\n".join(line.rstrip() for line in prompt.strip().splitlines())
+
+
+class LLMResultCache:
+    """
+    Two-tier cache for LLM results keyed by a hash of model, task and prompt.
+
+    The memory tier is an LRU+TTL cache. When a path is given, results are
+    also written to a SQLite file so they survive restarts. Values must be
+    JSON serializable.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 3600.0, path: Optional[str] = None):
+        self.ttl = ttl
+        self._memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0}
+        self._disk: Optional[sqlite3.Connection] = None
+        if path:
+            try:
+                self._disk = sqlite3.connect(path, check_same_thread=False)
+                self._disk.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache "
+                    "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+                )
+                self._disk.execute("DELETE FROM llm_cache WHERE expires_at < ?", (time.time(),))
+                self._disk.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Failed to open LLM cache at {path}: {str(e)}")
+                self._disk = None
+
+    @staticmethod
+    def key(model: str, task: str, prompt: str) -> str:
+        """Content address for one LLM request"""
+        payload = f"{model}\n{task}\n{normalize_prompt(prompt)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached result, checking memory before disk, or None"""
+        value = self._memory.get(key)
+        if value is not None:
+            self._count("memory_hits")
+            return value
+
+        if self._disk is not None:
+            with self._lock:
+                row = self._disk.execute(
+                    "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+            if row is not None and row[1] >= time.time():
+                value = json.loads(row[0])
+                self._memory.set(key, value)
+                self._count("disk_hits")
+                return value
+
+        self._count("misses")
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a result in memory and, if enabled, on disk"""
+        self._memory.set(key, value)
+        if self._disk is not None:
+            with self._lock:
+                self._disk.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), time.time() + self.ttl),
+                )
+                self._disk.commit()
+        self._count("writes")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and hit rate across both tiers"""
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        stats["memory_size"] = len(self._memory)
+        stats["disk_enabled"] = self._disk is not None
+        return stats
+
+    def clear(self) -> None:
+        self._memory.clear()
+        if self._disk is not None:
+            with self._lock:
+                self._disk.execute("DELETE FROM llm_cache")
+                self._disk.commit()
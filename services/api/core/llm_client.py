@@ -0,0 +1,196 @@
+"""
+Async, deadline-bounded LLM client with a concurrency limit and circuit breaker
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Optional
+from core.config import get_logger
+from core.sketch import DDSketch
+
+logger = get_logger(__name__)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the provider while the circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe consecutive-failure circuit breaker.
+
+    Opens after failure_threshold consecutive failures and rejects calls for
+    reset_timeout seconds, then lets a single trial call through (half-open);
+    its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                return "half_open"
+            return "open"
+
+    def allow(self) -> bool:
+        """Whether a call may go to the provider now"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_timeout or self._trial_running:
+                return False
+            self._trial_running = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.warning(f"LLM circuit opened after {self._failures} consecutive failures")
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+
+class LLMClient:
+    """
+    Runs LLM completions on a dedicated event loop thread.
+
+    Every call is bounded by a deadline that includes time spent waiting for
+    one of max_concurrency slots, is rejected immediately while the circuit
+    breaker is open, and is recorded in latency and error metrics. Async
+    callers await acomplete(); sync callers use complete(), which blocks the
+    calling thread only until the deadline.
+    """
+
+    def __init__(
+        self,
+        invoke: Callable[[str], Awaitable[str]],
+        max_concurrency: int = 4,
+        timeout: float = 15.0,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.invoke = invoke
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.breaker = breaker or CircuitBreaker()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._latency = DDSketch(relative_accuracy=0.01)
+        self._stats = {"calls": 0, "successes": 0, "errors": 0, "timeouts": 0, "short_circuited": 0}
+        self._in_flight = 0
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="llm-client", daemon=True).start()
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+                self._loop = loop
+            return self._loop
+
+    def _count(self, stat: str, delta: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[stat] += delta
+
+    async def _guarded(self, prompt: str, invoke: Callable[[str], Awaitable[str]]) -> str:
+        async with self._semaphore:
+            with self._stats_lock:
+                self._in_flight += 1
+            start = time.monotonic()
+            try:
+                return await invoke(prompt)
+            finally:
+                with self._stats_lock:
+                    self._in_flight -= 1
+                    self._latency.add((time.monotonic() - start) * 1000)
+
+    async def _call(
+        self,
+        prompt: str,
+        timeout: Optional[float],
+        invoke: Optional[Callable[[str], Awaitable[str]]],
+    ) -> str:
+        self._count("calls")
+        if not self.breaker.allow():
+            self._count("short_circuited")
+            raise CircuitOpenError("LLM provider circuit is open")
+
+        deadline = timeout if timeout is not None else self.timeout
+        try:
+            result = await asyncio.wait_for(
+                self._guarded(prompt, invoke or self.invoke), deadline
+            )
+        except asyncio.TimeoutError:
+            self._count("timeouts")
+            self.breaker.record_failure()
+            raise TimeoutError(f"LLM call exceeded deadline of {deadline}s")
+        except Exception:
+            self._count("errors")
+            self.breaker.record_failure()
+            raise
+
+        self._count("successes")
+        self.breaker.record_success()
+        return result
+
+    def _submit(
+        self,
+        prompt: str,
+        timeout: Optional[float],
+        invoke: Optional[Callable[[str], Awaitable[str]]],
+    ) -> Future:
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(self._call(prompt, timeout, invoke), loop)
+
+    async def acomplete(
+        self,
+        prompt: str,
+        timeout: Optional[float] = None,
+        invoke: Optional[Callable[[str], Awaitable[str]]] = None,
+    ) -> str:
+        """
+        Complete a prompt from async code without blocking the caller's loop.
+
+        invoke overrides the client's default provider call for this request,
+        e.g. to stream the response instead of waiting for the full text.
+        """
+        return await asyncio.wrap_future(self._submit(prompt, timeout, invoke))
+
+    def complete(
+        self,
+        prompt: str,
+        timeout: Optional[float] = None,
+        invoke: Optional[Callable[[str], Awaitable[str]]] = None,
+    ) -> str:
+        """Complete a prompt from sync code, blocking at most until the deadline"""
+        return self._submit(prompt, timeout, invoke).result()
+
+    def stats(self) -> Dict[str, Any]:
+        """Call, error and latency metrics plus breaker state"""
+        with self._stats_lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["in_flight"] = self._in_flight
+            for name, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+                stats[f"latency_{name}_ms"] = self._latency.quantile(q)
+        stats["circuit_state"] = self.breaker.state
+        stats["max_concurrency"] = self.max_concurrency
+        return stats
@@ -0,0 +1,96 @@
+"""
+Incremental NDJSON line splitter with transparent gzip decompression
+"""
+import zlib
+from typing import Iterator, List, Optional
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Decompressed bytes produced per step, so a highly compressed body cannot expand all at once
+_DECOMPRESS_STEP = 1 << 16
+
+
+class NDJSONDecodeError(ValueError):
+    """Raised when a body is not valid (optionally gzipped) NDJSON"""
+
+
+class NDJSONDecoder:
+    """
+    Split a byte stream into NDJSON lines as chunks arrive.
+
+    Gzip is detected from the magic bytes of the first chunk, and
+    concatenated gzip members are decoded in turn. Compressed input is
+    inflated in bounded steps and lines are yielded as they are produced;
+    only the current partial line is buffered, so memory stays bounded by
+    max_line_bytes regardless of the body size or compression ratio.
+    """
+
+    def __init__(self, max_line_bytes: int = 1 << 20):
+        self.max_line_bytes = max_line_bytes
+        self.gzipped: Optional[bool] = None
+        self.lines_seen = 0
+        self._decompressor = None
+        self._pending = b""
+        self._head = b""
+
+    def _decompress(self, chunk: bytes) -> Iterator[bytes]:
+        while True:
+            if self._decompressor is None:
+                self._decompressor = zlib.decompressobj(wbits=31)
+            try:
+                output = self._decompressor.decompress(chunk, _DECOMPRESS_STEP)
+            except zlib.error as e:
+                raise NDJSONDecodeError(f"Invalid gzip data: {str(e)}")
+            if output:
+                yield output
+            if self._decompressor.eof:
+                # Bytes after the end of a member start the next one
+                chunk = self._decompressor.unused_data
+                self._decompressor = None
+                if not chunk:
+                    return
+            else:
+                chunk = self._decompressor.unconsumed_tail
+                # A full step may leave output pending even once the input is consumed
+                if not chunk and len(output) < _DECOMPRESS_STEP:
+                    return
+
+    def _split(self, data: bytes) -> List[bytes]:
+        data = self._pending + data
+        lines = data.split(b"\n")
+        self._pending = lines.pop()
+        if len(self._pending) > self.max_line_bytes:
+            raise NDJSONDecodeError(f"Line {self.lines_seen + len(lines) + 1} exceeds {self.max_line_bytes} bytes")
+        self.lines_seen += len(lines)
+        return lines
+
+    def feed(self, chunk: bytes) -> Iterator[bytes]:
+        """Yields the complete lines (without newline) in chunk, blank lines included"""
+        if self.gzipped is None:
+            # Wait for enough bytes to recognise the gzip header
+            self._head += chunk
+            if len(self._head) < len(_GZIP_MAGIC):
+                return
+            self.gzipped = self._head.startswith(_GZIP_MAGIC)
+            chunk, self._head = self._head, b""
+        if self.gzipped:
+            for output in self._decompress(chunk):
+                yield from self._split(output)
+        else:
+            yield from self._split(chunk)
+
+    def close(self) -> List[bytes]:
+        """Returns the final unterminated line, if any"""
+        if self._head:
+            chunk, self._head = self._head, b""
+            self.gzipped = False
+            lines = self._split(chunk)
+        else:
+            lines = []
+        if self._decompressor is not None:
+            raise NDJSONDecodeError("Truncated gzip data")
+        if self._pending:
+            lines.append(self._pending)
+            self._pending = b""
+            self.lines_seen += 1
+        return lines
@@ -0,0 +1,223 @@
+"""
+Offline feature-based root cause classifier over the telemetry summary signals
+"""
+import math
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from core.telemetry_summary import message_template
+
+ROOT_CAUSE_LABELS = (
+    "deployment_failure",
+    "config_error",
+    "resource_exhaustion",
+    "cascading_failure",
+    "network_issue",
+    "database_bottleneck",
+    "memory_leak",
+    "external_service_failure",
+    "traffic_spike",
+    "code_bug",
+)
+
+# Error message categories, matched against message templates
+_LOG_PATTERNS = {
+    "memory": r"out of memory|\boom\b|heap|memory|gc overhead|allocation failed",
+    "database": r"deadlock|lock wait|pool exhausted|too many (connections|clients)|slow query|\bsql\b|database|\bdb\b",
+    "network": r"timed? ?out|timeout|connection (refused|reset)|unreachable|\bdns\b|socket|econn|network",
+    "external": r"upstream|third.party|external|gateway|\b50[234]\b|service unavailable",
+    "config": r"config|missing (env|variable|key|setting)|invalid (setting|value|option)|not configured|permission denied|unauthorized|certificate",
+    "code": r"exception|traceback|nullpointer|null reference|typeerror|keyerror|attributeerror|undefined|index out of|assert|panic|segfault",
+    "resource": r"disk full|no space|\bcpu\b|throttl|rate limit|quota|too many open files|exhausted|queue full",
+    "cascade": r"circuit|cascad|dependency|retries exhausted|backpressure",
+    "traffic": r"overload|too many requests|\b429\b|capacity|load shedding|spike",
+}
+_LOG_REGEXES = {name: re.compile(pattern, re.IGNORECASE) for name, pattern in _LOG_PATTERNS.items()}
+
+# Event types by substring, first match wins
+_EVENT_KINDS = (
+    ("rollback", "rollback"),
+    ("deploy", "deployment"),
+    ("config", "config_change"),
+    ("scal", "scaling"),
+    ("restart", "restart"),
+    ("crash", "restart"),
+)
+
+# Metric names by substring, first match wins
+_METRIC_KINDS = (
+    (("memory", "heap", "rss", "mem_"), "memory"),
+    (("conn", "pool", "db_", "query", "sql"), "database"),
+    (("request", "rps", "qps", "throughput", "traffic"), "traffic"),
+    (("latency", "rtt", "packet", "network", "net_"), "network"),
+    (("cpu", "disk", "fd", "thread", "load"), "resource"),
+)
+
+_DB_OPERATION = re.compile(r"select|insert|update|delete|query|\bsql\b|\bdb\b|database|redis|mongo", re.IGNORECASE)
+
+# Evidence weight of each feature (in [0, 1]) towards each label
+WEIGHTS: Dict[str, Dict[str, float]] = {
+    "deployment_failure": {"event:deployment": 3.0, "event:rollback": 3.0, "log:code": 0.8, "log:config": 0.5},
+    "config_error": {"event:config_change": 3.0, "log:config": 2.5},
+    "resource_exhaustion": {"log:resource": 2.5, "metric:resource": 2.5, "event:scaling": 1.0, "trace:slow": 0.5},
+    "cascading_failure": {"services:spread": 2.5, "log:cascade": 2.0, "log:external": 0.5},
+    "network_issue": {"log:network": 2.5, "metric:network": 2.0},
+    "database_bottleneck": {"log:database": 2.5, "trace:db": 2.0, "metric:database": 2.0},
+    "memory_leak": {"log:memory": 3.0, "metric:memory": 2.5, "event:restart": 1.0},
+    "external_service_failure": {"log:external": 2.5, "log:network": 0.5},
+    "traffic_spike": {"log:traffic": 2.5, "metric:traffic": 2.5, "event:scaling": 1.5, "trace:slow": 0.8},
+    "code_bug": {"log:code": 2.5},
+}
+
+_FEATURE_DESCRIPTIONS = {
+    "services:spread": "errors spread across several services",
+    "trace:db": "slow traces dominated by database operations",
+    "trace:slow": "many slow traces relative to errors",
+}
+
+
+def _kind(name: str, kinds) -> Optional[str]:
+    name = name.lower()
+    for needles, kind in kinds:
+        if isinstance(needles, str):
+            needles = (needles,)
+        if any(needle in name for needle in needles):
+            return kind
+    return None
+
+
+def _describe(feature: str) -> str:
+    if feature in _FEATURE_DESCRIPTIONS:
+        return _FEATURE_DESCRIPTIONS[feature]
+    source, name = feature.split(":", 1)
+    if source == "log":
+        return f"{name} error messages"
+    if source == "event":
+        return f"{name.replace('_', ' ')} events"
+    return f"{name} metrics correlated with errors"
+
+
+def extract_features(
+    error_logs: List[Dict[str, Any]],
+    events: List[Dict[str, Any]],
+    traces: List[Dict[str, Any]],
+    signal_correlations: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, float]:
+    """
+    Feature vector in [0, 1] from (possibly template-grouped) telemetry samples.
+
+    Log features are the share of error occurrences whose template falls in
+    each category; event features weight presence by severity; trace
+    features capture how slow traces relate to errors; metric features are
+    the strongest positive correlation of a metric kind with error or slow
+    trace signals.
+    """
+    features: Dict[str, float] = {}
+
+    error_total = sum(log.get("count", 1) for log in error_logs)
+    if error_total:
+        services = {log.get("service_name") for log in error_logs if log.get("service_name")}
+        features["services:spread"] = min(1.0, max(0, len(services) - 1) / 3)
+        for log in error_logs:
+            template = message_template(log.get("message"))
+            for category, regex in _LOG_REGEXES.items():
+                if regex.search(template):
+                    key = f"log:{category}"
+                    features[key] = features.get(key, 0.0) + log.get("count", 1) / error_total
+
+    for event in events:
+        kind = _kind(str(event.get("type", "")), _EVENT_KINDS)
+        if kind is None:
+            continue
+        weight = 1.0 if str(event.get("severity", "")).lower() in ("critical", "high") else 0.6
+        key = f"event:{kind}"
+        features[key] = max(features.get(key, 0.0), weight)
+
+    trace_total = sum(trace.get("count", 1) for trace in traces)
+    if trace_total:
+        db_traces = sum(
+            trace.get("count", 1)
+            for trace in traces
+            if _DB_OPERATION.search(str(trace.get("operation", "")))
+        )
+        features["trace:db"] = db_traces / trace_total
+        features["trace:slow"] = min(1.0, trace_total / max(error_total, 1) / 2)
+
+    for correlation in signal_correlations or []:
+        pairs = (
+            (correlation.get("source_signal", ""), correlation.get("target_signal", "")),
+            (correlation.get("target_signal", ""), correlation.get("source_signal", "")),
+        )
+        for signal, other in pairs:
+            if not signal.startswith("metric:") or other not in ("error_logs", "slow_traces"):
+                continue
+            kind = _kind(signal[len("metric:"):], _METRIC_KINDS)
+            if kind is not None:
+                key = f"metric:{kind}"
+                features[key] = max(features.get(key, 0.0), float(correlation.get("coefficient", 0.0)))
+
+    return {name: min(1.0, value) for name, value in features.items() if value > 0}
+
+
+class RootCauseClassifier:
+    """
+    Linear evidence model with a softmax over ROOT_CAUSE_LABELS.
+
+    Runs in well under a millisecond without network access. With no
+    evidence every label scores 1/len(labels), so confidence is only high
+    when features clearly favour one label.
+    """
+
+    def __init__(self, weights: Optional[Dict[str, Dict[str, float]]] = None, sharpness: float = 1.0):
+        self.weights = weights or WEIGHTS
+        self.sharpness = sharpness
+
+    def scores(self, features: Dict[str, float]) -> Dict[str, float]:
+        """Probability of each label given the features"""
+        logits = {
+            label: self.sharpness
+            * sum(weight * features.get(feature, 0.0) for feature, weight in self.weights.get(label, {}).items())
+            for label in ROOT_CAUSE_LABELS
+        }
+        peak = max(logits.values())
+        exps = {label: math.exp(logit - peak) for label, logit in logits.items()}
+        total = sum(exps.values())
+        return {label: value / total for label, value in exps.items()}
+
+    def _evidence(self, label: str, features: Dict[str, float]) -> List[Tuple[float, str]]:
+        contributions = [
+            (weight * features.get(feature, 0.0), feature)
+            for feature, weight in self.weights.get(label, {}).items()
+            if features.get(feature)
+        ]
+        return sorted(contributions, reverse=True)
+
+    def predict(
+        self,
+        error_logs: List[Dict[str, Any]],
+        events: List[Dict[str, Any]],
+        traces: List[Dict[str, Any]],
+        signal_correlations: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Classify the most likely root cause.
+
+        Returns root_cause, confidence, reasoning and the per-label scores.
+        """
+        features = extract_features(error_logs, events, traces, signal_correlations)
+        scores = self.scores(features)
+        root_cause = max(scores, key=scores.get)
+        evidence = self._evidence(root_cause, features)[:3]
+        if not evidence:
+            return {
+                "root_cause": None,
+                "confidence": 0.0,
+                "reasoning": "Local classifier: no distinguishing evidence",
+                "scores": scores,
+            }
+        return {
+            "root_cause": root_cause,
+            "confidence": round(scores[root_cause], 3),
+            "reasoning": "Local classifier: "
+            + ", ".join(_describe(feature) for _, feature in evidence),
+            "scores": scores,
+        }
@@ -0,0 +1,41 @@
+"""
+Background scheduling for periodic in-process jobs
+"""
+import threading
+from typing import Callable, Optional
+from core.config import get_logger
+
+logger = get_logger(__name__)
+
+
+class PeriodicTask:
+    """Runs a function every interval seconds on a daemon thread until stopped"""
+
+    def __init__(self, name: str, interval: float, func: Callable[[], None]):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.func()
+            except Exception as e:
+                logger.error(f"Periodic task {self.name} failed: {str(e)}")
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        logger.info(f"Started periodic task {self.name} (every {self.interval}s)")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
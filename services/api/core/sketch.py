@@ -0,0 +1,138 @@
+"""
+Mergeable quantile sketch (DDSketch) for streaming percentile estimation
+"""
+import json
+import math
+from typing import Dict, Iterable, Optional
+
+
+class DDSketch:
+    """
+    Quantile sketch with relative-error guarantees.
+
+    Values are counted in logarithmically sized buckets, so any quantile is
+    returned within relative_accuracy of the true value while memory stays
+    proportional to the log of the value range rather than the number of
+    samples. Two sketches built with the same accuracy merge losslessly,
+    which makes them suitable for pre-aggregated rollups.
+    """
+
+    # Values closer to zero than this are counted in the zero bucket
+    MIN_INDEXABLE_VALUE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.positive_bins: Dict[int, int] = {}
+        self.negative_bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+    def add(self, value: float, weight: int = 1) -> None:
+        """Record a value (weight times)"""
+        if value > self.MIN_INDEXABLE_VALUE:
+            index = self._index(value)
+            self.positive_bins[index] = self.positive_bins.get(index, 0) + weight
+        elif value < -self.MIN_INDEXABLE_VALUE:
+            index = self._index(-value)
+            self.negative_bins[index] = self.negative_bins.get(index, 0) + weight
+        else:
+            self.zero_count += weight
+
+        self.count += weight
+        self.sum += value * weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def update(self, values: Iterable[float]) -> None:
+        """Record every value from an iterable"""
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "DDSketch") -> None:
+        """Fold another sketch with the same accuracy into this one"""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for index, count in other.positive_bins.items():
+            self.positive_bins[index] = self.positive_bins.get(index, 0) + count
+        for index, count in other.negative_bins.items():
+            self.negative_bins[index] = self.negative_bins.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def avg(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-th quantile (0 <= q <= 1), or None if the sketch is empty"""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = 0
+
+        for index in sorted(self.negative_bins, reverse=True):
+            seen += self.negative_bins[index]
+            if seen > rank:
+                return max(self.min, -self._value(index))
+
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+
+        for index in sorted(self.positive_bins):
+            seen += self.positive_bins[index]
+            if seen > rank:
+                return min(self.max, self._value(index))
+
+        return self.max
+
+    def to_dict(self) -> Dict:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "positive_bins": self.positive_bins,
+            "negative_bins": self.negative_bins,
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "DDSketch":
+        sketch = cls(relative_accuracy=data["relative_accuracy"])
+        sketch.positive_bins = {int(k): v for k, v in data["positive_bins"].items()}
+        sketch.negative_bins = {int(k): v for k, v in data["negative_bins"].items()}
+        sketch.zero_count = data["zero_count"]
+        sketch.count = data["count"]
+        sketch.sum = data["sum"]
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, payload: str) -> "DDSketch":
+        return cls.from_dict(json.loads(payload))
@@ -0,0 +1,57 @@
+"""
+Single-pass running statistics for streaming over large result sets
+"""
+import math
+from typing import Optional
+
+
+class RunningStats:
+    """Welford accumulator for count, mean, sample stddev, min and max"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def stddev(self) -> Optional[float]:
+        """Sample standard deviation, or None with fewer than two values"""
+        if self.count < 2:
+            return None
+        return math.sqrt(self._m2 / (self.count - 1))
+
+
+class RunningSlope:
+    """Online least-squares slope of y over x (the regr_slope aggregate)"""
+
+    def __init__(self):
+        self.count = 0
+        self._mean_x = 0.0
+        self._mean_y = 0.0
+        self._m2_x = 0.0
+        self._co_moment = 0.0
+
+    def add(self, x: float, y: float) -> None:
+        self.count += 1
+        delta_x = x - self._mean_x
+        self._mean_x += delta_x / self.count
+        self._mean_y += (y - self._mean_y) / self.count
+        self._m2_x += delta_x * (x - self._mean_x)
+        self._co_moment += delta_x * (y - self._mean_y)
+
+    @property
+    def slope(self) -> Optional[float]:
+        """Slope of the fitted line, or None when x never varies"""
+        if self.count < 2 or self._m2_x == 0:
+            return None
+        return self._co_moment / self._m2_x
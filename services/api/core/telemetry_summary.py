@@ -0,0 +1,228 @@
+"""
+Template-deduplicated, salience-ranked telemetry summaries sized to a token budget
+"""
+import math
+import re
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+# Variable parts of a message, most specific first
+_MASKS = [
+    re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"),
+    re.compile(r"\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b"),
+    re.compile(r"\b0x[0-9a-fA-F]+\b|\b[0-9a-fA-F]{12,}\b"),
+    re.compile(r"'[^']*'|\"[^\"]*\""),
+    re.compile(r"(?<![\w.])\d+(?:\.\d+)*"),
+]
+
+# Message fragments that usually point at the cause rather than a symptom
+_CAUSE_KEYWORDS = re.compile(
+    r"timeout|timed out|refused|reset|oom|out of memory|deadlock|panic|exhausted|"
+    r"too many|unavailable|denied|certificate|overflow|crash",
+    re.IGNORECASE,
+)
+
+_LEVEL_WEIGHTS = {"CRITICAL": 3.0, "FATAL": 3.0, "ERROR": 2.0, "WARN": 1.0, "WARNING": 1.0}
+_SEVERITY_WEIGHTS = {"critical": 4.0, "high": 3.0, "warning": 2.0, "medium": 2.0}
+_CHANGE_EVENT_TYPES = {"deployment", "config_change", "scaling", "rollback", "feature_flag"}
+
+_MAX_MESSAGE_CHARS = 200
+
+
+def message_template(message: Optional[str]) -> str:
+    """Mask ids, addresses, quoted values and numbers so repeats share one template"""
+    template = str(message or "")
+    for mask in _MASKS:
+        template = mask.sub("<*>", template)
+    return " ".join(template.split())
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)"""
+    return math.ceil(len(text) / 4)
+
+
+class TemplateGroups:
+    """
+    Bounded grouping of telemetry items by key with occurrence counts.
+
+    The first item of a group is kept as its example. Once max_groups
+    distinct keys exist, items of new keys are only counted in overflow.
+    """
+
+    def __init__(self, max_groups: int):
+        self.max_groups = max_groups
+        self.groups: Dict[Hashable, Dict[str, Any]] = {}
+        self.overflow = 0
+
+    def add(self, key: Hashable, item: Dict[str, Any]) -> None:
+        group = self.groups.get(key)
+        if group is not None:
+            group["count"] += item.get("count", 1)
+            if "duration" in item:
+                group["duration"] = max(group["duration"], item["duration"])
+                group["total_duration"] += item.get("total_duration", item["duration"])
+            if item.get("timestamp"):
+                group["last_seen"] = item["timestamp"]
+            return
+        if len(self.groups) >= self.max_groups:
+            self.overflow += item.get("count", 1)
+            return
+        group = dict(item)
+        group.setdefault("count", 1)
+        if "duration" in group:
+            group.setdefault("total_duration", group["duration"] * group["count"])
+        self.groups[key] = group
+
+    def items(self) -> List[Dict[str, Any]]:
+        return list(self.groups.values())
+
+
+def _log_lines(error_logs: List[Dict[str, Any]]) -> Tuple[List[Tuple[float, str]], int]:
+    groups = TemplateGroups(max_groups=len(error_logs) or 1)
+    for log in error_logs:
+        key = (log.get("service_name"), log.get("level"), message_template(log.get("message")))
+        groups.add(key, log)
+
+    lines = []
+    for key, group in groups.groups.items():
+        # Repeated messages show their template, one-offs the message itself
+        message = key[2] if group["count"] > 1 else str(group.get("message", ""))
+        message = message[:_MAX_MESSAGE_CHARS]
+        salience = _LEVEL_WEIGHTS.get(str(group.get("level", "")).upper(), 0.5)
+        salience *= 1 + math.log1p(group["count"])
+        if _CAUSE_KEYWORDS.search(message):
+            salience *= 1.5
+        service = f"{group['service_name']}: " if group.get("service_name") else ""
+        lines.append(
+            (salience, f"  - [{group.get('level')}] x{group['count']} {service}{message}")
+        )
+    return lines, len(lines)
+
+
+def _event_lines(events: List[Dict[str, Any]]) -> Tuple[List[Tuple[float, str]], int]:
+    groups = TemplateGroups(max_groups=len(events) or 1)
+    for event in events:
+        key = (
+            event.get("service_name"),
+            event.get("type"),
+            message_template(event.get("description")),
+        )
+        groups.add(key, event)
+
+    lines = []
+    for key, group in groups.groups.items():
+        description = key[2] if group["count"] > 1 else str(group.get("description", ""))
+        description = description[:_MAX_MESSAGE_CHARS]
+        salience = _SEVERITY_WEIGHTS.get(str(group.get("severity", "")).lower(), 1.0)
+        # Changes are prime root-cause candidates even when they happen once
+        if group.get("type") in _CHANGE_EVENT_TYPES:
+            salience *= 2.0
+        salience *= 1 + 0.25 * math.log1p(group["count"])
+        service = f"{group['service_name']}: " if group.get("service_name") else ""
+        lines.append(
+            (
+                salience,
+                f"  - [{group.get('type')}] x{group['count']} {service}{description} "
+                f"(severity: {group.get('severity')})",
+            )
+        )
+    return lines, len(lines)
+
+
+def _trace_lines(
+    traces: List[Dict[str, Any]], slow_trace_ms: float
+) -> Tuple[List[Tuple[float, str]], int]:
+    groups = TemplateGroups(max_groups=len(traces) or 1)
+    for trace in traces:
+        groups.add((trace.get("service_name"), trace.get("operation")), trace)
+
+    lines = []
+    for group in groups.items():
+        slowest = float(group.get("duration") or 0.0)
+        average = group.get("total_duration", slowest) / group["count"]
+        salience = (slowest / max(slow_trace_ms, 1.0)) * (1 + math.log1p(group["count"]))
+        service = f"{group['service_name']} " if group.get("service_name") else ""
+        lines.append(
+            (
+                salience,
+                f"  - x{group['count']} {service}{group.get('operation')}: "
+                f"max {slowest:.0f}ms, avg {average:.0f}ms",
+            )
+        )
+    return lines, len(lines)
+
+
+def summarize_telemetry(
+    error_logs: List[Dict[str, Any]],
+    events: List[Dict[str, Any]],
+    traces: List[Dict[str, Any]],
+    totals: Optional[Dict[str, int]] = None,
+    token_budget: int = 600,
+    slow_trace_ms: float = 2000,
+) -> str:
+    """
+    Summarize telemetry for an LLM prompt within roughly token_budget tokens.
+
+    Messages are collapsed into templates with counts and each section is
+    ranked by salience (severity, frequency, cause keywords, slowness).
+    Lines are taken round-robin from the sections, most salient first, so
+    every signal is represented before any one fills the budget. Items may
+    already be grouped, in which case their "count" is honoured.
+
+    Returns the summary text.
+    """
+    totals = totals or {}
+
+    def count(items: List[Dict[str, Any]]) -> int:
+        return sum(item.get("count", 1) for item in items)
+
+    log_lines, log_templates = _log_lines(error_logs)
+    event_lines, event_templates = _event_lines(events)
+    trace_lines, trace_templates = _trace_lines(traces, slow_trace_ms)
+
+    sections = [
+        (
+            f"Error Logs ({totals.get('error_logs', count(error_logs))} total, "
+            f"{log_templates} distinct messages):",
+            log_lines,
+        ),
+        (
+            f"Events ({totals.get('events', count(events))} total, "
+            f"{event_templates} distinct):",
+            event_lines,
+        ),
+        (
+            f"Slow Traces ({totals.get('traces', count(traces))} total, >{slow_trace_ms:g}ms, "
+            f"{trace_templates} distinct operations):",
+            trace_lines,
+        ),
+    ]
+
+    # Headers and omission notes always fit; the rest goes to the most salient lines
+    remaining = token_budget - sum(estimate_tokens(header) + 6 for header, _ in sections)
+    ranked = [sorted(lines, key=lambda line: -line[0]) for _, lines in sections]
+    chosen: List[List[str]] = [[] for _ in sections]
+    cursors = [0] * len(sections)
+    progressing = True
+    while progressing:
+        progressing = False
+        for index, lines in enumerate(ranked):
+            while cursors[index] < len(lines):
+                line = lines[cursors[index]][1]
+                cursors[index] += 1
+                cost = estimate_tokens(line) + 1
+                if cost <= remaining:
+                    chosen[index].append(line)
+                    remaining -= cost
+                    progressing = True
+                    break
+
+    parts = []
+    for (header, lines), picked in zip(sections, chosen):
+        parts.append(header)
+        parts.extend(picked)
+        omitted = len(lines) - len(picked)
+        if omitted > 0:
+            parts.append(f"  ... and {omitted} more")
+        parts.append("")
+    return "\n".join(parts)
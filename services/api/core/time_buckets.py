@@ -0,0 +1,70 @@
+"""
+Dialect-aware time bucketing for time-series aggregation
+"""
+from sqlalchemy import Integer, cast, func, literal_column
+from datetime import datetime, timedelta
+from typing import Any, List
+from core.config import settings
+
+EPOCH = datetime(1970, 1, 1)
+
+# Widths that date_trunc handles natively on Postgres
+_DATE_TRUNC_UNITS = {60: "minute", 3600: "hour", 86400: "day"}
+
+
+def bucket_expression(column, width: timedelta, dialect_name: str):
+    """
+    SQL expression flooring a timestamp column to epoch-aligned buckets of width.
+
+    Uses time_bucket on TimescaleDB, date_trunc/date_bin on Postgres,
+    strftime on SQLite and UNIX_TIMESTAMP on MySQL.
+    """
+    seconds = int(width.total_seconds())
+    if seconds <= 0:
+        raise ValueError("Bucket width must be at least one second")
+
+    if dialect_name == "postgresql":
+        interval = literal_column(f"INTERVAL '{seconds} seconds'")
+        origin = literal_column("TIMESTAMP '1970-01-01'")
+        if settings.TIMESCALEDB_ENABLED:
+            return func.time_bucket(interval, column, origin)
+        if seconds in _DATE_TRUNC_UNITS:
+            # Inline the unit so SELECT and GROUP BY compile to the same expression
+            return func.date_trunc(literal_column(f"'{_DATE_TRUNC_UNITS[seconds]}'"), column)
+        return func.date_bin(interval, column, origin)
+
+    if dialect_name == "sqlite":
+        epoch_seconds = cast(func.strftime("%s", column), Integer)
+        return func.datetime(epoch_seconds.op("/")(seconds).op("*")(seconds), "unixepoch")
+
+    if dialect_name in ("mysql", "mariadb"):
+        width_literal = literal_column(str(seconds))
+        return func.from_unixtime(
+            func.floor(func.unix_timestamp(column) / width_literal) * width_literal
+        )
+
+    raise ValueError(f"Time bucketing is not supported on {dialect_name}")
+
+
+def floor_bucket(timestamp: datetime, width: timedelta) -> datetime:
+    """Floor a timestamp to its epoch-aligned bucket, matching bucket_expression"""
+    seconds = int(width.total_seconds())
+    elapsed = int((timestamp - EPOCH).total_seconds())
+    return EPOCH + timedelta(seconds=elapsed - elapsed % seconds)
+
+
+def bucket_range(start_time: datetime, end_time: datetime, width: timedelta) -> List[datetime]:
+    """Every bucket start from the bucket holding start_time to the one holding end_time"""
+    buckets = []
+    bucket = floor_bucket(start_time, width)
+    while bucket <= end_time:
+        buckets.append(bucket)
+        bucket += width
+    return buckets
+
+
+def to_datetime(value: Any) -> datetime:
+    """Normalise a bucket value returned by the driver (SQLite returns strings)"""
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    return datetime.fromisoformat(str(value))
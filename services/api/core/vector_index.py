@@ -0,0 +1,138 @@
+"""
+In-process inverted-file (IVF) index for cosine search over unit vectors, persisted as .npz
+"""
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+
+
+class IVFIndex:
+    """
+    Inverted-file index over unit-length vectors keyed by integer id.
+
+    Below min_train vectors every query is an exact scan. From then on
+    vectors are clustered with spherical k-means into about sqrt(n) lists
+    and a query only scans the nprobe lists whose centroids are closest.
+    Lists are re-clustered whenever the index doubles in size.
+    """
+
+    def __init__(self, dim: int, min_train: int = 1024, seed: int = 0):
+        self.dim = dim
+        self.min_train = min_train
+        self.seed = seed
+        self.ids = np.empty(0, dtype=np.int64)
+        self.vectors = np.empty((0, dim), dtype=np.float32)
+        self.centroids = np.empty((0, dim), dtype=np.float32)
+        self.lists = np.empty(0, dtype=np.int32)  # centroid row of each vector
+        self.trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        return np.argmax(vectors @ self.centroids.T, axis=1).astype(np.int32)
+
+    def train(self, iterations: int = 10) -> None:
+        """Cluster the current vectors into about sqrt(n) inverted lists"""
+        count = len(self.ids)
+        nlist = max(1, int(np.sqrt(count)))
+        rng = np.random.default_rng(self.seed)
+        centroids = self.vectors[rng.choice(count, size=nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assignment = np.argmax(self.vectors @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, self.vectors)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # Empty clusters keep their previous centroid
+            centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+        self.centroids = centroids.astype(np.float32)
+        self.lists = self._assign(self.vectors)
+        self.trained_size = count
+
+    def remove(self, id_: int) -> None:
+        keep = self.ids != id_
+        if keep.all():
+            return
+        self.ids = self.ids[keep]
+        self.vectors = self.vectors[keep]
+        if len(self.lists):
+            self.lists = self.lists[keep]
+
+    def add(self, id_: int, vector: np.ndarray) -> None:
+        """Insert or replace one vector"""
+        self.remove(id_)
+        vector = np.asarray(vector, dtype=np.float32).reshape(1, self.dim)
+        self.ids = np.append(self.ids, np.int64(id_))
+        self.vectors = np.vstack([self.vectors, vector])
+        if len(self.centroids):
+            self.lists = np.append(self.lists, self._assign(vector))
+        if len(self.ids) >= max(self.min_train, 2 * self.trained_size):
+            self.train()
+
+    def add_many(self, ids: List[int], vectors: np.ndarray) -> None:
+        """Bulk load, replacing the current contents"""
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.vectors = np.asarray(vectors, dtype=np.float32).reshape(len(self.ids), self.dim)
+        self.centroids = np.empty((0, self.dim), dtype=np.float32)
+        self.lists = np.empty(0, dtype=np.int32)
+        self.trained_size = 0
+        if len(self.ids) >= self.min_train:
+            self.train()
+
+    def search(self, query: np.ndarray, k: int, nprobe: int = 4) -> List[Tuple[int, float]]:
+        """
+        Approximate top-k by cosine similarity.
+
+        Returns [(id, similarity)] in descending similarity.
+        """
+        if not len(self.ids) or k <= 0:
+            return []
+        query = np.asarray(query, dtype=np.float32)
+        if len(self.centroids) > nprobe:
+            probes = np.argpartition(-(self.centroids @ query), nprobe)[:nprobe]
+            candidates = np.flatnonzero(np.isin(self.lists, probes))
+        else:
+            candidates = np.arange(len(self.ids))
+        if not len(candidates):
+            return []
+        scores = self.vectors[candidates] @ query
+        if len(candidates) > k:
+            top = np.argpartition(-scores, k)[:k]
+        else:
+            top = np.arange(len(candidates))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(self.ids[candidates[i]]), float(scores[i])) for i in top]
+
+    def save(self, path: str, meta: Optional[Dict[str, Any]] = None) -> None:
+        """Write the index atomically; meta is stored alongside as JSON"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                ids=self.ids,
+                vectors=self.vectors,
+                centroids=self.centroids,
+                lists=self.lists,
+                trained_size=np.int64(self.trained_size),
+                meta=np.array(json.dumps(meta or {})),
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, min_train: int = 1024) -> Tuple["IVFIndex", Dict[str, Any]]:
+        """
+        Read an index written by save.
+
+        Returns: (index, meta)
+        """
+        with np.load(path, allow_pickle=False) as data:
+            vectors = data["vectors"]
+            index = cls(vectors.shape[1], min_train=min_train)
+            index.ids = data["ids"]
+            index.vectors = vectors
+            index.centroids = data["centroids"]
+            index.lists = data["lists"]
+            index.trained_size = int(data["trained_size"])
+            meta = json.loads(str(data["meta"]))
+        return index, meta
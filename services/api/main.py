@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from core.config import settings, get_logger
@@ -11,14 +12,30 @@ from routes.team_routes import router as team_router
 from routes.dashboard_routes import router as dashboard_router
 from routes.service_routes import router as service_router
 from routes.telemetry_routes import router as telemetry_router
-import uvicorn
+from routes.ingest_routes import router as ingest_router
+from services.health_snapshot_service import start_snapshot_scheduler, stop_snapshot_scheduler
+from services.event_rollup_service import start_event_rollup_scheduler, stop_event_rollup_scheduler
+from services.rca_job_service import start_rca_workers, stop_rca_workers
 
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    start_snapshot_scheduler()
+    start_event_rollup_scheduler()
+    start_rca_workers()
+    yield
+    stop_rca_workers()
+    stop_event_rollup_scheduler()
+    stop_snapshot_scheduler()
+
+
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    lifespan=lifespan,
 )
 
 
@@ -42,6 +59,7 @@ app.include_router(team_router)
 app.include_router(dashboard_router)
 app.include_router(service_router)
 app.include_router(telemetry_router)
+app.include_router(ingest_router)
 
 
 @app.get("/")
@@ -59,6 +77,8 @@ async def health():
 
 
 if __name__ == "__main__":
+    import uvicorn
+
     logger.info(f"Starting {settings.APP_NAME} on {settings.HOST}:{settings.PORT}")
     uvicorn.run(
         "main:app",
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index, UniqueConstraint
+from core.database import Base
+from datetime import datetime, timezone
+
+
+class EventHourlyCountModel(Base):
+    """Number of events per service per hour"""
+    __tablename__ = "event_hourly_counts"
+
+    id = Column(Integer, primary_key=True, index=True)
+    service_name = Column(String, nullable=False)
+    hour = Column(DateTime, nullable=False)  # start of the hour bucket
+    count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('service_name', 'hour', name='uq_event_hourly_counts_service_hour'),
+        Index('ix_event_hourly_counts_hour', 'hour'),
+    )
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index, UniqueConstraint
+from core.database import Base
+from datetime import datetime, timezone
+
+
+class LatencySketchModel(Base):
+    """Per-minute mergeable latency sketch for one service operation"""
+    __tablename__ = "latency_sketches"
+
+    id = Column(Integer, primary_key=True, index=True)
+    service_name = Column(String, nullable=False)
+    operation = Column(String, nullable=False)
+    minute = Column(DateTime, nullable=False)  # start of the minute bucket
+    count = Column(Integer, nullable=False, default=0)
+    sketch = Column(Text, nullable=False)  # serialized DDSketch (JSON)
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('service_name', 'operation', 'minute', name='uq_latency_sketches_service_operation_minute'),
+        Index('ix_latency_sketches_service_minute', 'service_name', 'minute'),
+        Index('ix_latency_sketches_minute', 'minute'),
+    )
@@ -0,0 +1,66 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, Text, JSON, ForeignKey, Index
+from core.database import Base
+from datetime import datetime, timezone
+
+
+class RCAJobModel(Base):
+    """Queued root cause analysis of one service over a fixed window"""
+    __tablename__ = "rca_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    dedup_key = Column(String, nullable=False, unique=True)  # hash of service, window and lag
+    service_name = Column(String, nullable=True)  # None analyzes all services
+    hours = Column(Integer, nullable=False)
+    max_lag_minutes = Column(Integer, nullable=True)
+    window_end = Column(DateTime, nullable=False)
+    status = Column(String, nullable=False, default="queued")  # queued, running, succeeded, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index('ix_rca_jobs_status_created', 'status', 'created_at'),
+    )
+
+
+class RootCauseHypothesisModel(Base):
+    """Root cause predicted by an RCA job"""
+    __tablename__ = "root_cause_hypotheses"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("rca_jobs.id"), nullable=False, index=True)
+    service_name = Column(String, nullable=True)
+    root_cause = Column(String, nullable=True)
+    confidence = Column(Float, nullable=False, default=0.0)
+    reasoning = Column(Text, nullable=True)
+    correlation_score = Column(Float, nullable=False, default=0.0)
+    model_version = Column(String, nullable=False)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+
+
+class AIDecisionModel(Base):
+    """Input and full output of one AI-assisted analysis, kept for audit and replay"""
+    __tablename__ = "ai_decisions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("rca_jobs.id"), nullable=False, index=True)
+    decision_type = Column(String, nullable=False)
+    input_snapshot = Column(JSON, nullable=False)
+    decision_output = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+
+
+class ResolvedIncidentModel(Base):
+    """Analysis whose root cause an operator confirmed, indexed for similar-incident lookup"""
+    __tablename__ = "resolved_incidents"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("rca_jobs.id"), nullable=False, unique=True)
+    service_name = Column(String, nullable=True)
+    root_cause = Column(String, nullable=False)  # confirmed, may differ from the prediction
+    notes = Column(Text, nullable=True)
+    fingerprint = Column(JSON, nullable=False)  # weighted telemetry tokens the embedding is built from
+    window_end = Column(DateTime, nullable=False)
+    resolved_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, Index
+from core.database import Base
+from datetime import datetime, timezone
+
+
+class ServiceMetricSnapshotModel(Base):
+    """Periodically computed health of one service over a standard window"""
+    __tablename__ = "service_metric_snapshots"
+
+    id = Column(Integer, primary_key=True, index=True)
+    service_name = Column(String, nullable=False)
+    service_id = Column(Integer, nullable=False, default=0)  # services.id, 0 if unregistered
+    window_hours = Column(Integer, nullable=False)
+    computed_at = Column(DateTime, nullable=False)  # shared by every row of one refresh
+    status = Column(String, nullable=False)  # healthy, degraded, critical
+    severity_score = Column(Integer, nullable=False)
+    error_rate = Column(Float, nullable=False)  # percentage
+    error_count = Column(Integer, nullable=False)
+    total_logs = Column(Integer, nullable=False)
+    avg_latency = Column(Float, nullable=False)  # milliseconds
+    span_count = Column(Integer, nullable=False)
+    event_count = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+
+    __table_args__ = (
+        Index('ix_service_metric_snapshots_window_computed', 'window_hours', 'computed_at'),
+    )
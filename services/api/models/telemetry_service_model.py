@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from core.database import Base
+from datetime import datetime, timezone
+
+
+class TelemetryServiceModel(Base):
+    """Registry of every service that has emitted telemetry"""
+    __tablename__ = "telemetry_services"
+
+    id = Column(Integer, primary_key=True, index=True)
+    service_name = Column(String, nullable=False, unique=True, index=True)
+    first_seen = Column(DateTime, nullable=False)
+    last_seen = Column(DateTime, nullable=False, index=True)
+    has_logs = Column(Boolean, nullable=False, default=False)
+    has_metrics = Column(Boolean, nullable=False, default=False)
+    has_traces = Column(Boolean, nullable=False, default=False)
+    has_events = Column(Boolean, nullable=False, default=False)
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
@@ -4,8 +4,11 @@ from core.database import get_db
 from schemas.ai_model_schema import (
     AIModelListResponseSchema,
     AIModelResponseSchema,
-    AIModelRetrainSchema
+    AIModelRetrainSchema,
+    LLMCacheStatsSchema,
+    LLMClientStatsSchema,
 )
+from services.ai_service import get_ai_service
 
 router = APIRouter(prefix="/api/ai-models", tags=["ai-models"])
 
@@ -29,6 +32,22 @@ async def list_ai_models(
     }
 
 
+@router.get("/llm-cache/stats", response_model=LLMCacheStatsSchema)
+async def get_llm_cache_stats():
+    """
+    Get hit/miss counters for the LLM result cache
+    """
+    return get_ai_service().cache.stats()
+
+
+@router.get("/llm/stats", response_model=LLMClientStatsSchema)
+async def get_llm_client_stats():
+    """
+    Get latency, error and circuit breaker metrics for LLM calls
+    """
+    return get_ai_service().client.stats()
+
+
 @router.get("/{model_id}", response_model=AIModelResponseSchema)
 async def get_ai_model(
     model_id: int,
@@ -1,7 +1,8 @@
 """
 Dashboard API routes for aggregated dashboard data
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime
@@ -14,8 +15,15 @@ from schemas.dashboard_schema import (
     IncidentVolumeResponse,
     CriticalServicesResponse,
     CorrelationEngineResponse,
+    DashboardCacheStatsResponse,
+    RCAJobResponse,
+    IncidentResolutionRequest,
+    ResolvedIncidentResponse,
 )
-from services.dashboard_service import DashboardService
+from services.dashboard_service import DashboardService, dashboard_cache
+from services.dashboard_stream_service import DashboardStreamService
+from services.rca_job_service import RCAJobService
+from services.incident_memory_service import IncidentMemoryService
 
 
 
@@ -34,11 +42,38 @@ def get_dashboard_overview(
     
     - **hours**: Time range in hours for analysis (default: 1, max: 168)
     """
-    overview = DashboardService.get_dashboard_overview(db, hours=hours)
+    try:
+        overview = DashboardService.cached(
+            db, "overview", DashboardService.get_dashboard_overview, hours=hours
+        )
+    except TimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     
     return DashboardOverviewResponse(**overview)
 
 
+@router.get("/overview/stream")
+async def stream_dashboard_overview(
+    request: Request,
+    hours: int = Query(1, ge=1, le=168),
+    db: Session = Depends(get_db),
+):
+    """
+    Subscribe to dashboard overview updates as server-sent events.
+    
+    Sends a `snapshot` event with the full overview, then `delta` events
+    carrying only changed fields and service health entries. Every
+    subscriber to the same view shares one computation.
+    
+    - **hours**: Time range in hours for analysis (default: 1, max: 168)
+    """
+    return StreamingResponse(
+        DashboardStreamService.stream(db, hours, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/services/health", response_model=ServiceHealthListResponse)
 def get_services_health(
     hours: int = Query(1, ge=1, le=168),
@@ -49,7 +84,12 @@ def get_services_health(
     
     - **hours**: Time range in hours for analysis (default: 1, max: 168)
     """
-    overview = DashboardService.get_dashboard_overview(db, hours=hours)
+    try:
+        overview = DashboardService.cached(
+            db, "overview", DashboardService.get_dashboard_overview, hours=hours
+        )
+    except TimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     
     service_health_responses = [
         ServiceHealthResponse(**health) for health in overview["service_health"]
@@ -79,6 +119,7 @@ def get_service_health(
 def get_incident_volume(
     service_name: Optional[str] = Query(None),
     hours: int = Query(24, ge=1, le=720),
+    bucket_minutes: int = Query(60, ge=1, le=1440),
     db: Session = Depends(get_db),
 ):
     """
@@ -86,9 +127,16 @@ def get_incident_volume(
     
     - **service_name**: Filter by service name (optional)
     - **hours**: Time range in hours for analysis (default: 24, max: 720)
+    - **bucket_minutes**: Width of each data point in minutes (default: 60, max: 1440)
     """
+    if hours * 60 // bucket_minutes > 5000:
+        raise HTTPException(
+            status_code=400,
+            detail="Too many buckets requested; increase bucket_minutes",
+        )
+
     trends = DashboardService.get_incident_volume_trends(
-        db, service_name=service_name, hours=hours
+        db, service_name=service_name, hours=hours, bucket_minutes=bucket_minutes
     )
     
     return IncidentVolumeResponse(**trends)
@@ -106,9 +154,16 @@ def get_critical_services(
     - **hours**: Time range in hours for analysis (default: 1, max: 168)
     - **limit**: Maximum number of services to return (default: 10, max: 50)
     """
-    critical = DashboardService.get_critical_services(
-        db, hours=hours, limit=limit
-    )
+    try:
+        critical = DashboardService.cached(
+            db,
+            "services_critical",
+            DashboardService.get_critical_services,
+            hours=hours,
+            limit=limit,
+        )
+    except TimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     
     service_health_responses = [
         ServiceHealthResponse(**health) for health in critical
@@ -125,6 +180,7 @@ def get_critical_services(
 def get_correlation_analysis(
     service_name: Optional[str] = Query(None),
     hours: int = Query(1, ge=1, le=168),
+    max_lag_minutes: Optional[int] = Query(None, ge=0, le=60),
     db: Session = Depends(get_db),
 ):
     """
@@ -135,9 +191,92 @@ def get_correlation_analysis(
     
     - **service_name**: Filter by service name (optional)
     - **hours**: Time range in hours for analysis (default: 1, max: 168)
+    - **max_lag_minutes**: Largest lead/lag tested between signals (optional)
     """
-    correlations = DashboardService.get_correlation_analysis(
-        db, service_name=service_name, hours=hours
-    )
+    try:
+        correlations = DashboardService.get_correlation_analysis(
+            db, service_name=service_name, hours=hours, max_lag_minutes=max_lag_minutes
+        )
+    except TimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     
     return CorrelationEngineResponse(**correlations)
+
+
+@router.post("/correlation-engine/jobs", response_model=RCAJobResponse, status_code=202)
+def submit_correlation_job(
+    service_name: Optional[str] = Query(None),
+    hours: int = Query(1, ge=1, le=168),
+    max_lag_minutes: Optional[int] = Query(None, ge=0, le=60),
+    db: Session = Depends(get_db),
+):
+    """
+    Queue a correlation analysis to run in the background.
+    
+    Identical requests within the same dedup window return the existing
+    job. Poll the returned job for its result.
+    
+    - **service_name**: Filter by service name (optional)
+    - **hours**: Time range in hours for analysis (default: 1, max: 168)
+    - **max_lag_minutes**: Largest lead/lag tested between signals (optional)
+    """
+    job, created = RCAJobService.submit(
+        db, service_name=service_name, hours=hours, max_lag_minutes=max_lag_minutes
+    )
+    return RCAJobResponse(
+        **RCAJobService.get_job(db, job.id), deduplicated=not created
+    )
+
+
+@router.get("/correlation-engine/jobs/{job_id}", response_model=RCAJobResponse)
+async def get_correlation_job(
+    job_id: int,
+    wait_seconds: float = Query(0, ge=0, le=30),
+    db: Session = Depends(get_db),
+):
+    """
+    Get the status of a queued correlation analysis and its result once done.
+    
+    - **job_id**: Job returned when the analysis was queued
+    - **wait_seconds**: Hold the request until the job finishes, up to this long (default: 0)
+    """
+    job = await RCAJobService.wait_for_job(db, job_id, timeout=wait_seconds)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return RCAJobResponse(**job)
+
+
+@router.put("/correlation-engine/jobs/{job_id}/resolution", response_model=ResolvedIncidentResponse)
+def resolve_correlation_job(
+    job_id: int,
+    resolution: IncidentResolutionRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    Confirm the root cause of a completed correlation analysis.
+    
+    The analysis becomes a resolved incident that later analyses with
+    similar telemetry return under similar_incidents. Repeating the call
+    updates the confirmed root cause and notes.
+    
+    - **job_id**: Succeeded job whose analysis is being resolved
+    - **root_cause**: Confirmed root cause
+    - **notes**: Resolution notes (optional)
+    """
+    try:
+        incident = IncidentMemoryService.record_resolution(
+            db, job_id, root_cause=resolution.root_cause, notes=resolution.notes
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if incident is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return ResolvedIncidentResponse(**incident)
+
+
+@router.get("/cache/stats", response_model=DashboardCacheStatsResponse)
+def get_cache_stats():
+    """
+    Get hit/miss counters for the dashboard response cache.
+    """
+    return DashboardCacheStatsResponse(**dashboard_cache.stats())
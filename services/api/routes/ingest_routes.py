@@ -0,0 +1,36 @@
+"""
+Ingest API routes for bulk NDJSON telemetry
+"""
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.orm import Session
+
+from core.database import get_db
+from schemas.ingest_schema import IngestSignalEnum, IngestResponse
+from services.ingest_service import IngestService
+
+router = APIRouter(prefix="/api/v1/ingest", tags=["ingest"])
+
+
+@router.post("/{signal}", response_model=IngestResponse)
+async def ingest_telemetry(
+    signal: IngestSignalEnum,
+    request: Request,
+    db: Session = Depends(get_db),
+):
+    """
+    Bulk-load newline-delimited JSON telemetry, gzipped or plain.
+    
+    The body is spooled first and then written in batches in one short
+    transaction. Lines that are not valid JSON or miss required fields
+    are skipped and reported; a malformed body, or one larger than
+    INGEST_MAX_BODY_BYTES, writes nothing.
+    
+    - **signal**: logs, metrics, traces or events
+    - **body**: One JSON object per line, in the telemetry-simulation fixture format
+    """
+    try:
+        result = await IngestService.ingest_stream(db, signal.value, request.stream())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return IngestResponse(**result)
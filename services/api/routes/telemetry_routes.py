@@ -1,7 +1,7 @@
 """
 Telemetry API routes for accessing raw telemetry data
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime
@@ -13,10 +13,13 @@ from schemas.telemetry_schema import (
     TracesListResponse,
     EventsListResponse,
     LogStatisticsResponse,
+    ServiceLogStatisticsResponse,
     LatencyStatisticsResponse,
     MetricStatisticsResponse,
     EventStatisticsResponse,
+    ServiceEventStatisticsResponse,
     ServiceListResponse,
+    TotalModeEnum,
 )
 from services.telemetry_service import TelemetryService
 
@@ -27,6 +30,8 @@ router = APIRouter(prefix="/api/v1/telemetry", tags=["telemetry"])
 def get_logs(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None),
+    total_mode: TotalModeEnum = Query(TotalModeEnum.EXACT),
     service_name: Optional[str] = Query(None),
     level: Optional[str] = Query(None),
     db: Session = Depends(get_db),
@@ -36,18 +41,31 @@ def get_logs(
     
     - **skip**: Number of records to skip (default: 0)
     - **limit**: Maximum records to return (default: 100, max: 1000)
+    - **cursor**: next_cursor from the previous page; takes precedence over skip (optional)
+    - **total_mode**: How to compute total: exact, estimated, or none (default: exact)
     - **service_name**: Filter by service name (optional)
     - **level**: Filter by log level (ERROR, WARN, INFO, DEBUG)
     """
-    logs, total = TelemetryService.query_logs(
-        db, service_name=service_name, level=level, skip=skip, limit=limit
-    )
+    try:
+        logs, total, next_cursor = TelemetryService.query_logs(
+            db,
+            service_name=service_name,
+            level=level,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            total_mode=total_mode.value,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return LogsListResponse(
-        data=logs,
+        items=logs,
         total=total,
+        total_mode=total_mode,
         skip=skip,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -55,6 +73,8 @@ def get_logs(
 def get_metrics(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None),
+    total_mode: TotalModeEnum = Query(TotalModeEnum.EXACT),
     service_name: Optional[str] = Query(None),
     metric_name: Optional[str] = Query(None),
     db: Session = Depends(get_db),
@@ -64,22 +84,31 @@ def get_metrics(
     
     - **skip**: Number of records to skip (default: 0)
     - **limit**: Maximum records to return (default: 100, max: 1000)
+    - **cursor**: next_cursor from the previous page; takes precedence over skip (optional)
+    - **total_mode**: How to compute total: exact, estimated, or none (default: exact)
     - **service_name**: Filter by service name (optional)
     - **metric_name**: Filter by metric name (optional)
     """
-    metrics, total = TelemetryService.query_metrics(
-        db,
-        service_name=service_name,
-        metric_name=metric_name,
-        skip=skip,
-        limit=limit,
-    )
+    try:
+        metrics, total, next_cursor = TelemetryService.query_metrics(
+            db,
+            service_name=service_name,
+            metric_name=metric_name,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            total_mode=total_mode.value,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return MetricsListResponse(
-        data=metrics,
+        items=metrics,
         total=total,
+        total_mode=total_mode,
         skip=skip,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -87,6 +116,8 @@ def get_metrics(
 def get_traces(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None),
+    total_mode: TotalModeEnum = Query(TotalModeEnum.EXACT),
     service_name: Optional[str] = Query(None),
     trace_id: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
@@ -97,24 +128,33 @@ def get_traces(
     
     - **skip**: Number of records to skip (default: 0)
     - **limit**: Maximum records to return (default: 100, max: 1000)
+    - **cursor**: next_cursor from the previous page; takes precedence over skip (optional)
+    - **total_mode**: How to compute total: exact, estimated, or none (default: exact)
     - **service_name**: Filter by service name (optional)
     - **trace_id**: Filter by trace ID (optional)
     - **status**: Filter by trace status (optional)
     """
-    traces, total = TelemetryService.query_traces(
-        db,
-        service_name=service_name,
-        trace_id=trace_id,
-        status=status,
-        skip=skip,
-        limit=limit,
-    )
+    try:
+        traces, total, next_cursor = TelemetryService.query_traces(
+            db,
+            service_name=service_name,
+            trace_id=trace_id,
+            status=status,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            total_mode=total_mode.value,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return TracesListResponse(
-        data=traces,
+        items=traces,
         total=total,
+        total_mode=total_mode,
         skip=skip,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -122,6 +162,8 @@ def get_traces(
 def get_events(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None),
+    total_mode: TotalModeEnum = Query(TotalModeEnum.EXACT),
     service_name: Optional[str] = Query(None),
     event_type: Optional[str] = Query(None),
     severity: Optional[str] = Query(None),
@@ -132,24 +174,33 @@ def get_events(
     
     - **skip**: Number of records to skip (default: 0)
     - **limit**: Maximum records to return (default: 100, max: 1000)
+    - **cursor**: next_cursor from the previous page; takes precedence over skip (optional)
+    - **total_mode**: How to compute total: exact, estimated, or none (default: exact)
     - **service_name**: Filter by service name (optional)
     - **event_type**: Filter by event type (optional)
     - **severity**: Filter by severity level (optional)
     """
-    events, total = TelemetryService.query_events(
-        db,
-        service_name=service_name,
-        event_type=event_type,
-        severity=severity,
-        skip=skip,
-        limit=limit,
-    )
+    try:
+        events, total, next_cursor = TelemetryService.query_events(
+            db,
+            service_name=service_name,
+            event_type=event_type,
+            severity=severity,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            total_mode=total_mode.value,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return EventsListResponse(
-        data=events,
+        items=events,
         total=total,
+        total_mode=total_mode,
         skip=skip,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -168,6 +219,16 @@ def get_log_statistics(
     return LogStatisticsResponse(**stats)
 
 
+@router.get("/logs/statistics/services", response_model=ServiceLogStatisticsResponse)
+def get_log_statistics_by_service(db: Session = Depends(get_db)):
+    """
+    Get log statistics for every service in a single pass.
+    """
+    stats = TelemetryService.get_log_statistics_by_service(db)
+    
+    return ServiceLogStatisticsResponse(services=stats)
+
+
 @router.get("/latency/statistics", response_model=LatencyStatisticsResponse)
 def get_latency_statistics(
     service_name: Optional[str] = Query(None),
@@ -191,6 +252,8 @@ def get_latency_statistics(
 def get_metric_statistics(
     metric_name: str = Query(...),
     service_name: Optional[str] = Query(None),
+    percentiles: bool = Query(False),
+    rate_of_change: bool = Query(False),
     db: Session = Depends(get_db),
 ):
     """
@@ -198,9 +261,15 @@ def get_metric_statistics(
     
     - **metric_name**: Name of the metric (required)
     - **service_name**: Filter by service name (optional)
+    - **percentiles**: Also return p50, p95 and p99 (default: false)
+    - **rate_of_change**: Also return the trend in units per second (default: false)
     """
     stats = TelemetryService.get_metric_statistics(
-        db, metric_name=metric_name, service_name=service_name
+        db,
+        metric_name=metric_name,
+        service_name=service_name,
+        percentiles=percentiles,
+        rate_of_change=rate_of_change,
     )
     
     return MetricStatisticsResponse(**stats)
@@ -221,6 +290,16 @@ def get_event_statistics(
     return EventStatisticsResponse(**stats)
 
 
+@router.get("/events/statistics/services", response_model=ServiceEventStatisticsResponse)
+def get_event_statistics_by_service(db: Session = Depends(get_db)):
+    """
+    Get event statistics for every service in a single pass.
+    """
+    stats = TelemetryService.get_event_statistics_by_service(db)
+    
+    return ServiceEventStatisticsResponse(services=stats)
+
+
 @router.get("/services", response_model=ServiceListResponse)
 def get_services(db: Session = Depends(get_db)):
     """
@@ -228,4 +307,4 @@ def get_services(db: Session = Depends(get_db)):
     """
     services = TelemetryService.get_service_list(db)
     
-    return ServiceListResponse(services=services)
+    return ServiceListResponse(services=services, count=len(services))
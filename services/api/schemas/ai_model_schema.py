@@ -57,3 +57,27 @@ class AIModelRetrainSchema(BaseModel):
     model_id: int
     training_data_start: datetime
     training_data_end: datetime
+
+
+class LLMCacheStatsSchema(BaseModel):
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    writes: int
+    hit_rate: float
+    memory_size: int
+    disk_enabled: bool
+
+
+class LLMClientStatsSchema(BaseModel):
+    calls: int
+    successes: int
+    errors: int
+    timeouts: int
+    short_circuited: int
+    in_flight: int
+    latency_p50_ms: Optional[float] = None
+    latency_p95_ms: Optional[float] = None
+    latency_p99_ms: Optional[float] = None
+    circuit_state: str  # closed, open, half_open
+    max_concurrency: int
@@ -43,6 +43,7 @@ class IncidentVolumeResponse(BaseModel):
     """Response model for incident volume trends"""
     service_name: str
     time_range_hours: int
+    bucket_minutes: int = Field(60, description="Width of each data point bucket in minutes")
     data_points: List[IncidentVolumeDataPoint]
 
 
@@ -63,6 +64,16 @@ class CorrelationDetail(BaseModel):
     avg_slow_duration: Optional[float] = None
 
 
+class SignalCorrelation(BaseModel):
+    """Lagged cross-correlation between two per-minute signals"""
+    source_service: str
+    source_signal: str
+    target_service: str
+    target_signal: str
+    lag_minutes: int = Field(..., description="Minutes by which the source leads the target")
+    coefficient: float
+
+
 class AIPrediction(BaseModel):
     """AI-predicted root cause"""
     root_cause: Optional[str]
@@ -70,6 +81,18 @@ class AIPrediction(BaseModel):
     reasoning: str
 
 
+class SimilarIncident(BaseModel):
+    """Past resolved incident resembling the analyzed telemetry"""
+    incident_id: int
+    job_id: int
+    service_name: Optional[str] = None
+    root_cause: str = Field(..., description="Root cause confirmed when the incident was resolved")
+    notes: Optional[str] = None
+    window_end: datetime
+    resolved_at: datetime
+    similarity: float = Field(..., description="Cosine similarity of the telemetry fingerprints")
+
+
 class CorrelationEngineResponse(BaseModel):
     """Response model for correlation analysis with AI predictions"""
     service_name: str
@@ -78,8 +101,45 @@ class CorrelationEngineResponse(BaseModel):
     events_count: int
     slow_traces_count: int
     correlations: List[CorrelationDetail] = Field(default_factory=list)
+    signal_correlations: List[SignalCorrelation] = Field(default_factory=list)
+    signal_bucket_minutes: int = Field(1, description="Bucket width used for signal correlations")
     ai_prediction: AIPrediction
     correlation_score: float
+    similar_incidents: List[SimilarIncident] = Field(default_factory=list)
+
+
+class RCAJobResponse(BaseModel):
+    """Response model for a queued correlation analysis"""
+    id: int
+    status: str = Field(..., description="queued, running, succeeded or failed")
+    service_name: Optional[str] = None
+    hours: int
+    max_lag_minutes: Optional[int] = None
+    window_end: datetime = Field(..., description="End of the analyzed window")
+    attempts: int
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    deduplicated: bool = Field(False, description="Submission matched an existing job")
+    result: Optional[CorrelationEngineResponse] = None
+
+
+class IncidentResolutionRequest(BaseModel):
+    """Root cause confirmed for a completed correlation analysis"""
+    root_cause: str = Field(..., min_length=1)
+    notes: Optional[str] = None
+
+
+class ResolvedIncidentResponse(BaseModel):
+    """Response model for a resolved incident"""
+    incident_id: int
+    job_id: int
+    service_name: Optional[str] = None
+    root_cause: str
+    notes: Optional[str] = None
+    window_end: datetime
+    resolved_at: datetime
 
 
 class DashboardOverviewResponse(BaseModel):
@@ -96,6 +156,18 @@ class DashboardOverviewResponse(BaseModel):
     service_health: List[ServiceHealthResponse]
 
 
+class DashboardCacheStatsResponse(BaseModel):
+    """Hit/miss counters for the dashboard response cache"""
+    hits: int
+    stale_hits: int = Field(..., description="Stale entries served while refreshing in the background")
+    misses: int
+    coalesced: int = Field(..., description="Requests that waited on an identical in-flight computation")
+    refresh_errors: int
+    hit_rate: float
+    size: int
+    inflight: int
+
+
 # Legacy schemas for backward compatibility
 class TrendSchema(BaseModel):
     """Legacy trend schema"""
@@ -0,0 +1,22 @@
+"""
+Pydantic models for telemetry ingestion
+"""
+from pydantic import BaseModel, Field
+from typing import List
+from enum import Enum
+
+
+class IngestSignalEnum(str, Enum):
+    """Telemetry signals accepted by the ingest API"""
+    LOGS = "logs"
+    METRICS = "metrics"
+    TRACES = "traces"
+    EVENTS = "events"
+
+
+class IngestResponse(BaseModel):
+    """Outcome of one NDJSON ingest batch"""
+    signal: IngestSignalEnum
+    accepted: int = Field(..., description="Rows written")
+    rejected: int = Field(..., description="Lines skipped as invalid JSON or missing required fields")
+    errors: List[str] = Field(default_factory=list, description="First rejected lines and why")
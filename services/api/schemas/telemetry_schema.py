@@ -2,7 +2,7 @@
 Pydantic models for telemetry responses
 """
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 from enum import Enum
 
@@ -15,6 +15,13 @@ class LogLevelEnum(str, Enum):
     ERROR = "ERROR"
 
 
+class TotalModeEnum(str, Enum):
+    """How list endpoints compute their total"""
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
 class LogResponse(BaseModel):
     """Response model for log entries"""
     id: int
@@ -31,10 +38,12 @@ class LogResponse(BaseModel):
 
 class LogsListResponse(BaseModel):
     """Paginated response for logs"""
-    total: int
+    total: Optional[int] = Field(None, description="Row count, approximate when total_mode is estimated")
+    total_mode: TotalModeEnum = TotalModeEnum.EXACT
     skip: int
     limit: int
     items: List[LogResponse]
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
 
 
 class MetricsResponse(BaseModel):
@@ -53,10 +62,12 @@ class MetricsResponse(BaseModel):
 
 class MetricsListResponse(BaseModel):
     """Paginated response for metrics"""
-    total: int
+    total: Optional[int] = Field(None, description="Row count, approximate when total_mode is estimated")
+    total_mode: TotalModeEnum = TotalModeEnum.EXACT
     skip: int
     limit: int
     items: List[MetricsResponse]
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
 
 
 class TracesResponse(BaseModel):
@@ -78,10 +89,12 @@ class TracesResponse(BaseModel):
 
 class TracesListResponse(BaseModel):
     """Paginated response for traces"""
-    total: int
+    total: Optional[int] = Field(None, description="Row count, approximate when total_mode is estimated")
+    total_mode: TotalModeEnum = TotalModeEnum.EXACT
     skip: int
     limit: int
     items: List[TracesResponse]
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
 
 
 class EventResponse(BaseModel):
@@ -100,10 +113,12 @@ class EventResponse(BaseModel):
 
 class EventsListResponse(BaseModel):
     """Paginated response for events"""
-    total: int
+    total: Optional[int] = Field(None, description="Row count, approximate when total_mode is estimated")
+    total_mode: TotalModeEnum = TotalModeEnum.EXACT
     skip: int
     limit: int
     items: List[EventResponse]
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
 
 
 class LogStatisticsResponse(BaseModel):
@@ -114,6 +129,12 @@ class LogStatisticsResponse(BaseModel):
     info_count: int
     debug_count: int
     error_rate: float = Field(..., description="Error rate as percentage")
+    by_level: dict = Field(default_factory=dict, description="Counts for every level present")
+
+
+class ServiceLogStatisticsResponse(BaseModel):
+    """Response model for log statistics of every service"""
+    services: Dict[str, LogStatisticsResponse]
 
 
 class LatencyStatisticsResponse(BaseModel):
@@ -134,6 +155,10 @@ class MetricStatisticsResponse(BaseModel):
     max: float
     min: float
     stddev: float
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+    rate_of_change: Optional[float] = Field(None, description="Least-squares trend in units per second")
 
 
 class EventStatisticsResponse(BaseModel):
@@ -143,6 +168,11 @@ class EventStatisticsResponse(BaseModel):
     by_severity: dict = Field(default_factory=dict)
 
 
+class ServiceEventStatisticsResponse(BaseModel):
+    """Response model for event statistics of every service"""
+    services: Dict[str, EventStatisticsResponse]
+
+
 class ServiceListResponse(BaseModel):
     """Response model for list of services"""
     services: List[str]
@@ -0,0 +1,162 @@
+"""Benchmark /api/v1/dashboard/correlation-engine latency and throughput under concurrent load.
+
+Runs against a live API. For an offline, repeatable AI path, start the API with
+LLM_BACKEND=replay (optionally LLM_REPLAY_LATENCY_MS / LLM_REPLAY_ERROR_RATE),
+or point LLM_BASE_URL at scripts/llm_stub_server.py. Set
+LOCAL_RCA_CONFIDENCE_THRESHOLD above 1 to force every request through the LLM,
+and LLM_CACHE_TTL_SECONDS=0 to measure uncached calls.
+
+    python scripts/benchmark_correlation_engine.py --concurrency 16 --requests 400 --hours 6
+"""
+import argparse
+import json
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(q * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def fetch_json(url, timeout):
+    """GET a JSON document, or None if the endpoint is unavailable."""
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return json.loads(response.read())
+    except (urllib.error.URLError, ValueError):
+        return None
+
+
+def timed_request(url, timeout):
+    """Returns (latency_seconds, status) where status 0 means a transport error."""
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except (urllib.error.URLError, TimeoutError, ConnectionError):
+        status = 0
+    return time.perf_counter() - start, status
+
+
+def run(url, concurrency, total_requests, duration, timeout):
+    """Issue requests from concurrency workers until the count or duration is reached."""
+    results = []
+    lock = threading.Lock()
+    issued = [0]
+    deadline = time.perf_counter() + duration if duration else None
+
+    def worker():
+        while True:
+            with lock:
+                if deadline is None and issued[0] >= total_requests:
+                    return
+                issued[0] += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            result = timed_request(url, timeout)
+            with lock:
+                results.append(result)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(worker)
+    return results, time.perf_counter() - start
+
+
+def summarize(results, elapsed):
+    latencies = sorted(latency * 1000 for latency, status in results if status == 200)
+    statuses = {}
+    for _, status in results:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    return {
+        "requests": len(results),
+        "succeeded": len(latencies),
+        "statuses": statuses,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies), 1) if latencies else 0.0,
+            "p50": round(percentile(latencies, 0.50), 1),
+            "p90": round(percentile(latencies, 0.90), 1),
+            "p95": round(percentile(latencies, 0.95), 1),
+            "p99": round(percentile(latencies, 0.99), 1),
+            "max": round(latencies[-1], 1) if latencies else 0.0,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the correlation engine endpoint")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200, help="Total requests (ignored with --duration)")
+    parser.add_argument("--duration", type=float, help="Run for this many seconds instead of a fixed count")
+    parser.add_argument("--warmup", type=int, default=3, help="Sequential requests before measuring")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--hours", type=int, default=1)
+    parser.add_argument("--service-name")
+    parser.add_argument("--max-lag-minutes", type=int)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    params = {"hours": args.hours}
+    if args.service_name:
+        params["service_name"] = args.service_name
+    if args.max_lag_minutes is not None:
+        params["max_lag_minutes"] = args.max_lag_minutes
+    base = args.base_url.rstrip("/")
+    url = f"{base}/api/v1/dashboard/correlation-engine?{urllib.parse.urlencode(params)}"
+
+    for _ in range(args.warmup):
+        timed_request(url, args.timeout)
+
+    llm_before = fetch_json(f"{base}/api/ai-models/llm/stats", args.timeout)
+    results, elapsed = run(url, args.concurrency, args.requests, args.duration, args.timeout)
+    report = summarize(results, elapsed)
+    report["concurrency"] = args.concurrency
+    report["url"] = url
+
+    llm_after = fetch_json(f"{base}/api/ai-models/llm/stats", args.timeout)
+    if llm_before and llm_after:
+        report["llm"] = {
+            stat: llm_after[stat] - llm_before[stat]
+            for stat in ("calls", "successes", "errors", "timeouts", "short_circuited")
+        }
+        report["llm"]["latency_p95_ms"] = llm_after.get("latency_p95_ms")
+        report["llm"]["circuit_state"] = llm_after.get("circuit_state")
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    latency = report["latency_ms"]
+    print(f"{report['requests']} requests, {args.concurrency} concurrent, {report['elapsed_s']}s")
+    print(f"  statuses:   {report['statuses']}")
+    print(f"  throughput: {report['throughput_rps']} req/s")
+    print(
+        f"  latency ms: mean {latency['mean']}  p50 {latency['p50']}  p90 {latency['p90']}  "
+        f"p95 {latency['p95']}  p99 {latency['p99']}  max {latency['max']}"
+    )
+    if "llm" in report:
+        llm = report["llm"]
+        print(
+            f"  llm:        {llm['calls']} calls, {llm['errors']} errors, {llm['timeouts']} timeouts, "
+            f"{llm['short_circuited']} short-circuited, p95 {llm['latency_p95_ms']}ms, "
+            f"circuit {llm['circuit_state']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Fail when importing the API gets slower than a budget or pulls in heavy modules.
+
+Imports the app in a fresh interpreter under `python -X importtime`, prints the
+slowest modules and exits non-zero if the cumulative import time of the target
+module exceeds the budget, or if a module that should load lazily (LangChain,
+the Groq client, NumPy) was imported at startup. Suitable as a CI step.
+
+    python scripts/check_import_time.py --budget-ms 1500 --top 15
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from dotenv import load_dotenv
+
+api_dir = Path(__file__).parent.parent
+
+# Load environment variables from api/.env so settings validate in the child process
+env_path = api_dir / '.env'
+if env_path.exists():
+    load_dotenv(env_path)
+else:
+    print(f"Warning: .env file not found at {env_path}")
+
+# Only loaded on first use of the AI or correlation paths
+DEFERRED_MODULES = ("langchain", "langchain_core", "langchain_groq", "groq", "numpy")
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def measure(module, runs):
+    """
+    Import module in fresh interpreters and keep the fastest run.
+
+    Returns {module_name: (self_us, cumulative_us, depth)} for every module imported.
+    """
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=api_dir,
+            env=os.environ.copy(),
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            tail = "\n".join(result.stderr.strip().splitlines()[-5:])
+            raise RuntimeError(f"import {module} failed:\n{tail}")
+
+        timings = {}
+        for line in result.stderr.splitlines():
+            match = _LINE.match(line)
+            if match:
+                self_us, cumulative_us, indent, name = match.groups()
+                timings[name] = (int(self_us), int(cumulative_us), len(indent) // 2)
+        if best is None or timings.get(module, (0, 0))[1] < best.get(module, (0, 0))[1]:
+            best = timings
+    return best or {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the API import time budget")
+    parser.add_argument("--module", default="main", help="Module to import")
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="Maximum cumulative import time")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters to try; the fastest counts")
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list")
+    args = parser.parse_args()
+
+    try:
+        timings = measure(args.module, args.runs)
+    except RuntimeError as e:
+        print(str(e))
+        sys.exit(2)
+
+    total_ms = timings.get(args.module, (0, 0, 0))[1] / 1000
+    print(f"import {args.module}: {total_ms:.1f}ms (budget {args.budget_ms:.0f}ms), {len(timings)} modules")
+    print("Slowest modules (self ms / cumulative ms):")
+    slowest = sorted(timings.items(), key=lambda item: -item[1][0])[: args.top]
+    for name, (self_us, cumulative_us, _) in slowest:
+        print(f"  {self_us / 1000:8.1f} {cumulative_us / 1000:9.1f}  {name}")
+
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append(f"import took {total_ms:.1f}ms, over the {args.budget_ms:.0f}ms budget")
+    eager = sorted(name for name in timings if name in DEFERRED_MODULES)
+    if eager:
+        failures.append(f"modules meant to load lazily were imported at startup: {', '.join(eager)}")
+
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
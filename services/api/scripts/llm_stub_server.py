@@ -0,0 +1,152 @@
+"""OpenAI-compatible LLM stub server replaying recorded responses.
+
+Serves /v1/chat/completions (and the Groq-style /openai/v1/chat/completions)
+with configurable latency, jitter and error rate, streaming or not. Point the
+API at it with LLM_BASE_URL=http://127.0.0.1:9000 and any GROQ_API_KEY.
+Recordings are JSONL files written by the API with LLM_RECORD_PATH set.
+
+    python scripts/llm_stub_server.py --recordings llm.jsonl --latency-ms 800 --jitter-ms 200 --error-rate 0.02
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add parent directory to path to import core module
+api_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(api_dir))
+
+# Load environment variables from api/.env
+env_path = api_dir / '.env'
+if env_path.exists():
+    load_dotenv(env_path)
+else:
+    print(f"Warning: .env file not found at {env_path}")
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from core.llm_backends import FaultProfile, ReplayBook
+
+
+def create_app(book, faults, chunk_size=16, chunk_interval_ms=0.0):
+    """Build the stub application around a replay book and fault profile."""
+    app = FastAPI(title="LLM stub server")
+    stats = {"requests": 0, "streamed": 0, "failures": 0}
+
+    def completion_id():
+        return f"chatcmpl-stub-{uuid.uuid4().hex[:12]}"
+
+    def prompt_of(body):
+        messages = body.get("messages", [])
+        user = [m.get("content", "") for m in messages if m.get("role") == "user"]
+        return user[-1] if user else ""
+
+    async def stream(response, model):
+        id_ = completion_id()
+        created = int(time.time())
+
+        def chunk(delta, finish_reason=None):
+            payload = {
+                "id": id_,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            return f"data: {json.dumps(payload)}\n\n"
+
+        yield chunk({"role": "assistant", "content": ""})
+        for start in range(0, len(response), chunk_size):
+            if chunk_interval_ms:
+                await asyncio.sleep(chunk_interval_ms / 1000)
+            yield chunk({"content": response[start:start + chunk_size]})
+        yield chunk({}, finish_reason="stop")
+        yield "data: [DONE]\n\n"
+
+    async def chat_completions(request: Request):
+        body = await request.json()
+        stats["requests"] += 1
+        delay, fail = faults.sample()
+        await asyncio.sleep(delay)
+        if fail:
+            stats["failures"] += 1
+            return JSONResponse(
+                status_code=500,
+                content={"error": {"message": "Injected stub failure", "type": "server_error"}},
+            )
+
+        prompt = prompt_of(body)
+        response = book.response_for(prompt)
+        model = body.get("model", "stub")
+        if body.get("stream"):
+            stats["streamed"] += 1
+            return StreamingResponse(stream(response, model), media_type="text/event-stream")
+
+        prompt_tokens = len(prompt) // 4
+        completion_tokens = len(response) // 4
+        return {
+            "id": completion_id(),
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": response},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    app.add_api_route("/v1/chat/completions", chat_completions, methods=["POST"])
+    app.add_api_route("/openai/v1/chat/completions", chat_completions, methods=["POST"])
+
+    @app.get("/v1/models")
+    @app.get("/openai/v1/models")
+    async def models():
+        return {"object": "list", "data": [{"id": "stub", "object": "model", "owned_by": "stub"}]}
+
+    @app.get("/stats")
+    async def get_stats():
+        return {**stats, "recordings": len(book)}
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded LLM responses over an OpenAI-compatible API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--recordings", help="JSONL file of recorded responses")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay before each response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform +/- jitter added to the delay")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 500")
+    parser.add_argument("--chunk-size", type=int, default=16, help="Characters per streamed chunk")
+    parser.add_argument("--chunk-interval-ms", type=float, default=0.0, help="Delay between streamed chunks")
+    parser.add_argument("--seed", type=int, help="Seed for reproducible jitter and failures")
+    args = parser.parse_args()
+
+    book = ReplayBook(args.recordings)
+    faults = FaultProfile(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    print(f"Serving {len(book)} recorded responses on http://{args.host}:{args.port}")
+    app = create_app(book, faults, args.chunk_size, args.chunk_interval_ms)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
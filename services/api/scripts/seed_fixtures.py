@@ -17,6 +17,9 @@ else:
     print(f"Warning: .env file not found at {env_path}")
 
 from core.database import SessionLocal
+from services.latency_rollup_service import LatencyRollupService
+from services.service_registry_service import ServiceRegistryService
+from services.event_rollup_service import EventRollupService
 from sqlalchemy import text
 
 # Find fixtures path relative to project root
@@ -200,6 +203,18 @@ def main():
                     scenarios[scenario_name]['events'] = count
                     print(f"  ✓ Events: {count} records")
         
+        # Rebuild the per-minute latency rollup from the seeded traces
+        print("\n🔄 Rebuilding telemetry rollups")
+        rollup_rows = LatencyRollupService.rebuild(db_session)
+        print(f"  ✓ Latency sketches: {rollup_rows} rows")
+        
+        # Register every seeded service in the telemetry service registry
+        registered = ServiceRegistryService.rebuild(db_session)
+        print(f"  ✓ Service registry: {registered} services")
+        
+        event_rollup_rows = EventRollupService.refresh(db_session)
+        print(f"  ✓ Event hourly counts: {event_rollup_rows} rows")
+        
         # Print summary
         print("\n" + "="*60)
         print("📊 SEEDING SUMMARY")
@@ -4,48 +4,160 @@ AI service for ML-powered analysis using LangChain + Groq
 from typing import Dict, Any, List, Optional
 from core.config import get_logger
 import json
-import os
+import threading
 from core.config import settings
-
-try:
-    from langchain_groq import ChatGroq
-    from langchain_core.messages import HumanMessage
-except ImportError:
-    ChatGroq = None
-    HumanMessage = None
+from core.json_stream import JSONObjectStream, parse_json_object
+from core.llm_backends import LLMBackend, create_backend
+from core.llm_cache import LLMResultCache
+from core.llm_client import CircuitBreaker, LLMClient
+from core.root_cause_classifier import ROOT_CAUSE_LABELS, RootCauseClassifier
+from core.telemetry_summary import summarize_telemetry
 
 logger = get_logger(__name__)
 
+_instance: Optional["AIService"] = None
+_instance_lock = threading.Lock()
+
+MODEL_NAME = "openai/gpt-oss-120b"
+
+ROOT_CAUSES = ", ".join(ROOT_CAUSE_LABELS)
+
 
 class AIService:
     """Service for AI/ML-powered analysis using LangChain + Groq"""
 
-    def __init__(self):
-        api_key = settings.GROQ_API_KEY or os.getenv("GROQ_API_KEY")
-        if not api_key:
-            logger.warning("GROQ_API_KEY not set, AI features will be limited")
-            self.llm = None
-        else:
-            try:
-                self.llm = ChatGroq(
-                    model="openai/gpt-oss-120b",
-                    temperature=0.3,
-                    groq_api_key=api_key,
-                )
-            except Exception as e:
-                logger.error(f"Failed to initialize ChatGroq: {str(e)}")
-                self.llm = None
+    def __init__(self, backend: Optional[LLMBackend] = None):
+        self.model_name = MODEL_NAME
+        self.classifier = RootCauseClassifier()
+        self.cache = LLMResultCache(
+            maxsize=settings.LLM_CACHE_SIZE,
+            ttl=settings.LLM_CACHE_TTL_SECONDS,
+            path=settings.LLM_CACHE_PATH,
+        )
+        self.llm = backend if backend is not None else create_backend(self.model_name)
+        self.client = LLMClient(
+            self._ainvoke,
+            max_concurrency=settings.LLM_MAX_CONCURRENCY,
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+            breaker=CircuitBreaker(
+                failure_threshold=settings.LLM_BREAKER_FAILURE_THRESHOLD,
+                reset_timeout=settings.LLM_BREAKER_RESET_SECONDS,
+            ),
+        )
+
+    async def _ainvoke(self, prompt: str) -> str:
+        """Send one prompt to the LLM backend without blocking the event loop."""
+        return await self.llm.ainvoke(prompt)
+
+    async def _astream_json(self, prompt: str) -> str:
+        """
+        Stream a response from the LLM backend and stop reading once a JSON object closes.
+
+        Returns the object text, or the raw response if it never contained one.
+        """
+        stream = JSONObjectStream()
+        received = []
+        chunks = self.llm.astream(prompt)
+        try:
+            async for chunk in chunks:
+                received.append(chunk)
+                if stream.feed(chunk) is not None:
+                    return stream.complete
+        finally:
+            # Release the provider connection as soon as the object is complete
+            await chunks.aclose()
+        return "".join(received)
+
+    def _local_root_cause(
+        self,
+        error_logs: List[Dict[str, Any]],
+        events: List[Dict[str, Any]],
+        traces: List[Dict[str, Any]],
+        signal_correlations: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Root cause from the offline classifier, without per-label scores."""
+        prediction = self.classifier.predict(error_logs, events, traces, signal_correlations)
+        return {
+            "root_cause": prediction["root_cause"],
+            "confidence": prediction["confidence"],
+            "reasoning": prediction["reasoning"],
+        }
+
+    @staticmethod
+    def _score(value: Any, default: float) -> float:
+        """LLM-reported score as a float clamped to [0, 1], or default if it is not a number."""
+        try:
+            return min(1.0, max(0.0, float(value)))
+        except (TypeError, ValueError):
+            return default
+
+    def _heuristic_correlation_score(
+        self,
+        error_logs: List[Dict[str, Any]],
+        events: List[Dict[str, Any]],
+        traces: List[Dict[str, Any]],
+    ) -> float:
+        """Fraction of additional signal types present alongside the first one."""
+        present = sum(1 for signal in (error_logs, events, traces) if signal)
+        return max(0, present - 1) / 2
+
+    def _heuristic_severity(
+        self,
+        error_rate: float,
+        error_count: int,
+        affected_services: int,
+    ) -> Dict[str, Any]:
+        """Threshold-based severity used when the LLM is unavailable."""
+        factors = {
+            "error_rate": error_rate,
+            "error_count": error_count,
+            "affected_services": affected_services,
+        }
+        if error_rate > 30 or error_count > 100:
+            return {"severity": "critical", "confidence": 0.7, "factors": factors}
+        return {"severity": "medium", "confidence": 0.5, "factors": factors}
 
-    def predict_root_cause(
+    def _prepare_telemetry_summary(
         self,
         error_logs: List[Dict[str, Any]],
         events: List[Dict[str, Any]],
         traces: List[Dict[str, Any]],
+        totals: Optional[Dict[str, int]] = None,
+    ) -> str:
+        """
+        Prepare a summary of telemetry data for Groq analysis.
+
+        Repeated messages are collapsed into templates with counts and the
+        most salient ones are kept within LLM_SUMMARY_TOKEN_BUDGET. The lists
+        may be samples; totals carries the full counts when they differ.
+        """
+        return summarize_telemetry(
+            error_logs,
+            events,
+            traces,
+            totals=totals,
+            token_budget=settings.LLM_SUMMARY_TOKEN_BUDGET,
+            slow_trace_ms=settings.CORRELATION_SLOW_TRACE_MS,
+        )
+
+    def analyze_incident(
+        self,
+        error_logs: List[Dict[str, Any]],
+        events: List[Dict[str, Any]],
+        traces: List[Dict[str, Any]],
+        totals: Optional[Dict[str, int]] = None,
+        signal_correlations: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """
-        Use Groq AI via LangChain to predict root cause based on telemetry data.
-        
-        Returns predicted root cause with confidence score.
+        Predict the root cause and score signal correlation in a single Groq call.
+
+        The offline classifier answers first, with a heuristic correlation
+        score, when its confidence reaches LOCAL_RCA_CONFIDENCE_THRESHOLD or
+        Groq is unavailable. Otherwise the response is streamed and parsed as
+        soon as its JSON object closes. A root cause outside
+        ROOT_CAUSE_LABELS falls back to the classifier's answer.
+
+        Returns root_cause, confidence, reasoning and correlation_score.
         """
         try:
             if not error_logs and not events and not traces:
@@ -53,141 +165,73 @@ class AIService:
                     "root_cause": None,
                     "confidence": 0.0,
                     "reasoning": "No telemetry data to analyze",
+                    "correlation_score": 0.0,
                 }
 
-            if not self.llm:
-                logger.warning("Groq LLM not available")
-                return {
-                    "root_cause": None,
-                    "confidence": 0.0,
-                    "reasoning": "AI service not configured",
-                }
+            local = self._local_root_cause(error_logs, events, traces, signal_correlations)
+            local["correlation_score"] = self._heuristic_correlation_score(
+                error_logs, events, traces
+            )
+            if local["confidence"] >= settings.LOCAL_RCA_CONFIDENCE_THRESHOLD or not self.llm:
+                return local
 
-            # Prepare telemetry summary
             telemetry_summary = self._prepare_telemetry_summary(
-                error_logs, events, traces
+                error_logs, events, traces, totals
             )
 
-            # Create prompt for Groq
-            prompt = f"""Analyze the following incident telemetry data and predict the root cause.
+            prompt = f"""Analyze the following incident telemetry data.
 
 TELEMETRY DATA:
 {telemetry_summary}
 
-Based on this data, provide a JSON response with:
-1. root_cause: the predicted root cause (one of: deployment_failure, config_error, resource_exhaustion, cascading_failure, network_issue, database_bottleneck, memory_leak, external_service_failure, traffic_spike, code_bug)
-2. confidence: confidence score between 0 and 1
+Provide a JSON object with:
+1. root_cause: the predicted root cause (one of: {ROOT_CAUSES})
+2. confidence: confidence score for the root cause between 0 and 1
 3. reasoning: brief explanation for the prediction
+4. correlation_score: how strongly these signals belong to one incident, between 0 (independent issues) and 1 (clearly related)
 
 Respond ONLY with valid JSON, no markdown formatting."""
 
-            # Call Groq via LangChain
-            message = self.llm.invoke([HumanMessage(content=prompt)])
-            response_text = message.content
-
-            # Clean up response if needed
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.startswith("```"):
-                response_text = response_text[3:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            response_text = response_text.strip()
+            cache_key = LLMResultCache.key(self.model_name, "analyze_incident", prompt)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-            prediction = json.loads(response_text)
+            try:
+                response_text = self.client.complete(prompt, invoke=self._astream_json)
+            except Exception as e:
+                logger.warning(f"Falling back to local incident analysis: {str(e)}")
+                return local
 
-            return {
-                "root_cause": prediction.get("root_cause"),
-                "confidence": min(1.0, max(0.0, prediction.get("confidence", 0.5))),
-                "reasoning": prediction.get("reasoning", ""),
-            }
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse Groq response: {str(e)}")
-            return {
-                "root_cause": None,
-                "confidence": 0.0,
-                "reasoning": "Failed to parse AI response",
+            try:
+                analysis = parse_json_object(response_text)
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse Groq response: {str(e)}")
+                return local
+
+            root_cause = str(analysis.get("root_cause") or "").strip().lower()
+            if root_cause not in ROOT_CAUSE_LABELS:
+                # Only labels the dashboard and incident memory know are kept
+                logger.warning(f"Groq returned unknown root cause {root_cause!r}; using local label")
+                return local
+
+            result = {
+                "root_cause": root_cause,
+                "confidence": self._score(analysis.get("confidence"), 0.5),
+                "reasoning": analysis.get("reasoning", ""),
+                "correlation_score": self._score(analysis.get("correlation_score"), 0.5),
             }
+            self.cache.set(cache_key, result)
+            return result
         except Exception as e:
-            logger.error(f"Error predicting root cause with Groq: {str(e)}")
+            logger.error(f"Error analyzing incident with Groq: {str(e)}")
             return {
                 "root_cause": None,
                 "confidence": 0.0,
                 "reasoning": f"Analysis failed: {str(e)}",
+                "correlation_score": 0.5,
             }
 
-    def _prepare_telemetry_summary(
-        self,
-        error_logs: List[Dict[str, Any]],
-        events: List[Dict[str, Any]],
-        traces: List[Dict[str, Any]],
-    ) -> str:
-        """Prepare a summary of telemetry data for Groq analysis."""
-        summary = f"""
-Error Logs ({len(error_logs)} total):
-"""
-        if error_logs:
-            for log in error_logs[:5]:
-                summary += f"  - [{log.get('level')}] {log.get('message', '')}\n"
-            if len(error_logs) > 5:
-                summary += f"  ... and {len(error_logs) - 5} more\n"
-
-        summary += f"""
-Events ({len(events)} total):
-"""
-        if events:
-            for event in events[:5]:
-                summary += f"  - [{event.get('type')}] {event.get('description', '')} (severity: {event.get('severity')})\n"
-            if len(events) > 5:
-                summary += f"  ... and {len(events) - 5} more\n"
-
-        summary += f"""
-Slow Traces ({len(traces)} total, >2000ms):
-"""
-        if traces:
-            for trace in traces[:5]:
-                summary += f"  - {trace.get('operation')} - {trace.get('duration')}ms\n"
-            if len(traces) > 5:
-                summary += f"  ... and {len(traces) - 5} more\n"
-
-        return summary
-
-    def score_correlation(
-        self,
-        error_logs: List[Dict[str, Any]],
-        events: List[Dict[str, Any]],
-        traces: List[Dict[str, Any]],
-    ) -> float:
-        """
-        Score the strength of correlation using Groq analysis.
-        
-        Returns correlation score between 0 and 1.
-        """
-        try:
-            if not error_logs and not events and not traces:
-                return 0.0
-
-            if not self.llm:
-                return 0.0
-
-            prompt = f"""Given this incident telemetry:
-- Error logs: {len(error_logs)}
-- Infrastructure events: {len(events)}
-- Slow traces: {len(traces)}
-
-Rate the correlation strength between these signals on a scale of 0-1, where:
-0 = no correlation (independent issues)
-1 = strong correlation (clearly related incident)
-
-Respond with ONLY a single decimal number between 0 and 1."""
-
-            message = self.llm.invoke([HumanMessage(content=prompt)])
-            score = float(message.content.strip())
-            return min(1.0, max(0.0, score))
-        except Exception as e:
-            logger.error(f"Error scoring correlation: {str(e)}")
-            return 0.5
-
     def classify_incident_severity(
         self,
         error_rate: float,
@@ -201,26 +245,7 @@ Respond with ONLY a single decimal number between 0 and 1."""
         """
         try:
             if not self.llm:
-                # Fallback to heuristic
-                if error_rate > 30 or error_count > 100:
-                    return {
-                        "severity": "critical",
-                        "confidence": 0.7,
-                        "factors": {
-                            "error_rate": error_rate,
-                            "error_count": error_count,
-                            "affected_services": affected_services,
-                        },
-                    }
-                return {
-                    "severity": "medium",
-                    "confidence": 0.5,
-                    "factors": {
-                        "error_rate": error_rate,
-                        "error_count": error_count,
-                        "affected_services": affected_services,
-                    },
-                }
+                return self._heuristic_severity(error_rate, error_count, affected_services)
 
             prompt = f"""Classify the severity of an incident with these metrics:
 - Error rate: {error_rate}%
@@ -231,8 +256,11 @@ Classify as: critical, high, medium, or low
 
 Respond with ONLY the severity level."""
 
-            message = self.llm.invoke([HumanMessage(content=prompt)])
-            severity = message.content.strip().lower()
+            try:
+                severity = self.client.complete(prompt).strip().lower()
+            except Exception as e:
+                logger.warning(f"Falling back to heuristic severity: {str(e)}")
+                return self._heuristic_severity(error_rate, error_count, affected_services)
             confidence = 0.85
 
             return {
@@ -253,5 +281,16 @@ Respond with ONLY the severity level."""
             }
 
 
-# Create singleton instance
-ai_service = AIService()
+def get_ai_service() -> AIService:
+    """
+    Shared AIService, built on first use.
+
+    Construction loads the LLM backend and the result cache, so it is
+    deferred until an AI path actually runs rather than paid at import.
+    """
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = AIService()
+    return _instance
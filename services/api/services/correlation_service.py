@@ -0,0 +1,418 @@
+"""
+Correlation service joining error logs with events and slow traces in time
+"""
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Iterator, Tuple
+import math
+from models.logs_model import LogModel
+from models.metrics_model import MetricsModel
+from models.traces_model import TracesModel
+from models.events_model import EventModel
+from core.config import settings, get_logger
+from core.telemetry_summary import TemplateGroups, message_template
+from core.time_buckets import bucket_expression, floor_bucket, to_datetime
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = get_logger(__name__)
+
+SignalKey = Tuple[str, str]
+
+
+def _match_within(
+    anchors: Iterator[datetime],
+    targets: Iterator[Tuple[datetime, Any]],
+    window: timedelta,
+) -> Iterator[Tuple[bool, Any]]:
+    """
+    Sorted-merge temporal join.
+
+    Both inputs must be ascending by timestamp. Yields (matched, item) for every
+    target, where matched means some anchor lies within window of it. Only the
+    anchors immediately before and after the current target are held in memory.
+    """
+    previous: Optional[datetime] = None
+    upcoming = next(anchors, None)
+    for timestamp, item in targets:
+        while upcoming is not None and upcoming <= timestamp:
+            previous = upcoming
+            upcoming = next(anchors, None)
+        matched = (previous is not None and timestamp - previous <= window) or (
+            upcoming is not None and upcoming - timestamp <= window
+        )
+        yield matched, item
+
+
+class CorrelationService:
+    """Service for streaming temporal correlation across telemetry signals"""
+
+    @staticmethod
+    def _filtered(
+        query,
+        model,
+        start_time: datetime,
+        service_name: Optional[str],
+        end_time: Optional[datetime] = None,
+    ):
+        query = query.filter(model.timestamp >= start_time)
+        if end_time is not None:
+            query = query.filter(model.timestamp < end_time)
+        if service_name:
+            query = query.filter(model.service_name == service_name)
+        return query.order_by(model.timestamp).yield_per(settings.TELEMETRY_STREAM_CHUNK_SIZE)
+
+    @staticmethod
+    def _error_timestamps(
+        db: Session,
+        start_time: datetime,
+        service_name: Optional[str],
+        end_time: Optional[datetime] = None,
+    ) -> Iterator[datetime]:
+        rows = CorrelationService._filtered(
+            db.query(LogModel.timestamp).filter(LogModel.level == "ERROR"),
+            LogModel,
+            start_time,
+            service_name,
+            end_time,
+        )
+        return (timestamp for (timestamp,) in rows)
+
+    @staticmethod
+    def analyze(
+        db: Session,
+        service_name: Optional[str] = None,
+        hours: int = 1,
+        end_time: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Correlate ERROR logs with events and slow traces occurring within
+        CORRELATION_WINDOW_MINUTES of an error.
+
+        Each signal is read once as a time-ordered server-side cursor and the
+        error timeline is merged against it, so memory use is bounded by the
+        sample size rather than by the window.
+
+        The window is the hours before end_time (default: now).
+
+        Returns counts, correlations and per-signal samples grouped by
+        message template (at most CORRELATION_SAMPLE_TEMPLATES each, with counts).
+        """
+        try:
+            start_time = (end_time or datetime.utcnow()) - timedelta(hours=hours)
+            window = timedelta(minutes=settings.CORRELATION_WINDOW_MINUTES)
+            sample_size = settings.CORRELATION_SAMPLE_SIZE
+            max_templates = settings.CORRELATION_SAMPLE_TEMPLATES
+
+            # Error logs: count them and group them by message template for AI analysis
+            error_count = 0
+            error_samples = TemplateGroups(max_templates)
+            for log in CorrelationService._filtered(
+                db.query(
+                    LogModel.service_name, LogModel.level, LogModel.message, LogModel.timestamp
+                ).filter(LogModel.level == "ERROR"),
+                LogModel,
+                start_time,
+                service_name,
+                end_time,
+            ):
+                error_count += 1
+                error_samples.add(
+                    (log.service_name, log.level, message_template(log.message)),
+                    {
+                        "service_name": log.service_name,
+                        "level": log.level,
+                        "message": log.message,
+                        "timestamp": log.timestamp.isoformat(),
+                    },
+                )
+
+            # Events merged against the error timeline
+            events_count = 0
+            matched_events = 0
+            matched_event_samples: List[Dict[str, Any]] = []
+            event_samples = TemplateGroups(max_templates)
+            events = CorrelationService._filtered(
+                db.query(
+                    EventModel.service_name,
+                    EventModel.type,
+                    EventModel.details,
+                    EventModel.severity,
+                    EventModel.timestamp,
+                ),
+                EventModel,
+                start_time,
+                service_name,
+                end_time,
+            )
+            for matched, event in _match_within(
+                CorrelationService._error_timestamps(db, start_time, service_name, end_time),
+                ((event.timestamp, event) for event in events),
+                window,
+            ):
+                events_count += 1
+                event_samples.add(
+                    (event.service_name, event.type, message_template(event.details)),
+                    {
+                        "service_name": event.service_name,
+                        "type": event.type,
+                        "description": event.details,
+                        "severity": event.severity,
+                        "timestamp": event.timestamp.isoformat(),
+                    },
+                )
+                if matched:
+                    matched_events += 1
+                    if len(matched_event_samples) < sample_size:
+                        matched_event_samples.append(
+                            {"type": event.type, "timestamp": event.timestamp.isoformat()}
+                        )
+
+            # Slow traces merged against the error timeline
+            slow_traces_count = 0
+            matched_traces = 0
+            matched_duration = 0.0
+            trace_samples = TemplateGroups(max_templates)
+            traces = CorrelationService._filtered(
+                db.query(
+                    TracesModel.service_name,
+                    TracesModel.operation,
+                    TracesModel.duration,
+                    TracesModel.timestamp,
+                ).filter(TracesModel.duration > settings.CORRELATION_SLOW_TRACE_MS),
+                TracesModel,
+                start_time,
+                service_name,
+                end_time,
+            )
+            for matched, trace in _match_within(
+                CorrelationService._error_timestamps(db, start_time, service_name, end_time),
+                ((trace.timestamp, trace) for trace in traces),
+                window,
+            ):
+                slow_traces_count += 1
+                trace_samples.add(
+                    (trace.service_name, trace.operation),
+                    {
+                        "service_name": trace.service_name,
+                        "operation": trace.operation,
+                        "duration": trace.duration,
+                        "timestamp": trace.timestamp.isoformat(),
+                    },
+                )
+                if matched:
+                    matched_traces += 1
+                    matched_duration += trace.duration
+
+            correlations = []
+            if error_count and matched_events:
+                correlations.append(
+                    {
+                        "type": "event_error_correlation",
+                        "error_count": error_count,
+                        "event_count": matched_events,
+                        "confidence": min(1.0, matched_events / error_count),
+                        "events": matched_event_samples,
+                    }
+                )
+            if error_count and matched_traces:
+                correlations.append(
+                    {
+                        "type": "latency_error_correlation",
+                        "error_count": error_count,
+                        "slow_trace_count": matched_traces,
+                        "avg_slow_duration": matched_duration / matched_traces,
+                        "confidence": min(1.0, matched_traces / error_count),
+                    }
+                )
+
+            return {
+                "error_logs_count": error_count,
+                "events_count": events_count,
+                "slow_traces_count": slow_traces_count,
+                "correlations": correlations,
+                "samples": {
+                    "error_logs": error_samples.items(),
+                    "events": event_samples.items(),
+                    "traces": trace_samples.items(),
+                },
+            }
+        except Exception as e:
+            logger.error(f"Error analyzing correlations: {str(e)}")
+            raise
+
+    @staticmethod
+    def build_series(
+        db: Session,
+        start_time: datetime,
+        end_time: datetime,
+        width: timedelta = timedelta(minutes=1),
+    ) -> Tuple[List[SignalKey], "np.ndarray"]:
+        """
+        Bucket every service's signals into aligned arrays, one column per bucket.
+
+        Signals are error_logs, slow_traces and events (counts per bucket) and
+        metric:<name> (mean value per bucket, gaps filled with the series mean).
+        Each signal family is one grouped query.
+
+        Returns ([(service_name, signal)], array of shape (signals, buckets))
+        """
+        origin = floor_bucket(start_time, width)
+        buckets = int((floor_bucket(end_time, width) - origin) / width) + 1
+        dialect = db.bind.dialect.name
+
+        def grouped(model, value, *filters):
+            bucket = bucket_expression(model.timestamp, width, dialect)
+            return (
+                db.query(model.service_name, bucket, value)
+                .filter(model.timestamp >= start_time, model.timestamp <= end_time, *filters)
+                .group_by(model.service_name, bucket)
+            )
+
+        families = [
+            ("error_logs", grouped(LogModel, func.count(LogModel.id), LogModel.level == "ERROR")),
+            (
+                "slow_traces",
+                grouped(
+                    TracesModel,
+                    func.count(TracesModel.id),
+                    TracesModel.duration > settings.CORRELATION_SLOW_TRACE_MS,
+                ),
+            ),
+            ("events", grouped(EventModel, func.count(EventModel.id))),
+        ]
+
+        index: Dict[SignalKey, int] = {}
+        cells: List[Tuple[int, int, float]] = []
+
+        def collect(signal: str, rows) -> None:
+            for service_name, bucket, value in rows:
+                key = (service_name, signal)
+                row = index.setdefault(key, len(index))
+                column = int((to_datetime(bucket) - origin) / width)
+                if 0 <= column < buckets:
+                    cells.append((row, column, float(value)))
+
+        for signal, query in families:
+            collect(signal, query.all())
+        counted = len(index)
+
+        metric_bucket = bucket_expression(MetricsModel.timestamp, width, dialect)
+        metric_rows = (
+            db.query(
+                MetricsModel.service_name,
+                MetricsModel.metric_name,
+                metric_bucket,
+                func.avg(MetricsModel.value),
+            )
+            .filter(MetricsModel.timestamp >= start_time, MetricsModel.timestamp <= end_time)
+            .group_by(MetricsModel.service_name, MetricsModel.metric_name, metric_bucket)
+            .all()
+        )
+        for service_name, metric_name, bucket, value in metric_rows:
+            collect(f"metric:{metric_name}", [(service_name, bucket, value)])
+
+        # NumPy is only needed once a correlation actually runs, not at API startup
+        import numpy as np
+
+        series = np.zeros((len(index), buckets))
+        observed = np.zeros((len(index), buckets), dtype=bool)
+        if cells:
+            rows, columns, values = (np.array(part) for part in zip(*cells))
+            rows, columns = rows.astype(np.int64), columns.astype(np.int64)
+            series[rows, columns] = values
+            observed[rows, columns] = True
+
+        # Metric gaps are unknown rather than zero; fill them with the series mean
+        gauges = series[counted:]
+        seen = observed[counted:]
+        if gauges.size:
+            means = gauges.sum(axis=1) / np.maximum(seen.sum(axis=1), 1)
+            series[counted:] = np.where(seen, gauges, means[:, None])
+
+        return list(index), series
+
+    @staticmethod
+    def rank_signal_correlations(
+        db: Session,
+        service_name: Optional[str] = None,
+        hours: int = 1,
+        max_lag_minutes: Optional[int] = None,
+        end_time: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Lagged cross-correlation of every per-minute signal pair across all services.
+
+        Windows longer than CORRELATION_MAX_BUCKETS minutes are bucketed more
+        coarsely so the cost stays flat. When service_name is given only pairs
+        involving that service are ranked, but its signals are still compared
+        against every other service.
+
+        Returns ranked lag-annotated pairs, the bucket width used, and the
+        strongest same-service coefficient per signal pair keyed by (signal, signal).
+        """
+        try:
+            end_time = end_time or datetime.utcnow()
+            start_time = end_time - timedelta(hours=hours)
+            if max_lag_minutes is None:
+                max_lag_minutes = settings.CORRELATION_MAX_LAG_MINUTES
+
+            bucket_minutes = max(1, math.ceil(hours * 60 / settings.CORRELATION_MAX_BUCKETS))
+            max_lag = math.ceil(max_lag_minutes / bucket_minutes)
+
+            labels, series = CorrelationService.build_series(
+                db, start_time, end_time, timedelta(minutes=bucket_minutes)
+            )
+            if not labels:
+                return {
+                    "signal_correlations": [],
+                    "bucket_minutes": bucket_minutes,
+                    "same_service": {},
+                }
+
+            import numpy as np
+            from core.cross_correlation import best_lags, max_lagged_correlation, rank_pairs
+
+            best = max_lagged_correlation(series, max_lag)
+
+            if service_name:
+                in_scope = np.array([label[0] == service_name for label in labels])
+                best[~(in_scope[:, None] | in_scope[None, :])] = np.nan
+
+            ranked = rank_pairs(
+                best,
+                min_coefficient=settings.CORRELATION_MIN_COEFFICIENT,
+                limit=settings.CORRELATION_TOP_PAIRS,
+            )
+            lags = best_lags(series, [(i, j) for i, j, _ in ranked], max_lag)
+
+            # Strongest coefficient between two signals of the same service,
+            # in either direction, for the headline correlation confidences
+            services = np.array([label[0] for label in labels], dtype=object)
+            same = (services[:, None] == services[None, :]) & ~np.isnan(best)
+            np.fill_diagonal(same, False)
+            same_service: Dict[Tuple[str, str], float] = {}
+            for i, j in zip(*np.nonzero(same)):
+                key = tuple(sorted((labels[i][1], labels[j][1])))
+                same_service[key] = max(same_service.get(key, -1.0), float(best[i, j]))
+
+            return {
+                "signal_correlations": [
+                    {
+                        "source_service": labels[i][0],
+                        "source_signal": labels[i][1],
+                        "target_service": labels[j][0],
+                        "target_signal": labels[j][1],
+                        "lag_minutes": lag * bucket_minutes,
+                        "coefficient": round(coefficient, 4),
+                    }
+                    for (i, j, coefficient), lag in zip(ranked, lags)
+                ],
+                "bucket_minutes": bucket_minutes,
+                "same_service": same_service,
+            }
+        except Exception as e:
+            logger.error(f"Error ranking signal correlations: {str(e)}")
+            raise
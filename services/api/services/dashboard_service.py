@@ -4,21 +4,90 @@ Dashboard service for aggregating and processing dashboard data
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from models.logs_model import LogModel
-from models.metrics_model import MetricsModel
 from models.traces_model import TracesModel
 from models.events_model import EventModel
-from core.config import get_logger
+from core.config import settings, get_logger
+from core.time_buckets import bucket_expression, bucket_range, floor_bucket, to_datetime
+from core.cache import SWRCache
+from core.concurrency import DEFAULT_TIMEOUT, fan_out, fanout_timeout
 from services.telemetry_service import TelemetryService
-from services.ai_service import ai_service
+from services.ai_service import get_ai_service
+from services.health_snapshot_service import HealthSnapshotService
+from services.event_rollup_service import EventRollupService
+from services.correlation_service import CorrelationService
+from services.incident_memory_service import IncidentMemoryService
+from core.incident_embedding import incident_fingerprint
 
 logger = get_logger(__name__)
 
+# Shared by every request so polling tabs reuse one computation per view
+dashboard_cache = SWRCache(
+    maxsize=settings.DASHBOARD_CACHE_SIZE,
+    ttl=settings.DASHBOARD_CACHE_TTL_SECONDS,
+    stale_ttl=settings.DASHBOARD_CACHE_STALE_SECONDS,
+)
+
 
 class DashboardService:
     """Service for aggregating telemetry data for dashboard display"""
 
+    @staticmethod
+    def cached(
+        db: Session, view: str, compute: Callable[..., Any], **params: Any
+    ) -> Any:
+        """
+        Serve compute(session, **params) through the dashboard cache.
+
+        The key is the view name plus its parameters. Computation always runs
+        on its own session because stale entries are refreshed in the
+        background after the request that triggered them has finished.
+        """
+        bind = db.get_bind()
+
+        def load() -> Any:
+            session = Session(bind=bind, autoflush=False)
+            try:
+                return compute(session, **params)
+            finally:
+                session.close()
+
+        return dashboard_cache.get_or_compute((view, tuple(sorted(params.items()))), load)
+
+    @staticmethod
+    def _build_service_health(
+        service_name: str,
+        service_id: int,
+        log_stats: Dict[str, Any],
+        avg_latency: float,
+    ) -> Dict[str, Any]:
+        """Classify a service from its log statistics and average latency."""
+        error_rate = log_stats["error_rate"]
+        
+        # Determine health status
+        if error_rate > 20 or avg_latency > 5000:
+            status = "critical"
+            severity_score = 3
+        elif error_rate > 10 or avg_latency > 2000:
+            status = "degraded"
+            severity_score = 2
+        else:
+            status = "healthy"
+            severity_score = 1
+        
+        return {
+            "service_id": service_id,
+            "service_name": service_name,
+            "version": "v1.0",  # Default version, can be enhanced later
+            "status": status,
+            "severity_score": severity_score,
+            "error_rate": error_rate,
+            "avg_latency": avg_latency,
+            "error_count": log_stats["error_count"],
+            "total_logs": log_stats["total_logs"],
+        }
+
     @staticmethod
     def calculate_service_health(
         db: Session, service_name: str, hours: int = 1
@@ -47,71 +116,153 @@ class DashboardService:
                 db, service_name=service_name, start_time=start_time
             )
             
-            error_rate = log_stats["error_rate"]
-            avg_latency = latency_stats.get("avg_latency", 0)
-            
-            # Determine health status
-            if error_rate > 20 or avg_latency > 5000:
-                status = "critical"
-                severity_score = 3
-            elif error_rate > 10 or avg_latency > 2000:
-                status = "degraded"
-                severity_score = 2
-            else:
-                status = "healthy"
-                severity_score = 1
-            
-            return {
-                "service_id": service_id,
-                "service_name": service_name,
-                "version": "v1.0",  # Default version, can be enhanced later
-                "status": status,
-                "severity_score": severity_score,
-                "error_rate": error_rate,
-                "avg_latency": avg_latency,
-                "error_count": log_stats["error_count"],
-                "total_logs": log_stats["total_logs"],
-            }
+            return DashboardService._build_service_health(
+                service_name,
+                service_id,
+                log_stats,
+                latency_stats.get("avg_latency", 0),
+            )
         except Exception as e:
             logger.error(f"Error calculating service health: {str(e)}")
             raise
 
     @staticmethod
-    def get_incident_volume_trends(
-        db: Session, service_name: Optional[str] = None, hours: int = 24
+    def _services_health_queries(
+        services: List[str], start_time: datetime
     ) -> Dict[str, Any]:
+        """Independent grouped queries needed to assess health for a list of services."""
+        from models.services_model import ServiceModel
+        
+        return {
+            "service_ids": lambda session: dict(
+                session.query(ServiceModel.name, ServiceModel.id)
+                .filter(ServiceModel.name.in_(services))
+                .all()
+            ),
+            "log_stats": lambda session: TelemetryService.get_log_statistics_by_service(
+                session, start_time=start_time
+            ),
+            "latency": lambda session: TelemetryService.get_latency_summary_by_service(
+                session, start_time=start_time
+            ),
+        }
+
+    @staticmethod
+    def _assemble_services_health(
+        services: List[str], results: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Build per-service health from the results of _services_health_queries."""
+        empty_log_stats = TelemetryService._build_log_statistics({})
+        return [
+            DashboardService._build_service_health(
+                service,
+                results["service_ids"].get(service, 0),
+                results["log_stats"].get(service, empty_log_stats),
+                results["latency"].get(service, {}).get("avg_latency", 0),
+            )
+            for service in services
+        ]
+
+    @staticmethod
+    def calculate_services_health(
+        db: Session, hours: int = 1, services: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Get incident volume trends as time series data.
+        Calculate health for every service with a fixed number of grouped queries.
         
-        Groups incidents by hour to show trends.
+        Looks up the service list, then runs the service id, per-service log
+        count and per-service latency queries concurrently, however many
+        services exist.
         """
         try:
             start_time = datetime.utcnow() - timedelta(hours=hours)
             
-            query = db.query(
-                func.date_format(EventModel.timestamp, "%Y-%m-%d %H:00:00"),
-                func.count(EventModel.id),
-            ).filter(EventModel.timestamp >= start_time)
-            
-            if service_name:
-                query = query.filter(EventModel.service_name == service_name)
-            
-            query = query.group_by(
-                func.date_format(EventModel.timestamp, "%Y-%m-%d %H:00:00")
-            ).order_by(func.date_format(EventModel.timestamp, "%Y-%m-%d %H:00:00"))
+            if services is None:
+                services = TelemetryService.get_service_list(db)
+            if not services:
+                return []
             
-            data_points = []
-            for timestamp_str, count in query.all():
-                data_points.append(
-                    {
-                        "timestamp": timestamp_str,
-                        "incident_count": count,
-                    }
+            results = fan_out(
+                db,
+                DashboardService._services_health_queries(services, start_time),
+                timeout=fanout_timeout(hours),
+            )
+            return DashboardService._assemble_services_health(services, results)
+        except Exception as e:
+            logger.error(f"Error calculating services health: {str(e)}")
+            raise
+
+    @staticmethod
+    def get_incident_volume_trends(
+        db: Session,
+        service_name: Optional[str] = None,
+        hours: int = 24,
+        bucket_minutes: int = 60,
+    ) -> Dict[str, Any]:
+        """
+        Get incident volume trends as time series data.
+        
+        Groups incidents into epoch-aligned buckets of bucket_minutes and
+        zero-fills buckets with no incidents. Whole hours are read from the
+        event_hourly_counts rollup when the bucket width is a whole number of
+        hours; only the partial hours at either edge touch raw events.
+        """
+        try:
+            now = datetime.utcnow()
+            start_time = now - timedelta(hours=hours)
+            width = timedelta(minutes=bucket_minutes)
+            hour = timedelta(hours=1)
+            counts: Dict[datetime, int] = {}
+
+            def count_raw(range_start: datetime, range_end: Optional[datetime] = None) -> None:
+                bucket = bucket_expression(EventModel.timestamp, width, db.bind.dialect.name)
+                query = db.query(bucket, func.count(EventModel.id)).filter(
+                    EventModel.timestamp >= range_start
                 )
+                if range_end:
+                    query = query.filter(EventModel.timestamp < range_end)
+                if service_name:
+                    query = query.filter(EventModel.service_name == service_name)
+                for value, count in query.group_by(bucket).all():
+                    key = to_datetime(value)
+                    counts[key] = counts.get(key, 0) + count
+
+            # Hours the rollup is known to be complete for: fully elapsed before
+            # the last scheduled refresh could have run
+            rollup_start = floor_bucket(start_time, hour)
+            if rollup_start < start_time:
+                rollup_start += hour
+            rollup_end = floor_bucket(
+                now - timedelta(seconds=settings.EVENT_ROLLUP_REFRESH_SECONDS), hour
+            )
+
+            if (
+                settings.EVENT_ROLLUP_ENABLED
+                and width % hour == timedelta(0)
+                and rollup_start < rollup_end
+            ):
+                count_raw(start_time, rollup_start)
+                for rollup_hour, count in EventRollupService.get_hourly_counts(
+                    db, rollup_start, rollup_end, service_name=service_name
+                ).items():
+                    key = floor_bucket(rollup_hour, width)
+                    counts[key] = counts.get(key, 0) + count
+                count_raw(rollup_end)
+            else:
+                count_raw(start_time)
+
+            data_points = [
+                {
+                    "timestamp": bucket.isoformat(),
+                    "incident_count": counts.get(bucket, 0),
+                }
+                for bucket in bucket_range(start_time, now, width)
+            ]
             
             return {
                 "service_name": service_name or "all",
                 "time_range_hours": hours,
+                "bucket_minutes": bucket_minutes,
                 "data_points": data_points,
             }
         except Exception as e:
@@ -126,14 +277,13 @@ class DashboardService:
         Get list of critical/degraded services ordered by severity.
         """
         try:
-            services = TelemetryService.get_service_list(db)
-            
-            service_health = []
-            for service in services:
-                health = DashboardService.calculate_service_health(
-                    db, service, hours=hours
+            snapshot = HealthSnapshotService.get_latest_snapshot(db, hours)
+            if snapshot is not None:
+                service_health = list(snapshot["service_health"])
+            else:
+                service_health = DashboardService.calculate_services_health(
+                    db, hours=hours
                 )
-                service_health.append(health)
             
             # Sort by severity score (descending) and error rate (descending)
             service_health.sort(
@@ -159,141 +309,96 @@ class DashboardService:
         db: Session,
         service_name: Optional[str] = None,
         hours: int = 1,
+        max_lag_minutes: Optional[int] = None,
+        end_time: Optional[datetime] = None,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
     ) -> Dict[str, Any]:
         """
-        Analyze correlations between logs, events, and metrics with AI predictions.
+        Analyze correlations between error logs, events, slow traces and metrics with AI predictions.
         
-        Returns correlations with AI-predicted root causes.
+        Headline correlation confidences are the strongest lagged per-minute
+        cross-correlation between the two signals within a service. The
+        window is the hours before end_time (default: now). The sub-queries
+        share a deadline scaled to hours unless timeout is given; None
+        waits for them however long they take.
+        
+        Returns correlations, ranked signal pairs, AI-predicted root causes,
+        similar resolved incidents, and the telemetry fingerprint they were
+        matched on.
         """
         try:
-            start_time = datetime.utcnow() - timedelta(hours=hours)
-            
-            # Get error logs timeline
-            error_logs_query = (
-                db.query(LogModel)
-                .filter(LogModel.level == "ERROR")
-                .filter(LogModel.timestamp >= start_time)
-            )
-            if service_name:
-                error_logs_query = error_logs_query.filter(
-                    LogModel.service_name == service_name
-                )
-            error_logs = error_logs_query.all()
-            
-            # Get events in same time range
-            events_query = db.query(EventModel).filter(
-                EventModel.timestamp >= start_time
+            results = fan_out(
+                db,
+                {
+                    "analysis": lambda session: CorrelationService.analyze(
+                        session, service_name=service_name, hours=hours, end_time=end_time
+                    ),
+                    "ranking": lambda session: CorrelationService.rank_signal_correlations(
+                        session,
+                        service_name=service_name,
+                        hours=hours,
+                        max_lag_minutes=max_lag_minutes,
+                        end_time=end_time,
+                    ),
+                },
+                timeout=fanout_timeout(hours) if timeout is DEFAULT_TIMEOUT else timeout,
             )
-            if service_name:
-                events_query = events_query.filter(
-                    EventModel.service_name == service_name
-                )
-            events = events_query.all()
-            
-            # Get high latency traces
-            traces_query = db.query(TracesModel).filter(
-                TracesModel.timestamp >= start_time,
-                TracesModel.duration > 2000,  # > 2 seconds
-            )
-            if service_name:
-                traces_query = traces_query.filter(
-                    TracesModel.service_name == service_name
-                )
-            traces = traces_query.all()
-            
-            # Get anomalous metrics
-            metrics_query = db.query(MetricsModel).filter(
-                MetricsModel.timestamp >= start_time
-            )
-            if service_name:
-                metrics_query = metrics_query.filter(
-                    MetricsModel.service_name == service_name
-                )
-            metrics = metrics_query.all()
+            analysis, ranking = results["analysis"], results["ranking"]
+            signal_pairs = {
+                "event_error_correlation": ("error_logs", "events"),
+                "latency_error_correlation": ("error_logs", "slow_traces"),
+            }
+            for correlation in analysis["correlations"]:
+                coefficient = ranking["same_service"].get(signal_pairs[correlation["type"]])
+                if coefficient is not None:
+                    correlation["confidence"] = min(1.0, max(0.0, coefficient))
+            samples = analysis["samples"]
+            totals = {
+                "error_logs": analysis["error_logs_count"],
+                "events": analysis["events_count"],
+                "traces": analysis["slow_traces_count"],
+            }
             
-            # Use Groq AI to predict root cause
-            root_cause_prediction = ai_service.predict_root_cause(
-                [log.to_dict() for log in error_logs],
-                [event.to_dict() for event in events],
-                [trace.to_dict() for trace in traces],
+            # Root cause and correlation score from a single Groq call
+            ai_analysis = get_ai_service().analyze_incident(
+                samples["error_logs"],
+                samples["events"],
+                samples["traces"],
+                totals=totals,
+                signal_correlations=ranking["signal_correlations"],
             )
+            correlation_score = ai_analysis["correlation_score"]
+            root_cause_prediction = {
+                key: value for key, value in ai_analysis.items() if key != "correlation_score"
+            }
             
-            # Calculate correlation score using Groq AI
-            correlation_score = ai_service.score_correlation(
-                [log.to_dict() for log in error_logs],
-                [event.to_dict() for event in events],
-                [trace.to_dict() for trace in traces],
+            # Nearest resolved incidents come from the local index, not the LLM
+            fingerprint = incident_fingerprint(
+                samples["error_logs"],
+                samples["events"],
+                samples["traces"],
+                ranking["signal_correlations"],
             )
-            
-            correlations = []
-            
-            # Correlate errors with events
-            if error_logs and events:
-                error_time_range = (
-                    min([log.timestamp for log in error_logs]),
-                    max([log.timestamp for log in error_logs]),
-                )
-                events_in_window = [
-                    e
-                    for e in events
-                    if error_time_range[0]
-                    <= e.timestamp
-                    <= error_time_range[1] + timedelta(minutes=5)
-                ]
-                if events_in_window:
-                    correlations.append(
-                        {
-                            "type": "event_error_correlation",
-                            "error_count": len(error_logs),
-                            "event_count": len(events_in_window),
-                            "confidence": min(
-                                1.0, len(events_in_window) / len(error_logs)
-                            ),
-                            "events": [
-                                {"type": e.type, "timestamp": e.timestamp.isoformat()}
-                                for e in events_in_window[:5]
-                            ],
-                        }
-                    )
-            
-            # Correlate errors with latency
-            if error_logs and traces:
-                error_time_range = (
-                    min([log.timestamp for log in error_logs]),
-                    max([log.timestamp for log in error_logs]),
-                )
-                slow_traces_in_window = [
-                    t
-                    for t in traces
-                    if error_time_range[0]
-                    <= t.timestamp
-                    <= error_time_range[1] + timedelta(minutes=5)
-                ]
-                if slow_traces_in_window:
-                    correlations.append(
-                        {
-                            "type": "latency_error_correlation",
-                            "error_count": len(error_logs),
-                            "slow_trace_count": len(slow_traces_in_window),
-                            "avg_slow_duration": sum(
-                                [t.duration for t in slow_traces_in_window]
-                            )
-                            / len(slow_traces_in_window),
-                            "confidence": min(
-                                1.0, len(slow_traces_in_window) / len(error_logs)
-                            ),
-                        }
-                    )
+            similar_incidents = []
+            if settings.SIMILAR_INCIDENTS_ENABLED:
+                try:
+                    similar_incidents = IncidentMemoryService.find_similar(db, fingerprint)
+                except Exception as e:
+                    logger.error(f"Similar incident lookup failed, continuing without: {str(e)}")
             
             return {
                 "service_name": service_name or "all",
                 "time_range_hours": hours,
-                "error_logs_count": len(error_logs),
-                "events_count": len(events),
-                "slow_traces_count": len(traces),
-                "correlations": correlations,
+                "error_logs_count": analysis["error_logs_count"],
+                "events_count": analysis["events_count"],
+                "slow_traces_count": analysis["slow_traces_count"],
+                "correlations": analysis["correlations"],
+                "signal_correlations": ranking["signal_correlations"],
+                "signal_bucket_minutes": ranking["bucket_minutes"],
                 "ai_prediction": root_cause_prediction,
                 "correlation_score": correlation_score,
+                "similar_incidents": similar_incidents,
+                "fingerprint": fingerprint,
             }
         except Exception as e:
             logger.error(f"Error getting correlation analysis: {str(e)}")
@@ -305,37 +410,61 @@ class DashboardService:
     ) -> Dict[str, Any]:
         """
         Get comprehensive dashboard overview with all key metrics.
+        
+        Served from the latest health snapshot when one is fresh for this
+        window; otherwise computed live from raw telemetry.
         """
         try:
+            snapshot = HealthSnapshotService.get_latest_snapshot(db, hours)
+            if snapshot is not None:
+                service_health_list = snapshot["service_health"]
+                critical_count = sum(
+                    1 for health in service_health_list if health["status"] == "critical"
+                )
+                degraded_count = sum(
+                    1 for health in service_health_list if health["status"] == "degraded"
+                )
+                return {
+                    "timestamp": snapshot["computed_at"].isoformat(),
+                    "time_range_hours": hours,
+                    "total_services": len(service_health_list),
+                    "healthy_services": len(service_health_list) - critical_count - degraded_count,
+                    "degraded_services": degraded_count,
+                    "critical_services": critical_count,
+                    "total_logs": snapshot["total_logs"],
+                    "total_events": snapshot["total_events"],
+                    "total_traces": snapshot["total_traces"],
+                    "service_health": service_health_list,
+                }
+            
             services = TelemetryService.get_service_list(db)
             start_time = datetime.utcnow() - timedelta(hours=hours)
             
-            # Calculate health for all services
-            service_health_list = []
-            critical_count = 0
-            degraded_count = 0
-            
-            for service in services:
-                health = DashboardService.calculate_service_health(
-                    db, service, hours=hours
-                )
-                service_health_list.append(health)
-                
-                if health["status"] == "critical":
-                    critical_count += 1
-                elif health["status"] == "degraded":
-                    degraded_count += 1
+            # Health inputs and overall counts are independent; run them together
+            queries = DashboardService._services_health_queries(services, start_time)
+            for name, model in (
+                ("total_logs", LogModel),
+                ("total_events", EventModel),
+                ("total_traces", TracesModel),
+            ):
+                queries[name] = lambda session, model=model: session.query(
+                    func.count(model.id)
+                ).filter(model.timestamp >= start_time).scalar()
+            results = fan_out(db, queries, timeout=fanout_timeout(hours))
             
-            # Overall statistics
-            total_logs = db.query(LogModel).filter(
-                LogModel.timestamp >= start_time
-            ).count()
-            total_events = db.query(EventModel).filter(
-                EventModel.timestamp >= start_time
-            ).count()
-            total_traces = db.query(TracesModel).filter(
-                TracesModel.timestamp >= start_time
-            ).count()
+            # Calculate health for all services
+            service_health_list = DashboardService._assemble_services_health(
+                services, results
+            )
+            critical_count = sum(
+                1 for health in service_health_list if health["status"] == "critical"
+            )
+            degraded_count = sum(
+                1 for health in service_health_list if health["status"] == "degraded"
+            )
+            total_logs = results["total_logs"]
+            total_events = results["total_events"]
+            total_traces = results["total_traces"]
             
             return {
                 "timestamp": datetime.utcnow().isoformat(),
@@ -0,0 +1,156 @@
+"""
+Dashboard stream service pushing overview changes to subscribers as deltas
+"""
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, Optional, Set
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from core.config import settings, get_logger
+from services.dashboard_service import DashboardService
+
+logger = get_logger(__name__)
+
+# Overview fields that change on every computation and do not count as a change
+_VOLATILE_FIELDS = {"timestamp"}
+
+
+def diff_overview(
+    previous: Dict[str, Any], current: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Delta between two dashboard overviews.
+
+    Returns None when nothing but volatile fields changed, otherwise
+    {"changed": {field: value}, "services": {"upsert": [...], "removed": [...]}}
+    with service health entries keyed by service_name.
+    """
+    changed = {
+        field: value
+        for field, value in current.items()
+        if field != "service_health"
+        and field not in _VOLATILE_FIELDS
+        and previous.get(field) != value
+    }
+
+    before = {health["service_name"]: health for health in previous.get("service_health", [])}
+    after = {health["service_name"]: health for health in current.get("service_health", [])}
+    upsert = [health for name, health in after.items() if before.get(name) != health]
+    removed = [name for name in before if name not in after]
+
+    if not changed and not upsert and not removed:
+        return None
+
+    for field in _VOLATILE_FIELDS:
+        if field in current:
+            changed[field] = current[field]
+    return {"changed": changed, "services": {"upsert": upsert, "removed": removed}}
+
+
+def format_event(event: str, data: Dict[str, Any]) -> str:
+    """Encode one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+class _ViewChannel:
+    """One shared overview computation fanned out to every subscriber of a view"""
+
+    def __init__(self, bind: Engine, hours: int):
+        self.bind = bind
+        self.hours = hours
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.current: Optional[Dict[str, Any]] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def _load(self) -> Dict[str, Any]:
+        session = Session(bind=self.bind, autoflush=False)
+        try:
+            return DashboardService.cached(
+                session, "overview", DashboardService.get_dashboard_overview, hours=self.hours
+            )
+        finally:
+            session.close()
+
+    def _publish(self, queue: asyncio.Queue, message: str) -> None:
+        if queue.full():
+            # A subscriber that fell behind drops its backlog and resyncs
+            while not queue.empty():
+                queue.get_nowait()
+            message = format_event("snapshot", self.current)
+        queue.put_nowait(message)
+
+    def _broadcast(self, message: str) -> None:
+        for queue in list(self.subscribers):
+            self._publish(queue, message)
+
+    async def _run(self) -> None:
+        while self.subscribers:
+            try:
+                overview = await run_in_threadpool(self._load)
+                previous, self.current = self.current, overview
+                if previous is None:
+                    self._broadcast(format_event("snapshot", overview))
+                else:
+                    delta = diff_overview(previous, overview)
+                    if delta is not None:
+                        self._broadcast(format_event("delta", delta))
+            except Exception as e:
+                logger.error(f"Error computing dashboard stream for {self.hours}h: {str(e)}")
+            await asyncio.sleep(settings.DASHBOARD_STREAM_INTERVAL_SECONDS)
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=settings.DASHBOARD_STREAM_QUEUE_SIZE)
+        self.subscribers.add(queue)
+        if self.current is not None:
+            self._publish(queue, format_event("snapshot", self.current))
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self.subscribers.discard(queue)
+        if not self.subscribers and self.task is not None:
+            self.task.cancel()
+            self.task = None
+            self.current = None
+
+
+class DashboardStreamService:
+    """Service for streaming dashboard overview updates over server-sent events"""
+
+    _channels: Dict[int, _ViewChannel] = {}
+
+    @staticmethod
+    def subscriber_count() -> Dict[int, int]:
+        """Open subscriptions per view (hours)"""
+        return {
+            hours: len(channel.subscribers)
+            for hours, channel in DashboardStreamService._channels.items()
+            if channel.subscribers
+        }
+
+    @staticmethod
+    async def stream(db: Session, hours: int, is_disconnected) -> AsyncIterator[str]:
+        """
+        Yield server-sent events for the overview of a view.
+
+        The first event is a full snapshot, later ones are deltas emitted only
+        when the overview changes. Comments are sent as keepalives in between.
+        """
+        channel = DashboardStreamService._channels.get(hours)
+        if channel is None:
+            channel = _ViewChannel(db.get_bind(), hours)
+            DashboardStreamService._channels[hours] = channel
+
+        queue = channel.subscribe()
+        try:
+            while not await is_disconnected():
+                try:
+                    yield await asyncio.wait_for(
+                        queue.get(), timeout=settings.DASHBOARD_STREAM_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+        finally:
+            channel.unsubscribe(queue)
@@ -0,0 +1,261 @@
+"""
+Event rollup service maintaining per-service hourly event counts
+"""
+from sqlalchemy.orm import Session
+from sqlalchemy import func, text
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Iterable, Tuple
+from models.events_model import EventModel
+from models.event_rollup_model import EventHourlyCountModel
+from core.config import settings, get_logger
+from core.database import SessionLocal
+from core.scheduler import PeriodicTask
+from core.time_buckets import bucket_expression, floor_bucket, to_datetime
+
+logger = get_logger(__name__)
+
+HOUR = timedelta(hours=1)
+
+# Postgres advisory lock so only one API worker refreshes per interval
+EVENT_ROLLUP_LOCK_KEY = 728114902
+
+_scheduler: Optional[PeriodicTask] = None
+
+
+class EventRollupService:
+    """Service for maintaining and querying the event_hourly_counts rollup"""
+
+    @staticmethod
+    def _upsert_counts(
+        db: Session,
+        counts: Dict[Tuple[str, datetime], int],
+        increment: bool,
+    ) -> None:
+        """
+        Add counts to (increment) or overwrite the rollup rows for each (service_name, hour).
+
+        Keys are written in sorted order so concurrent writers lock rows in
+        the same order. A single INSERT ... ON CONFLICT also covers rows
+        that another transaction creates concurrently.
+        """
+        if not counts:
+            return
+
+        keys = sorted(counts)
+        dialect = db.bind.dialect.name
+        now = datetime.utcnow()
+
+        if dialect in ("postgresql", "sqlite"):
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+
+            table = EventHourlyCountModel.__table__
+            statement = insert(EventHourlyCountModel).values(
+                [
+                    {
+                        "service_name": service_name,
+                        "hour": hour,
+                        "count": counts[(service_name, hour)],
+                        "updated_at": now,
+                    }
+                    for service_name, hour in keys
+                ]
+            )
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.service_name, table.c.hour],
+                set_={
+                    "count": table.c.count + statement.excluded.count if increment else statement.excluded.count,
+                    "updated_at": now,
+                },
+            )
+            db.execute(statement)
+            return
+
+        existing = {
+            (row.service_name, row.hour): row
+            for row in db.query(EventHourlyCountModel)
+            .filter(EventHourlyCountModel.hour.in_({hour for _, hour in keys}))
+            .filter(EventHourlyCountModel.service_name.in_({service for service, _ in keys}))
+            .order_by(EventHourlyCountModel.service_name, EventHourlyCountModel.hour)
+            .with_for_update()
+            .all()
+        }
+        for service_name, hour in keys:
+            row = existing.get((service_name, hour))
+            if row is None:
+                db.add(
+                    EventHourlyCountModel(
+                        service_name=service_name, hour=hour, count=counts[(service_name, hour)]
+                    )
+                )
+            elif increment:
+                row.count += counts[(service_name, hour)]
+            else:
+                row.count = counts[(service_name, hour)]
+
+    @staticmethod
+    def count_hours(
+        observations: Iterable[Tuple[str, datetime]],
+        counts: Optional[Dict[Tuple[str, datetime], int]] = None,
+    ) -> Dict[Tuple[str, datetime], int]:
+        """
+        Add (service_name, timestamp) events to per-hour counts.
+
+        Returns: {(service_name, hour): count}
+        """
+        counts = {} if counts is None else counts
+        for service_name, timestamp in observations:
+            key = (service_name, floor_bucket(timestamp, HOUR))
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    @staticmethod
+    def record_counts(db: Session, counts: Dict[Tuple[str, datetime], int]) -> None:
+        """
+        Add per-hour counts built by count_hours to the rollup.
+
+        Changes are flushed but not committed so they land in the same
+        transaction as the raw event inserts.
+        """
+        try:
+            EventRollupService._upsert_counts(db, counts, increment=True)
+            db.flush()
+        except Exception as e:
+            logger.error(f"Error recording events into hourly rollup: {str(e)}")
+            raise
+
+    @staticmethod
+    def record(db: Session, observations: Iterable[Tuple[str, datetime]]) -> None:
+        """
+        Add newly ingested (service_name, timestamp) events to the hourly counts.
+
+        Changes are flushed but not committed so they land in the same
+        transaction as the raw event inserts.
+        """
+        EventRollupService.record_counts(db, EventRollupService.count_hours(observations))
+
+    @staticmethod
+    def refresh(
+        db: Session,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> int:
+        """
+        Recompute hourly counts from raw events for the hours in [start_time, end_time).
+
+        Counts are upserted in place and rows for hours without events are
+        removed, so concurrent record() calls never collide with a
+        reinserted row. On PostgreSQL only one worker refreshes at a time.
+
+        Returns: number of rollup rows written (0 if another worker holds the lock)
+        """
+        try:
+            if db.bind.dialect.name == "postgresql":
+                acquired = db.execute(
+                    text("SELECT pg_try_advisory_xact_lock(:key)"),
+                    {"key": EVENT_ROLLUP_LOCK_KEY},
+                ).scalar()
+                if not acquired:
+                    return 0
+
+            hour = bucket_expression(EventModel.timestamp, HOUR, db.bind.dialect.name)
+            counts_query = db.query(EventModel.service_name, hour, func.count(EventModel.id))
+            rollup_query = db.query(EventHourlyCountModel)
+
+            if start_time:
+                start_time = floor_bucket(start_time, HOUR)
+                counts_query = counts_query.filter(EventModel.timestamp >= start_time)
+                rollup_query = rollup_query.filter(EventHourlyCountModel.hour >= start_time)
+
+            if end_time:
+                end_time = floor_bucket(end_time, HOUR)
+                counts_query = counts_query.filter(EventModel.timestamp < end_time)
+                rollup_query = rollup_query.filter(EventHourlyCountModel.hour < end_time)
+
+            counts = {
+                (service_name, to_datetime(bucket)): count
+                for service_name, bucket, count in counts_query.group_by(EventModel.service_name, hour).all()
+            }
+
+            stale_ids = [
+                row.id
+                for row in rollup_query.with_entities(
+                    EventHourlyCountModel.id,
+                    EventHourlyCountModel.service_name,
+                    EventHourlyCountModel.hour,
+                )
+                if (row.service_name, to_datetime(row.hour)) not in counts
+            ]
+            if stale_ids:
+                db.query(EventHourlyCountModel).filter(
+                    EventHourlyCountModel.id.in_(stale_ids)
+                ).delete(synchronize_session=False)
+            EventRollupService._upsert_counts(db, counts, increment=False)
+            db.commit()
+            return len(counts)
+        except Exception as e:
+            logger.error(f"Error refreshing event hourly rollup: {str(e)}")
+            db.rollback()
+            raise
+
+    @staticmethod
+    def get_hourly_counts(
+        db: Session,
+        start_hour: datetime,
+        end_hour: datetime,
+        service_name: Optional[str] = None,
+    ) -> Dict[datetime, int]:
+        """
+        Get event counts per hour for the hours in [start_hour, end_hour).
+
+        Returns: {hour: count}, summed across services unless service_name is given
+        """
+        try:
+            query = db.query(
+                EventHourlyCountModel.hour, func.sum(EventHourlyCountModel.count)
+            ).filter(
+                EventHourlyCountModel.hour >= start_hour,
+                EventHourlyCountModel.hour < end_hour,
+            )
+
+            if service_name:
+                query = query.filter(EventHourlyCountModel.service_name == service_name)
+
+            return {
+                to_datetime(hour): int(count)
+                for hour, count in query.group_by(EventHourlyCountModel.hour).all()
+            }
+        except Exception as e:
+            logger.error(f"Error reading event hourly rollup: {str(e)}")
+            raise
+
+
+def _refresh_job() -> None:
+    db = SessionLocal()
+    try:
+        EventRollupService.refresh(
+            db,
+            start_time=datetime.utcnow() - timedelta(hours=settings.EVENT_ROLLUP_REFRESH_HOURS),
+        )
+    finally:
+        db.close()
+
+
+def start_event_rollup_scheduler() -> None:
+    """Start the background loop recomputing the trailing hours of the rollup"""
+    global _scheduler
+    if not settings.EVENT_ROLLUP_ENABLED or _scheduler is not None:
+        return
+    _scheduler = PeriodicTask(
+        "event-rollup", settings.EVENT_ROLLUP_REFRESH_SECONDS, _refresh_job
+    )
+    _scheduler.start()
+
+
+def stop_event_rollup_scheduler() -> None:
+    global _scheduler
+    if _scheduler is not None:
+        _scheduler.stop(timeout=5)
+        _scheduler = None
@@ -0,0 +1,215 @@
+"""
+Health snapshot service keeping per-service health precomputed for dashboard reads
+"""
+from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, func, text
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any
+from models.events_model import EventModel
+from models.service_snapshot_model import ServiceMetricSnapshotModel
+from core.config import settings, get_logger
+from core.concurrency import fan_out, fanout_timeout
+from core.database import SessionLocal
+from core.scheduler import PeriodicTask
+
+logger = get_logger(__name__)
+
+# Postgres advisory lock so only one API worker refreshes per interval
+SNAPSHOT_LOCK_KEY = 728114901
+
+_scheduler: Optional[PeriodicTask] = None
+
+
+class HealthSnapshotService:
+    """Service for computing and reading service_metric_snapshots"""
+
+    @staticmethod
+    def refresh(db: Session, windows: Optional[List[int]] = None) -> int:
+        """
+        Recompute health for every service over each standard window and store it.
+
+        Also mirrors the shortest window onto the services table. Only the
+        latest snapshot is ever read, so snapshots older than
+        HEALTH_SNAPSHOT_MAX_AGE_SECONDS are pruned rather than kept as history.
+
+        Returns: number of snapshot rows written (0 if another worker holds the lock)
+        """
+        from models.services_model import ServiceModel, ServiceHealthEnum
+        from services.dashboard_service import DashboardService
+        from services.telemetry_service import TelemetryService
+
+        try:
+            if db.bind.dialect.name == "postgresql":
+                acquired = db.execute(
+                    text("SELECT pg_try_advisory_xact_lock(:key)"),
+                    {"key": SNAPSHOT_LOCK_KEY},
+                ).scalar()
+                if not acquired:
+                    return 0
+
+            windows = sorted(windows or settings.HEALTH_SNAPSHOT_WINDOWS)
+            computed_at = datetime.utcnow()
+            services = TelemetryService.get_service_list(db)
+            written = 0
+
+            for window_hours in windows:
+                start_time = computed_at - timedelta(hours=window_hours)
+                # Span counts come from the same latency summary the health uses
+                queries = DashboardService._services_health_queries(services, start_time)
+                queries["event_counts"] = lambda session: dict(
+                    session.query(EventModel.service_name, func.count(EventModel.id))
+                    .filter(EventModel.timestamp >= start_time)
+                    .group_by(EventModel.service_name)
+                    .all()
+                )
+                results = fan_out(db, queries, timeout=fanout_timeout(window_hours))
+                health_list = DashboardService._assemble_services_health(services, results)
+                span_counts = {
+                    service: summary["count"] for service, summary in results["latency"].items()
+                }
+                event_counts = results["event_counts"]
+
+                db.bulk_save_objects(
+                    [
+                        ServiceMetricSnapshotModel(
+                            service_name=health["service_name"],
+                            service_id=health["service_id"],
+                            window_hours=window_hours,
+                            computed_at=computed_at,
+                            status=health["status"],
+                            severity_score=health["severity_score"],
+                            error_rate=health["error_rate"],
+                            error_count=health["error_count"],
+                            total_logs=health["total_logs"],
+                            avg_latency=health["avg_latency"],
+                            span_count=span_counts.get(health["service_name"], 0),
+                            event_count=event_counts.get(health["service_name"], 0),
+                        )
+                        for health in health_list
+                    ]
+                )
+                written += len(health_list)
+
+                if window_hours == windows[0]:
+                    registered = [
+                        {
+                            "service_id": health["service_id"],
+                            "health_status": ServiceHealthEnum(health["status"]),
+                            "avg_latency": health["avg_latency"],
+                            "error_rate": health["error_rate"],
+                        }
+                        for health in health_list
+                        if health["service_id"]
+                    ]
+                    if registered:
+                        services_table = ServiceModel.__table__
+                        db.execute(
+                            services_table.update()
+                            .where(services_table.c.id == bindparam("service_id"))
+                            .values(
+                                health_status=bindparam("health_status"),
+                                avg_latency=bindparam("avg_latency"),
+                                error_rate=bindparam("error_rate"),
+                            ),
+                            registered,
+                        )
+
+            db.query(ServiceMetricSnapshotModel).filter(
+                ServiceMetricSnapshotModel.computed_at
+                < computed_at - timedelta(seconds=settings.HEALTH_SNAPSHOT_MAX_AGE_SECONDS)
+            ).delete(synchronize_session=False)
+
+            db.commit()
+            logger.debug(f"Refreshed {written} service health snapshots")
+            return written
+        except Exception as e:
+            logger.error(f"Error refreshing health snapshots: {str(e)}")
+            db.rollback()
+            raise
+
+    @staticmethod
+    def get_latest_snapshot(
+        db: Session, hours: int, max_age_seconds: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read the most recent snapshot for a window.
+
+        Returns None if the window is not snapshotted or the latest snapshot
+        is older than max_age_seconds, so callers can fall back to live queries.
+        """
+        try:
+            if hours not in settings.HEALTH_SNAPSHOT_WINDOWS:
+                return None
+
+            if max_age_seconds is None:
+                max_age_seconds = settings.HEALTH_SNAPSHOT_MAX_AGE_SECONDS
+
+            computed_at = (
+                db.query(func.max(ServiceMetricSnapshotModel.computed_at))
+                .filter(ServiceMetricSnapshotModel.window_hours == hours)
+                .scalar()
+            )
+            if computed_at is None:
+                return None
+            if computed_at < datetime.utcnow() - timedelta(seconds=max_age_seconds):
+                return None
+
+            rows = (
+                db.query(ServiceMetricSnapshotModel)
+                .filter(
+                    ServiceMetricSnapshotModel.window_hours == hours,
+                    ServiceMetricSnapshotModel.computed_at == computed_at,
+                )
+                .order_by(ServiceMetricSnapshotModel.service_name)
+                .all()
+            )
+
+            return {
+                "computed_at": computed_at,
+                "service_health": [
+                    {
+                        "service_id": row.service_id,
+                        "service_name": row.service_name,
+                        "version": "v1.0",
+                        "status": row.status,
+                        "severity_score": row.severity_score,
+                        "error_rate": row.error_rate,
+                        "avg_latency": row.avg_latency,
+                        "error_count": row.error_count,
+                        "total_logs": row.total_logs,
+                    }
+                    for row in rows
+                ],
+                "total_logs": sum(row.total_logs for row in rows),
+                "total_traces": sum(row.span_count for row in rows),
+                "total_events": sum(row.event_count for row in rows),
+            }
+        except Exception as e:
+            logger.error(f"Error reading health snapshot: {str(e)}")
+            raise
+
+
+def _refresh_job() -> None:
+    db = SessionLocal()
+    try:
+        HealthSnapshotService.refresh(db)
+    finally:
+        db.close()
+
+
+def start_snapshot_scheduler() -> None:
+    """Start the background refresh loop if snapshots are enabled"""
+    global _scheduler
+    if not settings.HEALTH_SNAPSHOT_ENABLED or _scheduler is not None:
+        return
+    _scheduler = PeriodicTask(
+        "health-snapshots", settings.HEALTH_SNAPSHOT_INTERVAL_SECONDS, _refresh_job
+    )
+    _scheduler.start()
+
+
+def stop_snapshot_scheduler() -> None:
+    global _scheduler
+    if _scheduler is not None:
+        _scheduler.stop(timeout=5)
+        _scheduler = None
@@ -0,0 +1,209 @@
+"""
+Incident memory service recording confirmed root causes and retrieving similar past incidents
+"""
+import os
+import threading
+from typing import Any, Dict, List, Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from models.rca_model import RCAJobModel, AIDecisionModel, ResolvedIncidentModel
+from core.config import settings, get_logger
+from core.incident_embedding import embed
+
+logger = get_logger(__name__)
+
+# Built on first lookup; NumPy and the index load only when history is queried
+_index = None
+_index_meta: Dict[str, Any] = {}
+_index_lock = threading.Lock()
+
+
+class IncidentMemoryService:
+    """Service for resolved incidents and the vector index over their fingerprints"""
+
+    @staticmethod
+    def _watermark(db: Session) -> Dict[str, Any]:
+        """Identity of the indexed set; the index is stale when this changes"""
+        count, max_id = db.query(
+            func.count(ResolvedIncidentModel.id), func.max(ResolvedIncidentModel.id)
+        ).one()
+        return {"count": count, "max_id": max_id, "dim": settings.INCIDENT_EMBEDDING_DIM}
+
+    @staticmethod
+    def _save_index(index, meta: Dict[str, Any]) -> None:
+        if not settings.INCIDENT_INDEX_PATH:
+            return
+        try:
+            index.save(settings.INCIDENT_INDEX_PATH, meta)
+        except OSError as e:
+            logger.error(f"Error saving incident index: {str(e)}")
+
+    @staticmethod
+    def _get_index(db: Session):
+        """
+        The in-process index, in sync with resolved_incidents.
+
+        Reuses the loaded index while the watermark matches, then the file
+        at INCIDENT_INDEX_PATH, and otherwise rebuilds from the table (for
+        example after another worker recorded a resolution).
+        """
+        global _index, _index_meta
+        from core.vector_index import IVFIndex
+
+        watermark = IncidentMemoryService._watermark(db)
+        with _index_lock:
+            if _index is not None and _index_meta == watermark:
+                return _index
+
+            path = settings.INCIDENT_INDEX_PATH
+            if path and os.path.exists(path):
+                try:
+                    index, meta = IVFIndex.load(path)
+                    if meta == watermark:
+                        _index, _index_meta = index, meta
+                        return _index
+                except (OSError, ValueError, KeyError) as e:
+                    logger.error(f"Error loading incident index from {path}: {str(e)}")
+
+            import numpy as np
+
+            rows = db.query(ResolvedIncidentModel.id, ResolvedIncidentModel.fingerprint).all()
+            dim = settings.INCIDENT_EMBEDDING_DIM
+            index = IVFIndex(dim)
+            vectors = np.zeros((len(rows), dim), dtype=np.float32)
+            for row, (_, fingerprint) in enumerate(rows):
+                vectors[row] = embed(fingerprint or {}, dim)
+            index.add_many([id_ for id_, _ in rows], vectors)
+            logger.info(f"Rebuilt incident index with {len(rows)} resolved incidents")
+
+            _index, _index_meta = index, watermark
+            IncidentMemoryService._save_index(index, watermark)
+            return _index
+
+    @staticmethod
+    def _serialize(incident: ResolvedIncidentModel) -> Dict[str, Any]:
+        return {
+            "incident_id": incident.id,
+            "job_id": incident.job_id,
+            "service_name": incident.service_name,
+            "root_cause": incident.root_cause,
+            "notes": incident.notes,
+            "window_end": incident.window_end.isoformat(),
+            "resolved_at": incident.resolved_at.isoformat(),
+        }
+
+    @staticmethod
+    def record_resolution(
+        db: Session,
+        job_id: int,
+        root_cause: str,
+        notes: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Confirm the root cause of a succeeded RCA job and index its fingerprint.
+
+        Confirming the same job again updates its root cause and notes.
+        Raises ValueError if the job has not succeeded or predates
+        fingerprinting.
+
+        Returns the resolved incident, or None if the job does not exist.
+        """
+        global _index_meta
+        try:
+            job = db.get(RCAJobModel, job_id)
+            if job is None:
+                return None
+            if job.status != "succeeded":
+                raise ValueError(f"Job {job_id} is {job.status}; only succeeded analyses can be resolved")
+
+            decision = (
+                db.query(AIDecisionModel.input_snapshot)
+                .filter(AIDecisionModel.job_id == job.id)
+                .order_by(AIDecisionModel.id.desc())
+                .first()
+            )
+            fingerprint = (decision.input_snapshot or {}).get("fingerprint") if decision else None
+            if not fingerprint:
+                raise ValueError(f"Job {job_id} has no telemetry fingerprint; rerun the analysis")
+
+            before = IncidentMemoryService._watermark(db)
+            incident = (
+                db.query(ResolvedIncidentModel)
+                .filter(ResolvedIncidentModel.job_id == job.id)
+                .first()
+            )
+            if incident is None:
+                incident = ResolvedIncidentModel(
+                    job_id=job.id,
+                    service_name=job.service_name,
+                    fingerprint=fingerprint,
+                    window_end=job.window_end,
+                )
+                db.add(incident)
+            incident.root_cause = root_cause
+            incident.notes = notes
+            db.commit()
+            db.refresh(incident)
+
+            # Extend a current index in place; a stale one is rebuilt on the next lookup
+            with _index_lock:
+                if _index is not None and _index_meta == before:
+                    _index.add(incident.id, embed(fingerprint, settings.INCIDENT_EMBEDDING_DIM))
+                    _index_meta = IncidentMemoryService._watermark(db)
+                    IncidentMemoryService._save_index(_index, _index_meta)
+
+            return IncidentMemoryService._serialize(incident)
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error recording resolution for RCA job {job_id}: {str(e)}")
+            db.rollback()
+            raise
+
+    @staticmethod
+    def find_similar(
+        db: Session,
+        fingerprint: Dict[str, float],
+        k: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Past resolved incidents whose telemetry fingerprint resembles this one.
+
+        Matches below SIMILAR_INCIDENTS_MIN_SIMILARITY are dropped.
+
+        Returns up to k incidents with their confirmed root cause and
+        similarity, most similar first.
+        """
+        try:
+            k = k or settings.SIMILAR_INCIDENTS_TOP_K
+            if not fingerprint:
+                return []
+            index = IncidentMemoryService._get_index(db)
+            if not len(index):
+                return []
+
+            hits = index.search(
+                embed(fingerprint, settings.INCIDENT_EMBEDDING_DIM),
+                k,
+                nprobe=settings.INCIDENT_INDEX_NPROBE,
+            )
+            similarity = {
+                id_: score for id_, score in hits if score >= settings.SIMILAR_INCIDENTS_MIN_SIMILARITY
+            }
+            if not similarity:
+                return []
+
+            incidents = (
+                db.query(ResolvedIncidentModel)
+                .filter(ResolvedIncidentModel.id.in_(list(similarity)))
+                .all()
+            )
+            results = [
+                {**IncidentMemoryService._serialize(incident), "similarity": round(similarity[incident.id], 3)}
+                for incident in incidents
+            ]
+            results.sort(key=lambda incident: -incident["similarity"])
+            return results
+        except Exception as e:
+            logger.error(f"Error finding similar incidents: {str(e)}")
+            raise
@@ -0,0 +1,344 @@
+"""
+Ingest service bulk-loading NDJSON telemetry batches
+"""
+import json
+import math
+import tempfile
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from models.logs_model import LogModel
+from models.metrics_model import MetricsModel
+from models.traces_model import TracesModel
+from models.events_model import EventModel
+from core.config import settings, get_logger
+from core.ndjson import NDJSONDecoder
+from core.sketch import DDSketch
+from services.latency_rollup_service import LatencyRollupService, SketchKey
+from services.service_registry_service import ServiceRegistryService
+from services.event_rollup_service import EventRollupService
+
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+
+def _field(data: Dict[str, Any], *names: str, default: Any = _MISSING) -> Any:
+    """First present field among names (fixture name first, then column name)"""
+    for name in names:
+        value = data.get(name)
+        if value is not None:
+            return value
+    if default is _MISSING:
+        raise ValueError(f"missing field {names[0]!r}")
+    return default
+
+
+def _text(data: Dict[str, Any], *names: str, default: Any = _MISSING) -> Optional[str]:
+    """Field as a string; only JSON strings and numbers are accepted, so the row can always be bound"""
+    value = _field(data, *names, default=default)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise ValueError(f"field {names[0]!r} must be a string or number")
+    return str(value)
+
+
+def _number(data: Dict[str, Any], *names: str) -> float:
+    """Field as a finite float, from a JSON number or numeric string"""
+    value = _field(data, *names)
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise ValueError(f"field {names[0]!r} must be a number")
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f"field {names[0]!r} must be finite")
+    return number
+
+
+def _timestamp(data: Dict[str, Any]) -> datetime:
+    """ISO 8601 string or epoch seconds, as naive UTC like the rest of the schema"""
+    value = _field(data, "timestamp")
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise ValueError("field 'timestamp' must be an ISO 8601 string or epoch seconds")
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, timezone.utc).replace(tzinfo=None)
+    parsed = datetime.fromisoformat(str(value))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _log_row(data: Dict[str, Any], now: datetime) -> tuple:
+    return (
+        _text(data, "service", "service_name"),
+        _timestamp(data),
+        _text(data, "level", default="INFO").upper(),
+        _text(data, "message"),
+        _text(data, "trace_id", default=None),
+        now,
+    )
+
+
+def _metric_row(data: Dict[str, Any], now: datetime) -> tuple:
+    return (
+        _text(data, "service", "service_name"),
+        _text(data, "metric", "metric_name"),
+        _number(data, "value"),
+        _text(data, "unit", default=None),
+        _timestamp(data),
+        now,
+    )
+
+
+def _trace_row(data: Dict[str, Any], now: datetime) -> tuple:
+    return (
+        _text(data, "trace_id"),
+        _text(data, "span_id"),
+        _text(data, "parent_span_id", default=None),
+        _text(data, "service", "service_name"),
+        _text(data, "operation"),
+        _number(data, "duration_ms", "duration"),
+        _timestamp(data),
+        _text(data, "status", default=None),
+        now,
+    )
+
+
+def _event_row(data: Dict[str, Any], now: datetime) -> tuple:
+    return (
+        _text(data, "service", "service_name"),
+        _timestamp(data),
+        _text(data, "type"),
+        _text(data, "details", default=""),
+        _text(data, "severity", default="info"),
+        now,
+    )
+
+
+class IngestSpec:
+    """Target table, column order and row parser of one telemetry signal"""
+
+    def __init__(self, model, columns: Tuple[str, ...], parse: Callable[[Dict[str, Any], datetime], tuple]):
+        self.model = model
+        self.columns = columns
+        self.parse = parse
+        self.service_index = columns.index("service_name")
+        self.timestamp_index = columns.index("timestamp")
+
+
+SIGNALS: Dict[str, IngestSpec] = {
+    "logs": IngestSpec(
+        LogModel,
+        ("service_name", "timestamp", "level", "message", "trace_id", "created_at"),
+        _log_row,
+    ),
+    "metrics": IngestSpec(
+        MetricsModel,
+        ("service_name", "metric_name", "value", "unit", "timestamp", "created_at"),
+        _metric_row,
+    ),
+    "traces": IngestSpec(
+        TracesModel,
+        (
+            "trace_id", "span_id", "parent_span_id", "service_name", "operation",
+            "duration", "timestamp", "status", "created_at",
+        ),
+        _trace_row,
+    ),
+    "events": IngestSpec(
+        EventModel,
+        ("service_name", "timestamp", "type", "details", "severity", "created_at"),
+        _event_row,
+    ),
+}
+
+
+class IngestWriter:
+    """
+    Parse NDJSON chunks for one signal and write them in batches.
+
+    Rows go out INGEST_BATCH_ROWS at a time with COPY FROM STDIN on
+    PostgreSQL (psycopg) and a multi-row executemany elsewhere. Service
+    registry and rollup updates are aggregated in memory and applied once
+    in finish, in key order, so the shared rows are locked only briefly
+    and concurrent requests cannot deadlock. Nothing is committed until
+    finish, so a request lands atomically. Lines that are not valid JSON
+    or lack required fields are skipped and reported.
+    """
+
+    def __init__(self, db: Session, signal: str):
+        if signal not in SIGNALS:
+            raise ValueError(f"Unknown telemetry signal: {signal}")
+        self.db = db
+        self.signal = signal
+        self.spec = SIGNALS[signal]
+        self.decoder = NDJSONDecoder(max_line_bytes=settings.INGEST_MAX_LINE_BYTES)
+        self.now = datetime.utcnow()
+        self.rows: List[tuple] = []
+        self.accepted = 0
+        self.rejected = 0
+        self.errors: List[str] = []
+        self.seen: Dict[str, Tuple[datetime, datetime]] = {}
+        self.sketches: Dict[SketchKey, DDSketch] = {}
+        self.counts: Dict[Tuple[str, datetime], int] = {}
+        bind = db.get_bind()
+        self.use_copy = bind.dialect.name == "postgresql" and bind.dialect.driver == "psycopg"
+
+    def _add_lines(self, lines: Iterable[bytes], first_line: int) -> None:
+        parse, now = self.spec.parse, self.now
+        for line_number, line in enumerate(lines, first_line):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+                if not isinstance(data, dict):
+                    raise ValueError("expected a JSON object")
+                self.rows.append(parse(data, now))
+            # OverflowError and OSError come from out-of-range epoch timestamps
+            except (ValueError, TypeError, OverflowError, OSError) as e:
+                self.rejected += 1
+                if len(self.errors) < settings.INGEST_MAX_ERRORS:
+                    self.errors.append(f"line {line_number}: {str(e)}")
+            if len(self.rows) >= settings.INGEST_BATCH_ROWS:
+                self.flush()
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse the complete lines in chunk, writing full batches as they fill"""
+        first_line = self.decoder.lines_seen + 1
+        self._add_lines(self.decoder.feed(chunk), first_line)
+
+    def _write(self, rows: List[tuple]) -> None:
+        table = self.spec.model.__table__
+        if self.use_copy:
+            cursor = self.db.connection().connection.cursor()
+            try:
+                with cursor.copy(f"COPY {table.name} ({', '.join(self.spec.columns)}) FROM STDIN") as copy:
+                    for row in rows:
+                        copy.write_row(row)
+            finally:
+                cursor.close()
+        else:
+            columns = self.spec.columns
+            self.db.execute(table.insert(), [dict(zip(columns, row)) for row in rows])
+
+    def _aggregate(self, rows: List[tuple]) -> None:
+        service_index, timestamp_index = self.spec.service_index, self.spec.timestamp_index
+        seen = self.seen
+        for row in rows:
+            service_name, timestamp = row[service_index], row[timestamp_index]
+            first_seen, last_seen = seen.get(service_name, (timestamp, timestamp))
+            seen[service_name] = (min(first_seen, timestamp), max(last_seen, timestamp))
+        if self.signal == "traces":
+            LatencyRollupService.sketch_spans(((row[3], row[4], row[6], row[5]) for row in rows), self.sketches)
+        elif self.signal == "events":
+            EventRollupService.count_hours(((row[0], row[1]) for row in rows), self.counts)
+
+    def _record(self) -> None:
+        """Apply the aggregated registry and rollup updates, locking rows in key order"""
+        ServiceRegistryService.record(
+            self.db,
+            self.signal,
+            (
+                (service_name, timestamp)
+                for service_name, (first_seen, last_seen) in self.seen.items()
+                for timestamp in (first_seen, last_seen)
+            ),
+        )
+        if self.sketches:
+            LatencyRollupService.record_sketches(self.db, self.sketches)
+        if self.counts:
+            EventRollupService.record_counts(self.db, self.counts)
+
+    def flush(self) -> None:
+        """Write buffered rows and aggregate their registry and rollup updates, without committing"""
+        if not self.rows:
+            return
+        rows, self.rows = self.rows, []
+        self._write(rows)
+        self._aggregate(rows)
+        self.accepted += len(rows)
+
+    def finish(self) -> Dict[str, Any]:
+        """
+        Write the remaining rows, apply registry and rollup updates and commit the request.
+
+        Returns the signal with accepted and rejected line counts and the first rejections.
+        """
+        first_line = self.decoder.lines_seen + 1
+        self._add_lines(self.decoder.close(), first_line)
+        self.flush()
+        self._record()
+        self.db.commit()
+        return {
+            "signal": self.signal,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "errors": self.errors,
+        }
+
+    def abort(self) -> None:
+        self.db.rollback()
+
+
+def _read_chunks(body: BinaryIO, read_bytes: int) -> Iterator[bytes]:
+    while True:
+        chunk = body.read(read_bytes)
+        if not chunk:
+            return
+        yield chunk
+
+
+class IngestService:
+    """Service for bulk telemetry ingestion"""
+
+    @staticmethod
+    def ingest(db: Session, signal: str, chunks: Iterable[bytes]) -> Dict[str, Any]:
+        """
+        Load a (possibly gzipped) NDJSON body for one signal.
+
+        Raises ValueError for an unknown signal or a malformed body, in
+        which case nothing is written.
+
+        Returns accepted and rejected line counts and the first rejections.
+        """
+        writer = IngestWriter(db, signal)
+        try:
+            for chunk in chunks:
+                writer.feed(chunk)
+            return writer.finish()
+        except ValueError:
+            writer.abort()
+            raise
+        except Exception as e:
+            logger.error(f"Error ingesting {signal}: {str(e)}")
+            writer.abort()
+            raise
+
+    @staticmethod
+    async def ingest_stream(
+        db: Session, signal: str, stream: AsyncIterator[bytes], read_bytes: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Load a request body once it has fully arrived.
+
+        The body is spooled to memory, or a temporary file past
+        INGEST_SPOOL_MEMORY_BYTES, so no transaction is open while a slow
+        client uploads. It is then parsed and written in a worker thread,
+        read_bytes at a time. Raises ValueError once the body exceeds
+        INGEST_MAX_BODY_BYTES.
+
+        Returns accepted and rejected line counts and the first rejections.
+        """
+        if signal not in SIGNALS:
+            raise ValueError(f"Unknown telemetry signal: {signal}")
+        read_bytes = read_bytes or settings.INGEST_READ_BYTES
+        with tempfile.SpooledTemporaryFile(max_size=settings.INGEST_SPOOL_MEMORY_BYTES) as body:
+            size = 0
+            async for chunk in stream:
+                size += len(chunk)
+                if size > settings.INGEST_MAX_BODY_BYTES:
+                    raise ValueError(f"Request body exceeds {settings.INGEST_MAX_BODY_BYTES} bytes")
+                body.write(chunk)
+            body.seek(0)
+            return await run_in_threadpool(IngestService.ingest, db, signal, _read_chunks(body, read_bytes))
@@ -0,0 +1,327 @@
+"""
+Latency rollup service maintaining per-minute mergeable latency sketches
+"""
+from sqlalchemy.orm import Session
+from sqlalchemy import tuple_
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Iterable, Tuple
+from models.traces_model import TracesModel
+from models.latency_sketch_model import LatencySketchModel
+from core.config import settings, get_logger
+from core.sketch import DDSketch
+
+logger = get_logger(__name__)
+
+# (service_name, operation, minute)
+SketchKey = Tuple[str, str, datetime]
+
+
+def floor_minute(timestamp: datetime) -> datetime:
+    return timestamp.replace(second=0, microsecond=0)
+
+
+class LatencyRollupService:
+    """Service for maintaining and querying the latency_sketches rollup"""
+
+    @staticmethod
+    def _new_sketch() -> DDSketch:
+        return DDSketch(relative_accuracy=settings.SKETCH_RELATIVE_ACCURACY)
+
+    @staticmethod
+    def _lock_rows(db: Session, keys) -> Dict[SketchKey, LatencySketchModel]:
+        """Lock existing rollup rows for keys, in key order so concurrent writers cannot deadlock"""
+        if not keys:
+            return {}
+        rows = (
+            db.query(LatencySketchModel)
+            .filter(
+                tuple_(
+                    LatencySketchModel.service_name,
+                    LatencySketchModel.operation,
+                    LatencySketchModel.minute,
+                ).in_(list(keys))
+            )
+            .order_by(
+                LatencySketchModel.service_name,
+                LatencySketchModel.operation,
+                LatencySketchModel.minute,
+            )
+            .with_for_update()
+            .all()
+        )
+        return {(row.service_name, row.operation, row.minute): row for row in rows}
+
+    @staticmethod
+    def _merge_into_rollup(db: Session, sketches: Dict[SketchKey, DDSketch]) -> None:
+        """
+        Merge sketches into their existing rollup rows, creating missing rows.
+
+        On PostgreSQL and SQLite missing rows are inserted with ON CONFLICT
+        DO NOTHING; keys another transaction created first are then locked
+        and merged like any existing row.
+        """
+        if not sketches:
+            return
+
+        keys = sorted(sketches)
+        rows = LatencyRollupService._lock_rows(db, keys)
+        missing = [key for key in keys if key not in rows]
+        inserted = set()
+
+        dialect = db.bind.dialect.name
+        if missing and dialect in ("postgresql", "sqlite"):
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+
+            table = LatencySketchModel.__table__
+            now = datetime.utcnow()
+            statement = (
+                insert(LatencySketchModel)
+                .values(
+                    [
+                        {
+                            "service_name": service_name,
+                            "operation": operation,
+                            "minute": minute,
+                            "count": sketches[(service_name, operation, minute)].count,
+                            "sketch": sketches[(service_name, operation, minute)].to_json(),
+                            "updated_at": now,
+                        }
+                        for service_name, operation, minute in missing
+                    ]
+                )
+                .on_conflict_do_nothing(
+                    index_elements=[table.c.service_name, table.c.operation, table.c.minute]
+                )
+                .returning(table.c.service_name, table.c.operation, table.c.minute)
+            )
+            inserted = {tuple(row) for row in db.execute(statement)}
+            conflicted = [key for key in missing if key not in inserted]
+            rows.update(LatencyRollupService._lock_rows(db, conflicted))
+
+        for key in keys:
+            if key in inserted:
+                continue
+            row = rows.get(key)
+            sketch = sketches[key]
+            if row is None:
+                service_name, operation, minute = key
+                db.add(
+                    LatencySketchModel(
+                        service_name=service_name,
+                        operation=operation,
+                        minute=minute,
+                        count=sketch.count,
+                        sketch=sketch.to_json(),
+                    )
+                )
+                continue
+
+            merged = DDSketch.from_json(row.sketch)
+            merged.merge(sketch)
+            row.sketch = merged.to_json()
+            row.count = merged.count
+
+    @staticmethod
+    def sketch_spans(
+        spans: Iterable[Tuple[str, str, datetime, float]],
+        sketches: Optional[Dict[SketchKey, DDSketch]] = None,
+    ) -> Dict[SketchKey, DDSketch]:
+        """
+        Add (service_name, operation, timestamp, duration) spans to per-minute sketches.
+
+        Returns: the sketches, keyed by (service_name, operation, minute)
+        """
+        sketches = {} if sketches is None else sketches
+        for service_name, operation, timestamp, duration in spans:
+            key = (service_name, operation, floor_minute(timestamp))
+            sketch = sketches.get(key)
+            if sketch is None:
+                sketch = sketches[key] = LatencyRollupService._new_sketch()
+            sketch.add(duration)
+        return sketches
+
+    @staticmethod
+    def record_sketches(db: Session, sketches: Dict[SketchKey, DDSketch]) -> None:
+        """
+        Merge per-minute sketches built by sketch_spans into the rollup.
+
+        Changes are flushed but not committed so they land in the same
+        transaction as the raw span inserts.
+        """
+        try:
+            LatencyRollupService._merge_into_rollup(db, sketches)
+            db.flush()
+        except Exception as e:
+            logger.error(f"Error recording spans into latency rollup: {str(e)}")
+            raise
+
+    @staticmethod
+    def record_spans(
+        db: Session,
+        spans: Iterable[Tuple[str, str, datetime, float]],
+    ) -> int:
+        """
+        Fold newly ingested spans into the rollup.
+
+        spans yields (service_name, operation, timestamp, duration). Changes
+        are flushed but not committed so they land in the same transaction
+        as the raw span inserts.
+
+        Returns: number of spans recorded
+        """
+        sketches = LatencyRollupService.sketch_spans(spans)
+        LatencyRollupService.record_sketches(db, sketches)
+        return sum(sketch.count for sketch in sketches.values())
+
+    @staticmethod
+    def rebuild(
+        db: Session,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> int:
+        """
+        Recompute the rollup from raw traces for the minutes in [start_time, end_time).
+
+        Spans are streamed in timestamp order and each minute is written as
+        soon as it is complete, so memory is bounded by one minute of keys.
+
+        Returns: number of rollup rows written
+        """
+        try:
+            rollup_query = db.query(LatencySketchModel)
+            traces_query = db.query(
+                TracesModel.service_name,
+                TracesModel.operation,
+                TracesModel.timestamp,
+                TracesModel.duration,
+            )
+
+            if start_time:
+                start_time = floor_minute(start_time)
+                rollup_query = rollup_query.filter(LatencySketchModel.minute >= start_time)
+                traces_query = traces_query.filter(TracesModel.timestamp >= start_time)
+
+            if end_time:
+                end_time = floor_minute(end_time)
+                rollup_query = rollup_query.filter(LatencySketchModel.minute < end_time)
+                traces_query = traces_query.filter(TracesModel.timestamp < end_time)
+
+            rollup_query.delete(synchronize_session=False)
+
+            written = 0
+            current_minute = None
+            sketches: Dict[SketchKey, DDSketch] = {}
+
+            for service_name, operation, timestamp, duration in traces_query.order_by(
+                TracesModel.timestamp
+            ).yield_per(settings.TELEMETRY_STREAM_CHUNK_SIZE):
+                minute = floor_minute(timestamp)
+                if minute != current_minute:
+                    written += LatencyRollupService._write_sketches(db, sketches)
+                    sketches = {}
+                    current_minute = minute
+
+                key = (service_name, operation, minute)
+                sketch = sketches.get(key)
+                if sketch is None:
+                    sketch = sketches[key] = LatencyRollupService._new_sketch()
+                sketch.add(duration)
+
+            written += LatencyRollupService._write_sketches(db, sketches)
+            db.commit()
+
+            logger.info(f"Rebuilt latency rollup: {written} rows")
+            return written
+        except Exception as e:
+            logger.error(f"Error rebuilding latency rollup: {str(e)}")
+            db.rollback()
+            raise
+
+    @staticmethod
+    def _write_sketches(db: Session, sketches: Dict[SketchKey, DDSketch]) -> int:
+        db.bulk_save_objects(
+            [
+                LatencySketchModel(
+                    service_name=service_name,
+                    operation=operation,
+                    minute=minute,
+                    count=sketch.count,
+                    sketch=sketch.to_json(),
+                )
+                for (service_name, operation, minute), sketch in sketches.items()
+            ]
+        )
+        return len(sketches)
+
+    @staticmethod
+    def get_window_sketch(
+        db: Session,
+        service_name: Optional[str] = None,
+        operation: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> DDSketch:
+        """
+        Build a latency sketch for an arbitrary window.
+
+        Whole minutes are answered by merging rollup rows; only the partial
+        minutes at either edge of the window are read from raw traces.
+        """
+        try:
+            sketch = LatencyRollupService._new_sketch()
+
+            rollup_query = db.query(LatencySketchModel.sketch)
+            raw_query = db.query(TracesModel.duration)
+
+            if service_name:
+                rollup_query = rollup_query.filter(LatencySketchModel.service_name == service_name)
+                raw_query = raw_query.filter(TracesModel.service_name == service_name)
+
+            if operation:
+                rollup_query = rollup_query.filter(LatencySketchModel.operation == operation)
+                raw_query = raw_query.filter(TracesModel.operation == operation)
+
+            # Whole minutes covered by the window are [full_start, full_end)
+            full_start = None
+            if start_time:
+                full_start = floor_minute(start_time)
+                if full_start != start_time:
+                    full_start += timedelta(minutes=1)
+            full_end = floor_minute(end_time) if end_time else None
+
+            raw_ranges = []
+            if full_start and full_end and full_start > full_end:
+                raw_ranges.append((start_time, end_time, True))
+            else:
+                if full_start and full_start != start_time:
+                    raw_ranges.append((start_time, full_start, False))
+                if full_end:
+                    raw_ranges.append((full_end, end_time, True))
+
+                if full_start:
+                    rollup_query = rollup_query.filter(LatencySketchModel.minute >= full_start)
+                if full_end:
+                    rollup_query = rollup_query.filter(LatencySketchModel.minute < full_end)
+
+                for (payload,) in rollup_query.yield_per(settings.TELEMETRY_STREAM_CHUNK_SIZE):
+                    sketch.merge(DDSketch.from_json(payload))
+
+            # The window end is inclusive, the boundary into whole minutes is not
+            for range_start, range_end, inclusive in raw_ranges:
+                end_filter = (
+                    TracesModel.timestamp <= range_end
+                    if inclusive
+                    else TracesModel.timestamp < range_end
+                )
+                for (duration,) in raw_query.filter(
+                    TracesModel.timestamp >= range_start, end_filter
+                ):
+                    sketch.add(duration)
+
+            return sketch
+        except Exception as e:
+            logger.error(f"Error reading latency rollup: {str(e)}")
+            raise
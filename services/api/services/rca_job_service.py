@@ -0,0 +1,413 @@
+"""
+RCA job service queuing correlation analyses for background workers
+"""
+import asyncio
+import hashlib
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from models.rca_model import RCAJobModel, RootCauseHypothesisModel, AIDecisionModel
+from core.config import settings, get_logger
+from core.database import SessionLocal
+from core.scheduler import PeriodicTask
+from core.time_buckets import floor_bucket
+from services.ai_service import get_ai_service
+from services.dashboard_service import DashboardService
+
+logger = get_logger(__name__)
+
+FINISHED_STATUSES = ("succeeded", "failed")
+
+# How often a client waiting on a job re-reads its status
+_WAIT_POLL_SECONDS = 0.5
+
+_pool: Optional["RCAWorkerPool"] = None
+
+
+class RCAJobService:
+    """Service for the rca_jobs queue and the results its workers persist"""
+
+    @staticmethod
+    def dedup_key(
+        service_name: Optional[str],
+        hours: int,
+        max_lag_minutes: Optional[int],
+        window_end: datetime,
+    ) -> str:
+        """Identity of an analysis; submissions with the same key share one job"""
+        payload = f"{service_name or '*'}|{hours}|{max_lag_minutes}|{window_end.isoformat()}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def submit(
+        db: Session,
+        service_name: Optional[str] = None,
+        hours: int = 1,
+        max_lag_minutes: Optional[int] = None,
+    ) -> Tuple[RCAJobModel, bool]:
+        """
+        Queue a correlation analysis of the hours before the current dedup slot.
+
+        The window end is floored to RCA_JOB_DEDUP_SECONDS, so identical
+        requests within a slot return the existing job instead of queuing
+        another. A failed job is requeued rather than duplicated.
+
+        Returns: (job, created) where created is False for a deduplicated submission
+        """
+        try:
+            window_end = floor_bucket(
+                datetime.utcnow(), timedelta(seconds=settings.RCA_JOB_DEDUP_SECONDS)
+            )
+            key = RCAJobService.dedup_key(service_name, hours, max_lag_minutes, window_end)
+
+            job = db.query(RCAJobModel).filter(RCAJobModel.dedup_key == key).first()
+            if job is not None:
+                if job.status != "failed":
+                    return job, False
+                job.status = "queued"
+                job.attempts = 0
+                job.error = None
+                job.started_at = None
+                job.finished_at = None
+                db.commit()
+                _notify_workers()
+                return job, True
+
+            job = RCAJobModel(
+                dedup_key=key,
+                service_name=service_name,
+                hours=hours,
+                max_lag_minutes=max_lag_minutes,
+                window_end=window_end,
+                status="queued",
+                attempts=0,
+            )
+            db.add(job)
+            try:
+                db.commit()
+            except IntegrityError:
+                # A concurrent submission for the same window won the insert
+                db.rollback()
+                return db.query(RCAJobModel).filter(RCAJobModel.dedup_key == key).one(), False
+            db.refresh(job)
+            _notify_workers()
+            return job, True
+        except Exception as e:
+            logger.error(f"Error submitting RCA job: {str(e)}")
+            db.rollback()
+            raise
+
+    @staticmethod
+    def claim_next(db: Session) -> Optional[int]:
+        """
+        Atomically move the oldest queued job, or a running job whose worker
+        went quiet for RCA_JOB_STALE_SECONDS, to running.
+
+        Safe across threads and processes: the status/attempts compare-and-set
+        means only one worker can claim a given job.
+
+        Returns: the claimed job id, or None if nothing is runnable
+        """
+        now = datetime.utcnow()
+        stale_before = now - timedelta(seconds=settings.RCA_JOB_STALE_SECONDS)
+        candidate = (
+            db.query(RCAJobModel.id, RCAJobModel.status, RCAJobModel.attempts)
+            .filter(
+                or_(
+                    RCAJobModel.status == "queued",
+                    and_(RCAJobModel.status == "running", RCAJobModel.started_at < stale_before),
+                )
+            )
+            .order_by(RCAJobModel.created_at, RCAJobModel.id)
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+        if candidate is None:
+            db.rollback()
+            return None
+
+        claimed = (
+            db.query(RCAJobModel)
+            .filter(
+                RCAJobModel.id == candidate.id,
+                RCAJobModel.status == candidate.status,
+                RCAJobModel.attempts == candidate.attempts,
+            )
+            .update(
+                {"status": "running", "started_at": now, "attempts": candidate.attempts + 1},
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        return candidate.id if claimed else None
+
+    @staticmethod
+    def _owned(db: Session, job_id: int, attempts: int):
+        """Query for the job while it is still the running attempt this worker claimed"""
+        return db.query(RCAJobModel).filter(
+            RCAJobModel.id == job_id,
+            RCAJobModel.status == "running",
+            RCAJobModel.attempts == attempts,
+        )
+
+    @staticmethod
+    def _heartbeat(job_id: int, attempts: int) -> None:
+        """Refresh started_at of a running attempt so claim_next does not treat it as stale"""
+        db = SessionLocal()
+        try:
+            RCAJobService._owned(db, job_id, attempts).update(
+                {"started_at": datetime.utcnow()}, synchronize_session=False
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    @staticmethod
+    def run(db: Session, job_id: int) -> None:
+        """
+        Execute a claimed job and persist its hypothesis and decision record.
+
+        While the analysis runs, started_at is refreshed every
+        RCA_JOB_HEARTBEAT_SECONDS so long analyses are not reclaimed by
+        another worker. Results are only committed if this attempt still
+        owns the job. Failures are requeued until RCA_JOB_MAX_ATTEMPTS,
+        then marked failed.
+        """
+        job = db.get(RCAJobModel, job_id)
+        if job is None:
+            return
+        if job.attempts > settings.RCA_JOB_MAX_ATTEMPTS:
+            job.status = "failed"
+            job.error = job.error or "Exceeded maximum attempts"
+            job.finished_at = datetime.utcnow()
+            db.commit()
+            return
+
+        attempts = job.attempts
+        heartbeat = PeriodicTask(
+            f"rca-job-{job_id}-heartbeat",
+            settings.RCA_JOB_HEARTBEAT_SECONDS,
+            lambda: RCAJobService._heartbeat(job_id, attempts),
+        )
+        heartbeat.start()
+        try:
+            RCAJobService._run_attempt(db, job, attempts)
+        finally:
+            heartbeat.stop()
+
+    @staticmethod
+    def _run_attempt(db: Session, job: RCAJobModel, attempts: int) -> None:
+        job_id = job.id
+        try:
+            analysis = DashboardService.get_correlation_analysis(
+                db,
+                service_name=job.service_name,
+                hours=job.hours,
+                max_lag_minutes=job.max_lag_minutes,
+                end_time=job.window_end,
+                # Jobs run off the request path, so long windows are not cut short
+                timeout=None,
+            )
+        except Exception as e:
+            logger.error(f"Error running RCA job {job_id}: {str(e)}")
+            RCAJobService._record_failure(db, job_id, attempts, e)
+            return
+
+        try:
+            # The fingerprint is analysis input; it is kept for resolving the incident later
+            fingerprint = analysis.get("fingerprint")
+            analysis = jsonable_encoder(
+                {key: value for key, value in analysis.items() if key != "fingerprint"}
+            )
+            prediction = analysis["ai_prediction"]
+            db.add(
+                RootCauseHypothesisModel(
+                    job_id=job.id,
+                    service_name=job.service_name,
+                    root_cause=prediction.get("root_cause"),
+                    confidence=prediction.get("confidence", 0.0),
+                    reasoning=prediction.get("reasoning"),
+                    correlation_score=analysis["correlation_score"],
+                    model_version=get_ai_service().model_name,
+                )
+            )
+            db.add(
+                AIDecisionModel(
+                    job_id=job.id,
+                    decision_type="correlation_analysis",
+                    input_snapshot={
+                        "service_name": job.service_name,
+                        "hours": job.hours,
+                        "max_lag_minutes": job.max_lag_minutes,
+                        "window_end": job.window_end.isoformat(),
+                        "fingerprint": fingerprint,
+                    },
+                    decision_output=analysis,
+                )
+            )
+            # Compare-and-set, so an attempt that lost the job writes nothing
+            succeeded = RCAJobService._owned(db, job_id, attempts).update(
+                {"status": "succeeded", "error": None, "finished_at": datetime.utcnow()},
+                synchronize_session=False,
+            )
+            if not succeeded:
+                db.rollback()
+                logger.warning(f"RCA job {job_id} attempt {attempts} was reclaimed; discarding its results")
+                return
+            db.commit()
+        except Exception as e:
+            logger.error(f"Error persisting RCA job {job_id} results: {str(e)}")
+            RCAJobService._record_failure(db, job_id, attempts, e)
+
+    @staticmethod
+    def _record_failure(db: Session, job_id: int, attempts: int, error: Exception) -> None:
+        """Roll back the attempt, then requeue the job or mark it failed after its last attempt"""
+        db.rollback()
+        values: Dict[str, Any] = {"error": str(error)}
+        if attempts >= settings.RCA_JOB_MAX_ATTEMPTS:
+            values.update(status="failed", finished_at=datetime.utcnow())
+        else:
+            values["status"] = "queued"
+        RCAJobService._owned(db, job_id, attempts).update(values, synchronize_session=False)
+        db.commit()
+
+    @staticmethod
+    def get_job(db: Session, job_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a job's state, with the persisted analysis once it has succeeded.
+
+        Returns None if the job does not exist.
+        """
+        try:
+            job = db.get(RCAJobModel, job_id, populate_existing=True)
+            if job is None:
+                return None
+
+            result = None
+            if job.status == "succeeded":
+                decision = (
+                    db.query(AIDecisionModel.decision_output)
+                    .filter(AIDecisionModel.job_id == job.id)
+                    .order_by(AIDecisionModel.id.desc())
+                    .first()
+                )
+                if decision is not None:
+                    result = decision.decision_output
+
+            return {
+                "id": job.id,
+                "status": job.status,
+                "service_name": job.service_name,
+                "hours": job.hours,
+                "max_lag_minutes": job.max_lag_minutes,
+                "window_end": job.window_end,
+                "attempts": job.attempts,
+                "error": job.error,
+                "created_at": job.created_at,
+                "started_at": job.started_at,
+                "finished_at": job.finished_at,
+                "result": result,
+            }
+        except Exception as e:
+            logger.error(f"Error getting RCA job {job_id}: {str(e)}")
+            raise
+
+    @staticmethod
+    async def wait_for_job(
+        db: Session, job_id: int, timeout: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Long-poll a job until it finishes or timeout seconds pass.
+
+        Returns the job as from get_job, finished or not.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            job = await run_in_threadpool(RCAJobService.get_job, db, job_id)
+            remaining = deadline - time.monotonic()
+            if job is None or job["status"] in FINISHED_STATUSES or remaining <= 0:
+                return job
+            await run_in_threadpool(db.rollback)
+            await asyncio.sleep(min(_WAIT_POLL_SECONDS, remaining))
+
+
+class RCAWorkerPool:
+    """
+    Worker threads draining the rca_jobs queue.
+
+    Idle workers wait for a local submission or RCA_JOB_POLL_SECONDS, so
+    jobs queued by other processes are still picked up.
+    """
+
+    def __init__(self, workers: int, poll_interval: float):
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def notify(self) -> None:
+        self._wake.set()
+
+    def _work_once(self) -> bool:
+        db = SessionLocal()
+        try:
+            job_id = RCAJobService.claim_next(db)
+            if job_id is None:
+                return False
+            RCAJobService.run(db, job_id)
+            return True
+        finally:
+            db.close()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if self._work_once():
+                    continue
+            except Exception as e:
+                logger.error(f"RCA worker failed: {str(e)}")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def start(self) -> None:
+        self._stop.clear()
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"rca-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Started {self.workers} RCA workers")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+
+def _notify_workers() -> None:
+    if _pool is not None:
+        _pool.notify()
+
+
+def start_rca_workers() -> None:
+    """Start the worker threads executing queued RCA jobs"""
+    global _pool
+    if not settings.RCA_JOBS_ENABLED or _pool is not None:
+        return
+    _pool = RCAWorkerPool(settings.RCA_JOB_WORKERS, settings.RCA_JOB_POLL_SECONDS)
+    _pool.start()
+
+
+def stop_rca_workers() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.stop(timeout=5)
+        _pool = None
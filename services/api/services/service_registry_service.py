@@ -0,0 +1,173 @@
+"""
+Service registry tracking which services emit which telemetry signals
+"""
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from models.logs_model import LogModel
+from models.metrics_model import MetricsModel
+from models.traces_model import TracesModel
+from models.events_model import EventModel
+from models.telemetry_service_model import TelemetryServiceModel
+from core.config import get_logger
+
+logger = get_logger(__name__)
+
+SIGNAL_MODELS = {
+    "logs": LogModel,
+    "metrics": MetricsModel,
+    "traces": TracesModel,
+    "events": EventModel,
+}
+
+
+class ServiceRegistryService:
+    """Service for maintaining and reading the telemetry_services registry"""
+
+    @staticmethod
+    def _upsert(
+        db: Session,
+        signal: str,
+        seen: Dict[str, Tuple[datetime, datetime]],
+    ) -> None:
+        """
+        Upsert (first_seen, last_seen) per service and flag the signal as present.
+
+        Services are written in name order so concurrent writers lock rows
+        in the same order and cannot deadlock.
+        """
+        if not seen:
+            return
+
+        flag = f"has_{signal}"
+        dialect = db.bind.dialect.name
+        now = datetime.utcnow()
+
+        if dialect in ("postgresql", "sqlite"):
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+                least, greatest = func.least, func.greatest
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+                least, greatest = func.min, func.max
+
+            values = [
+                {
+                    "service_name": service_name,
+                    "first_seen": first_seen,
+                    "last_seen": last_seen,
+                    "has_logs": signal == "logs",
+                    "has_metrics": signal == "metrics",
+                    "has_traces": signal == "traces",
+                    "has_events": signal == "events",
+                    "updated_at": now,
+                }
+                for service_name, (first_seen, last_seen) in sorted(seen.items())
+            ]
+            statement = insert(TelemetryServiceModel).values(values)
+            table = TelemetryServiceModel.__table__
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.service_name],
+                set_={
+                    "first_seen": least(table.c.first_seen, statement.excluded.first_seen),
+                    "last_seen": greatest(table.c.last_seen, statement.excluded.last_seen),
+                    flag: True,
+                    "updated_at": now,
+                },
+            )
+            db.execute(statement)
+            return
+
+        existing = {
+            row.service_name: row
+            for row in db.query(TelemetryServiceModel)
+            .filter(TelemetryServiceModel.service_name.in_(list(seen.keys())))
+            .order_by(TelemetryServiceModel.service_name)
+            .with_for_update()
+            .all()
+        }
+        for service_name, (first_seen, last_seen) in seen.items():
+            row = existing.get(service_name)
+            if row is None:
+                row = TelemetryServiceModel(
+                    service_name=service_name,
+                    first_seen=first_seen,
+                    last_seen=last_seen,
+                    has_logs=False,
+                    has_metrics=False,
+                    has_traces=False,
+                    has_events=False,
+                )
+                db.add(row)
+            row.first_seen = min(row.first_seen, first_seen)
+            row.last_seen = max(row.last_seen, last_seen)
+            setattr(row, flag, True)
+
+    @staticmethod
+    def record(
+        db: Session,
+        signal: str,
+        observations: Iterable[Tuple[str, datetime]],
+    ) -> None:
+        """
+        Fold newly ingested (service_name, timestamp) pairs for one signal into the registry.
+
+        Changes are flushed but not committed so they land in the same
+        transaction as the raw telemetry inserts.
+        """
+        if signal not in SIGNAL_MODELS:
+            raise ValueError(f"Unknown telemetry signal: {signal}")
+
+        try:
+            seen: Dict[str, Tuple[datetime, datetime]] = {}
+            for service_name, timestamp in observations:
+                if not service_name:
+                    continue
+                first_seen, last_seen = seen.get(service_name, (timestamp, timestamp))
+                seen[service_name] = (min(first_seen, timestamp), max(last_seen, timestamp))
+
+            ServiceRegistryService._upsert(db, signal, seen)
+            db.flush()
+        except Exception as e:
+            logger.error(f"Error recording services into registry: {str(e)}")
+            raise
+
+    @staticmethod
+    def rebuild(db: Session) -> int:
+        """
+        Recompute the registry from raw telemetry with one grouped scan per signal.
+
+        Returns: number of services registered
+        """
+        try:
+            for signal, model in SIGNAL_MODELS.items():
+                rows = (
+                    db.query(model.service_name, func.min(model.timestamp), func.max(model.timestamp))
+                    .group_by(model.service_name)
+                    .all()
+                )
+                ServiceRegistryService._upsert(
+                    db,
+                    signal,
+                    {service_name: (first_seen, last_seen) for service_name, first_seen, last_seen in rows if service_name},
+                )
+            db.commit()
+
+            total = db.query(TelemetryServiceModel).count()
+            logger.info(f"Rebuilt service registry: {total} services")
+            return total
+        except Exception as e:
+            logger.error(f"Error rebuilding service registry: {str(e)}")
+            db.rollback()
+            raise
+
+    @staticmethod
+    def get_service_names(db: Session, signal: Optional[str] = None) -> List[str]:
+        """Get registered service names, optionally only those emitting a signal"""
+        query = db.query(TelemetryServiceModel.service_name)
+        if signal:
+            if signal not in SIGNAL_MODELS:
+                raise ValueError(f"Unknown telemetry signal: {signal}")
+            query = query.filter(getattr(TelemetryServiceModel, f"has_{signal}").is_(True))
+        return [row[0] for row in query.order_by(TelemetryServiceModel.service_name).all()]
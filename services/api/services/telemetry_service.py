@@ -2,22 +2,119 @@
 Telemetry service for querying raw telemetry data
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, desc
+from sqlalchemy import and_, func, desc, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from models.logs_model import LogModel
 from models.metrics_model import MetricsModel
 from models.traces_model import TracesModel
 from models.events_model import EventModel
-from core.config import get_logger
-import statistics
+from services.latency_rollup_service import LatencyRollupService
+from services.service_registry_service import ServiceRegistryService
+from core.config import settings, get_logger
+from core.cache import TTLCache
+from core.pagination import encode_cursor, decode_cursor
+from core.sketch import DDSketch
+from core.streaming_stats import RunningStats, RunningSlope
+import hashlib
+import json
 
 logger = get_logger(__name__)
 
+TOTAL_MODES = ("exact", "estimated", "none")
+
+# Exact list totals keyed by filter fingerprint
+_total_cache = TTLCache(
+    maxsize=settings.TELEMETRY_COUNT_CACHE_SIZE,
+    ttl=settings.TELEMETRY_COUNT_CACHE_TTL,
+)
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN wrapper so a query's planner estimate can be read with bound params"""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
 
 class TelemetryService:
     """Service for querying and aggregating telemetry data"""
 
+    @staticmethod
+    def _count(db: Session, query, total_mode: str) -> Optional[int]:
+        """
+        Resolve the total row count for a list query according to total_mode.
+        
+        - exact: COUNT(*) over the filters, cached by filter fingerprint
+        - estimated: the cached exact total if one exists, otherwise the
+          Postgres planner row estimate (falls back to exact elsewhere)
+        - none: skip counting entirely
+        """
+        if total_mode not in TOTAL_MODES:
+            raise ValueError(
+                f"Invalid total_mode: {total_mode} (expected one of {', '.join(TOTAL_MODES)})"
+            )
+        
+        if total_mode == "none":
+            return None
+        
+        compiled = query.statement.compile(dialect=db.bind.dialect)
+        fingerprint = hashlib.sha1(
+            (str(compiled) + repr(sorted(compiled.params.items()))).encode("utf-8")
+        ).hexdigest()
+        
+        total = _total_cache.get(fingerprint)
+        if total is not None:
+            return total
+        
+        if total_mode == "estimated" and db.bind.dialect.name == "postgresql":
+            plan = db.execute(_Explain(query.statement)).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+        
+        total = query.count()
+        _total_cache.set(fingerprint, total)
+        return total
+
+    @staticmethod
+    def _paginate(query, model, skip: int, limit: int, cursor: Optional[str]):
+        """
+        Order a telemetry query newest-first and fetch one page.
+        
+        With a cursor the page starts strictly after the (timestamp, id) it
+        encodes, so the database seeks through the service/timestamp index
+        instead of walking and discarding skip rows.
+        
+        Returns: (rows, next cursor or None on the last page)
+        """
+        query = query.order_by(desc(model.timestamp), desc(model.id))
+        
+        if cursor:
+            cursor_timestamp, cursor_id = decode_cursor(cursor)
+            query = query.filter(
+                tuple_(model.timestamp, model.id) < tuple_(cursor_timestamp, cursor_id)
+            )
+        else:
+            query = query.offset(skip)
+        
+        rows = query.limit(limit + 1).all()
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].timestamp, rows[-1].id)
+        
+        return rows, next_cursor
+
     @staticmethod
     def query_logs(
         db: Session,
@@ -27,11 +124,17 @@ class TelemetryService:
         level: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[List[LogModel], int]:
+        cursor: Optional[str] = None,
+        total_mode: str = "exact",
+    ) -> tuple[List[LogModel], Optional[int], Optional[str]]:
         """
         Query logs with filtering by service, time range, and level.
         
-        Returns: (logs list, total count)
+        Pass the returned next_cursor back as cursor to fetch the next page
+        by keyset instead of offset. total_mode controls how the total is
+        computed (exact, estimated or none); see _count.
+        
+        Returns: (logs list, total count, next cursor)
         """
         try:
             query = db.query(LogModel)
@@ -48,11 +151,13 @@ class TelemetryService:
             if level:
                 query = query.filter(LogModel.level == level.upper())
             
-            total = query.count()
+            total = TelemetryService._count(db, query, total_mode)
             
-            logs = query.order_by(desc(LogModel.timestamp)).offset(skip).limit(limit).all()
+            logs, next_cursor = TelemetryService._paginate(
+                query, LogModel, skip, limit, cursor
+            )
             
-            return logs, total
+            return logs, total, next_cursor
         except Exception as e:
             logger.error(f"Error querying logs: {str(e)}")
             raise
@@ -66,11 +171,13 @@ class TelemetryService:
         end_time: Optional[datetime] = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[List[MetricsModel], int]:
+        cursor: Optional[str] = None,
+        total_mode: str = "exact",
+    ) -> tuple[List[MetricsModel], Optional[int], Optional[str]]:
         """
         Query metrics with filtering by service, metric name, and time range.
         
-        Returns: (metrics list, total count)
+        Returns: (metrics list, total count, next cursor)
         """
         try:
             query = db.query(MetricsModel)
@@ -87,16 +194,13 @@ class TelemetryService:
             if end_time:
                 query = query.filter(MetricsModel.timestamp <= end_time)
             
-            total = query.count()
+            total = TelemetryService._count(db, query, total_mode)
             
-            metrics = (
-                query.order_by(desc(MetricsModel.timestamp))
-                .offset(skip)
-                .limit(limit)
-                .all()
+            metrics, next_cursor = TelemetryService._paginate(
+                query, MetricsModel, skip, limit, cursor
             )
             
-            return metrics, total
+            return metrics, total, next_cursor
         except Exception as e:
             logger.error(f"Error querying metrics: {str(e)}")
             raise
@@ -111,11 +215,13 @@ class TelemetryService:
         status: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[List[TracesModel], int]:
+        cursor: Optional[str] = None,
+        total_mode: str = "exact",
+    ) -> tuple[List[TracesModel], Optional[int], Optional[str]]:
         """
         Query distributed traces with filtering.
         
-        Returns: (traces list, total count)
+        Returns: (traces list, total count, next cursor)
         """
         try:
             query = db.query(TracesModel)
@@ -135,16 +241,13 @@ class TelemetryService:
             if status:
                 query = query.filter(TracesModel.status == status)
             
-            total = query.count()
+            total = TelemetryService._count(db, query, total_mode)
             
-            traces = (
-                query.order_by(desc(TracesModel.timestamp))
-                .offset(skip)
-                .limit(limit)
-                .all()
+            traces, next_cursor = TelemetryService._paginate(
+                query, TracesModel, skip, limit, cursor
             )
             
-            return traces, total
+            return traces, total, next_cursor
         except Exception as e:
             logger.error(f"Error querying traces: {str(e)}")
             raise
@@ -159,11 +262,13 @@ class TelemetryService:
         severity: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[List[EventModel], int]:
+        cursor: Optional[str] = None,
+        total_mode: str = "exact",
+    ) -> tuple[List[EventModel], Optional[int], Optional[str]]:
         """
         Query events with filtering by service, type, severity, and time range.
         
-        Returns: (events list, total count)
+        Returns: (events list, total count, next cursor)
         """
         try:
             query = db.query(EventModel)
@@ -183,20 +288,34 @@ class TelemetryService:
             if severity:
                 query = query.filter(EventModel.severity == severity)
             
-            total = query.count()
+            total = TelemetryService._count(db, query, total_mode)
             
-            events = (
-                query.order_by(desc(EventModel.timestamp))
-                .offset(skip)
-                .limit(limit)
-                .all()
+            events, next_cursor = TelemetryService._paginate(
+                query, EventModel, skip, limit, cursor
             )
             
-            return events, total
+            return events, total, next_cursor
         except Exception as e:
             logger.error(f"Error querying events: {str(e)}")
             raise
 
+    @staticmethod
+    def _build_log_statistics(level_counts: Dict[str, int]) -> Dict[str, Any]:
+        """Shape per-level log counts into the log statistics payload."""
+        total_logs = sum(level_counts.values())
+        error_count = level_counts.get("ERROR", 0)
+        error_rate = (error_count / total_logs * 100) if total_logs > 0 else 0
+        
+        return {
+            "total_logs": total_logs,
+            "error_count": error_count,
+            "warning_count": level_counts.get("WARN", 0),
+            "info_count": level_counts.get("INFO", 0),
+            "debug_count": level_counts.get("DEBUG", 0),
+            "error_rate": round(error_rate, 2),
+            "by_level": dict(level_counts),
+        }
+
     @staticmethod
     def get_log_statistics(
         db: Session,
@@ -206,9 +325,11 @@ class TelemetryService:
     ) -> Dict[str, Any]:
         """
         Calculate log statistics (error counts, warning counts, etc).
+        
+        Counts every level present in a single GROUP BY pass.
         """
         try:
-            query = db.query(LogModel)
+            query = db.query(LogModel.level, func.count(LogModel.id))
             
             if service_name:
                 query = query.filter(LogModel.service_name == service_name)
@@ -219,32 +340,93 @@ class TelemetryService:
             if end_time:
                 query = query.filter(LogModel.timestamp <= end_time)
             
-            total_logs = query.count()
-            
-            # Count by level
-            level_counts = {}
-            for level in ["ERROR", "WARN", "INFO", "DEBUG"]:
-                count = query.filter(LogModel.level == level).count()
-                level_counts[level.lower()] = count
+            level_counts = dict(query.group_by(LogModel.level).all())
             
-            error_rate = (
-                (level_counts.get("error", 0) / total_logs * 100)
-                if total_logs > 0
-                else 0
+            return TelemetryService._build_log_statistics(level_counts)
+        except Exception as e:
+            logger.error(f"Error calculating log statistics: {str(e)}")
+            raise
+
+    @staticmethod
+    def get_log_statistics_by_service(
+        db: Session,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Calculate log statistics for every service in one GROUP BY pass.
+        
+        Returns: {service_name: log statistics}
+        """
+        try:
+            query = db.query(
+                LogModel.service_name, LogModel.level, func.count(LogModel.id)
             )
             
+            if start_time:
+                query = query.filter(LogModel.timestamp >= start_time)
+            
+            if end_time:
+                query = query.filter(LogModel.timestamp <= end_time)
+            
+            counts_by_service: Dict[str, Dict[str, int]] = {}
+            for service, level, count in query.group_by(
+                LogModel.service_name, LogModel.level
+            ).all():
+                counts_by_service.setdefault(service, {})[level] = count
+            
             return {
-                "total_logs": total_logs,
-                "error_count": level_counts.get("error", 0),
-                "warning_count": level_counts.get("warn", 0),
-                "info_count": level_counts.get("info", 0),
-                "debug_count": level_counts.get("debug", 0),
-                "error_rate": round(error_rate, 2),
+                service: TelemetryService._build_log_statistics(level_counts)
+                for service, level_counts in counts_by_service.items()
             }
         except Exception as e:
-            logger.error(f"Error calculating log statistics: {str(e)}")
+            logger.error(f"Error calculating log statistics by service: {str(e)}")
             raise
 
+    @staticmethod
+    def _build_latency_statistics(
+        count: int,
+        avg: Optional[float],
+        p50: Optional[float],
+        p95: Optional[float],
+        p99: Optional[float],
+        max_value: Optional[float],
+        min_value: Optional[float],
+    ) -> Dict[str, Any]:
+        """Shape latency aggregates into the latency statistics payload."""
+        if not count:
+            return {
+                "count": 0,
+                "avg_latency": 0,
+                "p50_latency": 0,
+                "p95_latency": 0,
+                "p99_latency": 0,
+                "max_latency": 0,
+                "min_latency": 0,
+            }
+        
+        return {
+            "count": count,
+            "avg_latency": round(float(avg), 2),
+            "p50_latency": round(float(p50), 2),
+            "p95_latency": round(float(p95), 2),
+            "p99_latency": round(float(p99), 2),
+            "max_latency": round(float(max_value), 2),
+            "min_latency": round(float(min_value), 2),
+        }
+
+    @staticmethod
+    def _build_latency_statistics_from_sketch(sketch: DDSketch) -> Dict[str, Any]:
+        return TelemetryService._build_latency_statistics(
+            sketch.count,
+            sketch.avg,
+            sketch.quantile(0.5),
+            sketch.quantile(0.95),
+            sketch.quantile(0.99),
+            sketch.max,
+            sketch.min,
+        )
+
     @staticmethod
     def get_latency_statistics(
         db: Session,
@@ -255,48 +437,99 @@ class TelemetryService:
     ) -> Dict[str, Any]:
         """
         Calculate latency statistics from traces (p50, p95, p99, avg, max).
+        
+        With LATENCY_ROLLUP_ENABLED the window is answered by merging the
+        per-minute latency_sketches rollup. Otherwise, on Postgres every
+        statistic comes from one query using ordered-set aggregates, and
+        other backends stream durations through a DDSketch in fixed-size
+        chunks, so memory stays bounded however many spans match.
         """
         try:
-            query = db.query(TracesModel.duration)
+            if settings.LATENCY_ROLLUP_ENABLED:
+                sketch = LatencyRollupService.get_window_sketch(
+                    db,
+                    service_name=service_name,
+                    operation=operation,
+                    start_time=start_time,
+                    end_time=end_time,
+                )
+                return TelemetryService._build_latency_statistics_from_sketch(sketch)
+            
+            filters = []
             
             if service_name:
-                query = query.filter(TracesModel.service_name == service_name)
+                filters.append(TracesModel.service_name == service_name)
             
             if operation:
-                query = query.filter(TracesModel.operation == operation)
+                filters.append(TracesModel.operation == operation)
             
             if start_time:
-                query = query.filter(TracesModel.timestamp >= start_time)
+                filters.append(TracesModel.timestamp >= start_time)
             
             if end_time:
-                query = query.filter(TracesModel.timestamp <= end_time)
+                filters.append(TracesModel.timestamp <= end_time)
+            
+            if db.bind.dialect.name == "postgresql":
+                duration = TracesModel.duration
+                row = (
+                    db.query(
+                        func.count(duration),
+                        func.avg(duration),
+                        func.percentile_cont(0.5).within_group(duration),
+                        func.percentile_cont(0.95).within_group(duration),
+                        func.percentile_cont(0.99).within_group(duration),
+                        func.max(duration),
+                        func.min(duration),
+                    )
+                    .filter(*filters)
+                    .one()
+                )
+                return TelemetryService._build_latency_statistics(*row)
+            
+            sketch = DDSketch(relative_accuracy=settings.SKETCH_RELATIVE_ACCURACY)
+            durations = (
+                db.query(TracesModel.duration)
+                .filter(*filters)
+                .yield_per(settings.TELEMETRY_STREAM_CHUNK_SIZE)
+            )
+            for (duration,) in durations:
+                sketch.add(duration)
             
-            durations = [row[0] for row in query.all()]
+            return TelemetryService._build_latency_statistics_from_sketch(sketch)
+        except Exception as e:
+            logger.error(f"Error calculating latency statistics: {str(e)}")
+            raise
+
+    @staticmethod
+    def get_latency_summary_by_service(
+        db: Session,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get span count and average latency for every service in one GROUP BY pass.
+        
+        Returns: {service_name: {"count": int, "avg_latency": float}}
+        """
+        try:
+            query = db.query(
+                TracesModel.service_name,
+                func.count(TracesModel.id),
+                func.avg(TracesModel.duration),
+            )
             
-            if not durations:
-                return {
-                    "count": 0,
-                    "avg_latency": 0,
-                    "p50_latency": 0,
-                    "p95_latency": 0,
-                    "p99_latency": 0,
-                    "max_latency": 0,
-                    "min_latency": 0,
-                }
+            if start_time:
+                query = query.filter(TracesModel.timestamp >= start_time)
             
-            durations.sort()
+            if end_time:
+                query = query.filter(TracesModel.timestamp <= end_time)
             
             return {
-                "count": len(durations),
-                "avg_latency": round(statistics.mean(durations), 2),
-                "p50_latency": round(statistics.quantiles(durations, n=100)[49], 2),
-                "p95_latency": round(statistics.quantiles(durations, n=100)[94], 2),
-                "p99_latency": round(statistics.quantiles(durations, n=100)[98], 2),
-                "max_latency": round(max(durations), 2),
-                "min_latency": round(min(durations), 2),
+                service: {"count": count, "avg_latency": round(float(avg or 0), 2)}
+                for service, count, avg in query.group_by(TracesModel.service_name).all()
             }
         except Exception as e:
-            logger.error(f"Error calculating latency statistics: {str(e)}")
+            logger.error(f"Error calculating latency summary by service: {str(e)}")
             raise
 
     @staticmethod
@@ -306,27 +539,87 @@ class TelemetryService:
         service_name: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
+        percentiles: bool = False,
+        rate_of_change: bool = False,
     ) -> Dict[str, Any]:
         """
         Calculate statistics for a specific metric.
+        
+        On Postgres everything is computed by SQL aggregates in one query:
+        p50/p95/p99 via percentile_cont when percentiles is set, and the
+        least-squares slope in units per second (regr_slope) when
+        rate_of_change is set. Other backends stream values in fixed-size
+        chunks through Welford accumulators and a DDSketch instead.
         """
         try:
-            query = db.query(MetricsModel.value).filter(
-                MetricsModel.metric_name == metric_name
-            )
+            filters = [MetricsModel.metric_name == metric_name]
             
             if service_name:
-                query = query.filter(MetricsModel.service_name == service_name)
+                filters.append(MetricsModel.service_name == service_name)
             
             if start_time:
-                query = query.filter(MetricsModel.timestamp >= start_time)
+                filters.append(MetricsModel.timestamp >= start_time)
             
             if end_time:
-                query = query.filter(MetricsModel.timestamp <= end_time)
-            
-            values = [row[0] for row in query.all()]
-            
-            if not values:
+                filters.append(MetricsModel.timestamp <= end_time)
+            
+            if db.bind.dialect.name == "postgresql":
+                value = MetricsModel.value
+                columns = [
+                    func.count(value),
+                    func.avg(value),
+                    func.max(value),
+                    func.min(value),
+                    func.stddev_samp(value),
+                ]
+                if percentiles:
+                    columns += [
+                        func.percentile_cont(0.5).within_group(value),
+                        func.percentile_cont(0.95).within_group(value),
+                        func.percentile_cont(0.99).within_group(value),
+                    ]
+                if rate_of_change:
+                    columns.append(
+                        func.regr_slope(value, func.extract("epoch", MetricsModel.timestamp))
+                    )
+                
+                row = list(db.query(*columns).filter(*filters).one())
+                count, avg, max_value, min_value, stddev = row[:5]
+                extra = row[5:]
+                p50 = p95 = p99 = slope = None
+                if percentiles:
+                    p50, p95, p99 = extra[:3]
+                    extra = extra[3:]
+                if rate_of_change:
+                    slope = extra[0]
+            else:
+                stats = RunningStats()
+                sketch = DDSketch(relative_accuracy=settings.SKETCH_RELATIVE_ACCURACY) if percentiles else None
+                trend = RunningSlope() if rate_of_change else None
+                origin = None
+                
+                rows = (
+                    db.query(MetricsModel.value, MetricsModel.timestamp)
+                    .filter(*filters)
+                    .yield_per(settings.TELEMETRY_STREAM_CHUNK_SIZE)
+                )
+                for value, timestamp in rows:
+                    stats.add(value)
+                    if sketch is not None:
+                        sketch.add(value)
+                    if trend is not None:
+                        origin = origin or timestamp
+                        trend.add((timestamp - origin).total_seconds(), value)
+                
+                count, avg, max_value, min_value, stddev = (
+                    stats.count, stats.mean, stats.max, stats.min, stats.stddev
+                )
+                p50 = sketch.quantile(0.5) if sketch else None
+                p95 = sketch.quantile(0.95) if sketch else None
+                p99 = sketch.quantile(0.99) if sketch else None
+                slope = trend.slope if trend else None
+            
+            if not count:
                 return {
                     "count": 0,
                     "avg": 0,
@@ -335,17 +628,52 @@ class TelemetryService:
                     "stddev": 0,
                 }
             
-            return {
-                "count": len(values),
-                "avg": round(statistics.mean(values), 2),
-                "max": round(max(values), 2),
-                "min": round(min(values), 2),
-                "stddev": round(statistics.stdev(values), 2) if len(values) > 1 else 0,
+            result = {
+                "count": count,
+                "avg": round(float(avg), 2),
+                "max": round(float(max_value), 2),
+                "min": round(float(min_value), 2),
+                "stddev": round(float(stddev), 2) if stddev is not None else 0,
             }
+            if percentiles:
+                result.update(
+                    p50=round(float(p50), 2),
+                    p95=round(float(p95), 2),
+                    p99=round(float(p99), 2),
+                )
+            if rate_of_change:
+                result["rate_of_change"] = (
+                    round(float(slope), 6) if slope is not None else 0
+                )
+            
+            return result
         except Exception as e:
             logger.error(f"Error calculating metric statistics: {str(e)}")
             raise
 
+    @staticmethod
+    def _build_event_statistics(
+        type_severity_counts: List[tuple[str, str, int]]
+    ) -> Dict[str, Any]:
+        """Shape (type, severity, count) rows into the event statistics payload."""
+        type_counts = {
+            event_type: 0
+            for event_type in ["config_change", "deployment", "scaling", "restart"]
+        }
+        severity_counts = {severity: 0 for severity in ["critical", "warning", "info"]}
+        total_events = 0
+        
+        for event_type, severity, count in type_severity_counts:
+            type_counts[event_type] = type_counts.get(event_type, 0) + count
+            severity_counts[severity] = severity_counts.get(severity, 0) + count
+            total_events += count
+        
+        return {
+            "total_events": total_events,
+            "by_type": type_counts,
+            "by_severity": severity_counts,
+        }
+
     @staticmethod
     def get_event_statistics(
         db: Session,
@@ -355,9 +683,14 @@ class TelemetryService:
     ) -> Dict[str, Any]:
         """
         Calculate event statistics (counts by type and severity).
+        
+        Counts every type/severity present in a single GROUP BY pass; the
+        standard types and severities are always reported, even at zero.
         """
         try:
-            query = db.query(EventModel)
+            query = db.query(
+                EventModel.type, EventModel.severity, func.count(EventModel.id)
+            )
             
             if service_name:
                 query = query.filter(EventModel.service_name == service_name)
@@ -368,50 +701,64 @@ class TelemetryService:
             if end_time:
                 query = query.filter(EventModel.timestamp <= end_time)
             
-            total_events = query.count()
+            rows = query.group_by(EventModel.type, EventModel.severity).all()
             
-            # Count by type
-            type_counts = {}
-            for event_type in ["config_change", "deployment", "scaling", "restart"]:
-                count = query.filter(EventModel.type == event_type).count()
-                type_counts[event_type] = count
+            return TelemetryService._build_event_statistics(rows)
+        except Exception as e:
+            logger.error(f"Error calculating event statistics: {str(e)}")
+            raise
+
+    @staticmethod
+    def get_event_statistics_by_service(
+        db: Session,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Calculate event statistics for every service in one GROUP BY pass.
+        
+        Returns: {service_name: event statistics}
+        """
+        try:
+            query = db.query(
+                EventModel.service_name,
+                EventModel.type,
+                EventModel.severity,
+                func.count(EventModel.id),
+            )
+            
+            if start_time:
+                query = query.filter(EventModel.timestamp >= start_time)
+            
+            if end_time:
+                query = query.filter(EventModel.timestamp <= end_time)
             
-            # Count by severity
-            severity_counts = {}
-            for severity in ["critical", "warning", "info"]:
-                count = query.filter(EventModel.severity == severity).count()
-                severity_counts[severity] = count
+            rows_by_service: Dict[str, List[tuple[str, str, int]]] = {}
+            for service, event_type, severity, count in query.group_by(
+                EventModel.service_name, EventModel.type, EventModel.severity
+            ).all():
+                rows_by_service.setdefault(service, []).append(
+                    (event_type, severity, count)
+                )
             
             return {
-                "total_events": total_events,
-                "by_type": type_counts,
-                "by_severity": severity_counts,
+                service: TelemetryService._build_event_statistics(rows)
+                for service, rows in rows_by_service.items()
             }
         except Exception as e:
-            logger.error(f"Error calculating event statistics: {str(e)}")
+            logger.error(f"Error calculating event statistics by service: {str(e)}")
             raise
 
     @staticmethod
     def get_service_list(db: Session) -> List[str]:
         """
         Get list of all unique service names in telemetry.
+        
+        Reads the telemetry_services registry maintained at ingest instead
+        of scanning every telemetry table for distinct names.
         """
         try:
-            services = set()
-            
-            log_services = db.query(LogModel.service_name.distinct()).all()
-            services.update([s[0] for s in log_services if s[0]])
-            
-            metric_services = db.query(MetricsModel.service_name.distinct()).all()
-            services.update([s[0] for s in metric_services if s[0]])
-            
-            trace_services = db.query(TracesModel.service_name.distinct()).all()
-            services.update([s[0] for s in trace_services if s[0]])
-            
-            event_services = db.query(EventModel.service_name.distinct()).all()
-            services.update([s[0] for s in event_services if s[0]])
-            
-            return sorted(list(services))
+            return ServiceRegistryService.get_service_names(db)
         except Exception as e:
             logger.error(f"Error getting service list: {str(e)}")
             raise